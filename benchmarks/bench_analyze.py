@@ -0,0 +1,136 @@
+"""
+Benchmarks for the analyze hot path.
+
+Each class is one benchmark in the style of asv: `params` maps parameter
+names to the values swept (as a grid), `setup` prepares state outside
+the timed region and `run` is the timed call. QUICK_PARAMS replaces the
+grid for --quick runs.
+"""
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.engines import ChatbotEngine, SearchEngine
+from quantum_truth.evidence import EvidenceStats
+
+KNOWN_CLAIM = "The Earth is flat"
+UNKNOWN_CLAIM = "Coffee improves long-term memory"
+
+
+class SearchClaim:
+    params = {"pages": [100, 10_000, 100_000], "claim": [KNOWN_CLAIM, UNKNOWN_CLAIM]}
+    quick_params = {"pages": [100, 10_000], "claim": [KNOWN_CLAIM, UNKNOWN_CLAIM]}
+
+    def setup(self, pages, claim):
+        self.engine = SearchEngine(pages)
+
+    def run(self, pages, claim):
+        self.engine.search_claim(claim)
+
+
+class AnalyzeEvidence:
+    params = {"pages": [100, 10_000, 100_000]}
+    quick_params = {"pages": [100, 10_000]}
+
+    def setup(self, pages):
+        self.engine = SearchEngine(pages)
+        self.evidence = self.engine.search_claim(KNOWN_CLAIM)
+
+    def run(self, pages):
+        self.engine.analyze_evidence(self.evidence)
+
+
+class CalculateCertainty:
+    params = {"pages": [100, 10_000, 100_000]}
+    quick_params = {"pages": [100, 10_000]}
+
+    def setup(self, pages):
+        self.engine = ChatbotEngine()
+        self.evidence = SearchEngine(pages).search_claim(KNOWN_CLAIM)
+
+    def run(self, pages):
+        self.engine.calculate_certainty(self.evidence)
+
+
+class ConductDebate:
+    params = {"pages": [100, 10_000, 100_000]}
+    quick_params = {"pages": [100, 10_000]}
+
+    def setup(self, pages):
+        self.engine = ChatbotEngine()
+        self.evidence = SearchEngine(pages).search_claim(KNOWN_CLAIM)
+
+    def run(self, pages):
+        self.engine.conduct_debate(KNOWN_CLAIM, self.evidence, 1, verbose=False)
+
+
+class DebateSeries:
+    params = {"pages": [100, 100_000], "cycles": [100, 10_000]}
+    quick_params = {"pages": [100], "cycles": [100, 10_000]}
+
+    def setup(self, pages, cycles):
+        self.engine = ChatbotEngine()
+        self.stats = EvidenceStats.of(SearchEngine(pages).search_claim(KNOWN_CLAIM))
+
+    def run(self, pages, cycles):
+        self.engine.debate_series(KNOWN_CLAIM, self.stats, cycles, verbose=False)
+
+
+class VisualizeDebate:
+    params = {}
+    repeat = 3
+
+    def setup(self):
+        import os
+        import tempfile
+        self.engine = ChatbotEngine()
+        evidence = SearchEngine(100).search_claim(KNOWN_CLAIM)
+        self.truth, self.rounds, _, self.framework = self.engine.conduct_debate(
+            KNOWN_CLAIM, evidence, 0, verbose=False)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+
+    def run(self):
+        self.engine.visualize_debate(KNOWN_CLAIM, self.rounds, self.truth, 0, self.framework)
+
+    def teardown(self):
+        import os
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+class Analyze:
+    params = {"pages": [100, 10_000, 100_000], "cycles": [100, 10_000], "render": ["none"]}
+    quick_params = {"pages": [100, 10_000], "cycles": [100, 10_000], "render": ["none"]}
+
+    def setup(self, pages, cycles, render):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.analyzer = TruthAnalyzer(pages=pages, cycles=cycles, seed=0, render=render)
+        self.analyzer.output_dir = self.tmp.name
+
+    def run(self, pages, cycles, render):
+        self.analyzer.analyze(KNOWN_CLAIM, verbose=False)
+
+    def teardown(self):
+        self.tmp.cleanup()
+
+
+class AnalyzeRendered:
+    params = {"render": ["inline", "deferred"]}
+    repeat = 3
+
+    def setup(self, render):
+        import os
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.analyzer = TruthAnalyzer(pages=100, cycles=100, seed=0, render=render)
+        self.analyzer.output_dir = self.tmp.name
+
+    def run(self, render):
+        self.analyzer.analyze(KNOWN_CLAIM, verbose=False)
+
+    def teardown(self):
+        import os
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
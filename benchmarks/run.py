@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner for Quantum Truth Analysis System
+
+    python benchmarks/run.py                      # full pages x cycles grid
+    python benchmarks/run.py --quick -k Analyze   # smaller grid, filtered
+    python benchmarks/run.py --save-baseline      # record benchmarks/baselines/baseline.json
+    python benchmarks/run.py --compare            # exit 1 on regressions over --threshold
+
+Every benchmark/parameter combination records the median and minimum wall
+time over --repeat runs and the peak traced memory of one extra run.
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+MODULES = ["bench_analyze"]
+DEFAULT_BASELINE = os.path.join(HERE, "baselines", "baseline.json")
+
+
+def discover(pattern=None):
+    for module_name in MODULES:
+        module = importlib.import_module(module_name)
+        for name, obj in vars(module).items():
+            if isinstance(obj, type) and obj.__module__ == module.__name__ and hasattr(obj, "run"):
+                if pattern is None or pattern.lower() in name.lower():
+                    yield name, obj
+
+
+def combinations(params):
+    names = list(params)
+    for values in itertools.product(*(params[n] for n in names)):
+        yield dict(zip(names, values))
+
+
+def case_id(name, params):
+    if not params:
+        return name
+    return f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+
+def measure(bench_cls, params, repeat):
+    bench = bench_cls()
+    silent = io.StringIO()
+    with contextlib.redirect_stdout(silent):
+        if hasattr(bench, "setup"):
+            bench.setup(**params)
+        try:
+            timings = []
+            for _ in range(getattr(bench, "repeat", repeat)):
+                start = time.perf_counter()
+                bench.run(**params)
+                timings.append(time.perf_counter() - start)
+            tracemalloc.start()
+            bench.run(**params)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        finally:
+            if hasattr(bench, "teardown"):
+                bench.teardown()
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "repeat": len(timings),
+        "peak_memory": peak
+    }
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        ratio = current["median"] / reference["median"] if reference["median"] else 1.0
+        if ratio > 1 + threshold:
+            regressions.append((key, reference["median"], current["median"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Quantum Truth benchmarks")
+    parser.add_argument("-k", "--filter", default=None, help="Only run benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="Use each benchmark's smaller quick grid")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--output", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative slowdown of the median that counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, bench_cls in discover(args.filter):
+        params = getattr(bench_cls, "quick_params", None) if args.quick else None
+        params = params if params is not None else bench_cls.params
+        for combo in combinations(params):
+            key = case_id(name, combo)
+            results[key] = measure(bench_cls, combo, args.repeat)
+            r = results[key]
+            print(f"{key:<60} median {r['median'] * 1e3:10.3f} ms  "
+                  f"min {r['min'] * 1e3:10.3f} ms  peak {r['peak_memory'] / 1e6:8.2f} MB", flush=True)
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)["results"]
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(dict(report, results=baseline), f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"REGRESSION {key}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
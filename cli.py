@@ -5,44 +5,422 @@ Copyright (c) 2023 Craig Huckerby. All Rights Reserved.
 """
 
 import argparse
+import json
+import os
 import sys
-from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.frameworks import CORE_AXIOMS
+from quantum_truth.rendering import DEBATE_FORMATS, RENDER_MODES, SPEC_FILE, render_file
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Quantum Truth Analysis System CLI",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    parser.add_argument("claim", type=str, help="Claim to analyze")
+FRAMEWORKS = list(CORE_AXIOMS)
+
+def add_analysis_arguments(parser):
     parser.add_argument("-p", "--pages", type=int, default=100,
                         help="Number of evidence pages to generate")
     parser.add_argument("-c", "--cycles", type=int, default=100,
                         help="Number of debate cycles")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="Stop debating once the 95%% interval of the mean truth is narrower than this; "
+                             "--cycles becomes the maximum")
+    parser.add_argument("--min-cycles", type=int, default=10,
+                        help="Cycles always run before --tolerance can stop the debate")
     parser.add_argument("-f", "--framework", type=str, default="Scientific_Empirical",
-                        choices=["Scientific_Empirical", "Historical_Consensus", "Ethical_Framework"],
+                        choices=FRAMEWORKS,
                         help="Analysis framework to use")
     parser.add_argument("-o", "--output", type=str, default="results",
                         help="Output directory for results")
+    parser.add_argument("--render", type=str, default="inline", choices=RENDER_MODES,
+                        help="Image rendering: inline, background worker, deferred to "
+                             "'quantum-truth render', or none")
+    parser.add_argument("--no-render", dest="render", action="store_const", const="none",
+                        help="Skip image rendering entirely (same as --render none)")
+    parser.add_argument("--debate-format", type=str, default="gif", choices=DEBATE_FORMATS,
+                        help="Debate images: one animation per claim (gif, webp) or a PNG per key cycle")
+    parser.add_argument("--chunk-size", type=int, default=65536,
+                        help="Stream evidence in chunks of this many pages when --pages is larger")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse cached verdicts stored under the output directory")
+    parser.add_argument("-k", "--knowledge", type=str, default=None,
+                        help="Knowledge base to search (SQLite index or .jsonl corpus)")
+    parser.add_argument("-g", "--graph", type=str, default=None,
+                        help="Truth graph file that every analysis is appended to")
+    parser.add_argument("--dedup", type=float, nargs="?", const=0.8, default=None, metavar="THRESHOLD",
+                        help="Collapse duplicate and near-duplicate evidence (summary similarity "
+                             ">= THRESHOLD, default 0.8) into weighted rows before scoring")
+    parser.add_argument("--weights", type=str, default=None,
+                        help="Scoring weights file written by 'quantum-truth calibrate'")
+    parser.add_argument("--corpus", type=str, default=None,
+                        help="Evidence corpus built by 'quantum-truth ingest'; claims found there "
+                             "use up to --pages of its evidence")
+
+def read_claims(path):
+    stream = sys.stdin if path == "-" else open(path)
+    try:
+        for line in stream:
+            claim = line.strip()
+            if claim and not claim.startswith("#"):
+                yield claim
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth batch",
+        description="Analyze many claims in parallel, one JSON result per line",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("claims_file", nargs="?", default="-",
+                        help="File with one claim per line ('-' reads stdin)")
+    add_analysis_arguments(parser)
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: all cores)")
+    parser.add_argument("-s", "--seed", type=int, default=None,
+                        help="Base RNG seed for reproducible runs")
+    parser.add_argument("--unordered", action="store_true",
+                        help="Emit results as they complete instead of in input order")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.analyzer import TruthAnalyzer
+    from quantum_truth.events import NULL_EVENTS, EventLog, TextSink
+    # Stdout carries only the JSON results; progress goes to stderr when it is a terminal
+    analyzer = TruthAnalyzer(pages=args.pages, cycles=args.cycles, seed=args.seed, render=args.render,
+                             cache=args.cache, knowledge_base=args.knowledge,
+                             chunk_size=args.chunk_size, graph=args.graph, tolerance=args.tolerance,
+                             min_cycles=args.min_cycles, events=NULL_EVENTS,
+                             dedup=args.dedup, weights=args.weights, corpus=args.corpus,
+                             debate_format=args.debate_format)
+    analyzer.output_dir = args.output
+    progress = EventLog(TextSink(sys.stderr))
+    try:
+        results = analyzer.analyze_many(read_claims(args.claims_file), framework=args.framework,
+                                        workers=args.workers, ordered=not args.unordered)
+        for done, result in enumerate(results, 1):
+            print(json.dumps(result), flush=True)
+            progress.progress("batch.progress", done)
+    except Exception as e:
+        print(f"❌ Error during batch analysis: {e}", file=sys.stderr)
+        sys.exit(1)
+
+def render_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth render",
+        description="Render images from specs recorded with --render deferred",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("spec_file", nargs="?", default=f"results/{SPEC_FILE}",
+                        help="Render spec file written by a deferred analysis")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Worker processes used for rendering")
+    args = parser.parse_args(argv)
+
+    try:
+        rendered, failed = render_file(args.spec_file, workers=args.workers)
+    except OSError as e:
+        print(f"❌ Error reading render specs: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ Rendered {rendered} images ({failed} failed)")
+    if failed:
+        sys.exit(1)
+
+def index_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth index",
+        description="Build an SQLite knowledge base index from a JSON lines corpus",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("corpus", help="JSON lines of {key, claim, aliases, evidence}")
+    parser.add_argument("index", help="SQLite index file to create or update")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.knowledge import KnowledgeBase
+    try:
+        kb = KnowledgeBase.from_jsonl(args.corpus, db_path=args.index)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error indexing corpus: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ Indexed {len(kb)} entries into {args.index}")
+    kb.close()
+
+def ingest_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth ingest",
+        description="Build a memory-mapped evidence corpus from JSON lines or CSV evidence files",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("files", nargs="+",
+                        help="Files of claim, source, summary, type, reliability, supports_claim records "
+                             "(.csv, anything else is read as JSON lines)")
+    parser.add_argument("-o", "--output", default="corpus", help="Corpus directory to write")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Parser processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=int, default=32,
+                        help="Megabytes of input parsed per task")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.ingest import ingest
+    try:
+        manifest = ingest(args.files, args.output, workers=args.workers, chunk_bytes=args.chunk_mb << 20)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error ingesting evidence: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ Ingested {manifest['rows']} evidence rows for {len(manifest['claims'])} claims into {args.output}")
+    if manifest["errors"]:
+        print(f"⚠️  Skipped {manifest['errors']} invalid records, e.g.:", file=sys.stderr)
+        for sample in manifest["error_samples"][:5]:
+            print(f"   {sample}", file=sys.stderr)
+
+def results_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth results",
+        description="Query or export stored analysis results",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("store", nargs="?", default="results/results.db",
+                        help="Result store written by analyses (<output>/results.db)")
+    parser.add_argument("--claim", default=None, help="Only results for this claim")
+    parser.add_argument("--verdict", default=None, help="Only results with this verdict")
+    parser.add_argument("-f", "--framework", default=None, choices=FRAMEWORKS, help="Only this framework")
+    parser.add_argument("--since", default=None, help="Only results at or after this ISO timestamp")
+    parser.add_argument("-n", "--limit", type=int, default=None, help="Maximum results, newest first")
+    parser.add_argument("--export", default=None, help="Write results to a .jsonl or .csv file instead")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.store import ResultStore
+    filters = {"claim": args.claim, "verdict": args.verdict, "framework": args.framework,
+               "since": args.since, "limit": args.limit}
+    store = ResultStore(args.store)
+    try:
+        if args.export:
+            count = store.export(args.export, **filters)
+            print(f"✅ Exported {count} results to {args.export}")
+        else:
+            for result in store.query(**filters):
+                print(json.dumps(result))
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        store.close()
+
+def calibrate_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth calibrate",
+        description="Fit scoring weights against labelled claims ({\"claim\", \"label\"} JSON lines)",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("labels", help="JSON lines of {\"claim\", \"label\": true|false, \"framework\"?}")
+    parser.add_argument("-o", "--output", default="weights.ini", help="Weights file to write")
+    parser.add_argument("-n", "--samples", type=int, default=5000, help="Candidate weight vectors to score")
+    parser.add_argument("-m", "--metric", default="brier", choices=("brier", "accuracy", "auc"),
+                        help="Metric the best candidate is chosen by")
+    parser.add_argument("-p", "--pages", type=int, default=100, help="Evidence pages per claim")
+    parser.add_argument("-f", "--framework", default="Scientific_Empirical", choices=FRAMEWORKS,
+                        help="Framework for claims that do not name one")
+    parser.add_argument("-k", "--knowledge", default=None, help="Knowledge base to search")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="RNG seed for evidence and candidates")
+    parser.add_argument("--weights", default=None, help="Weights to start from instead of the defaults")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.analyzer import TruthAnalyzer
+    from quantum_truth.calibration import Calibration, load_labels, write_weights
+    from quantum_truth.events import NULL_EVENTS
+    try:
+        labelled = load_labels(args.labels)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error reading labels: {e}", file=sys.stderr)
+        sys.exit(1)
+    analyzer = TruthAnalyzer(pages=args.pages, render="none", store=False, knowledge_base=args.knowledge,
+                             events=NULL_EVENTS, weights=args.weights)
+    calibration = Calibration.from_claims(analyzer, labelled, args.framework, args.seed)
+    best, scores, candidates = calibration.search(args.samples, args.metric, args.seed)
+    print(f"{'':>10} " + " ".join(f"{metric:>9}" for metric in scores))
+    for label, index in (("current", 0), ("best", best)):
+        print(f"{label:>10} " + " ".join(f"{values[index]:>9.4f}" for values in scores.values()))
+    write_weights(args.output, calibration.weight_config(candidates[best]),
+                  f"Calibrated on {len(calibration)} claims by {args.metric} from {args.samples} candidates")
+    print(f"✅ Wrote weights to {args.output}")
+
+def update_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth update",
+        description="Re-analyze a stored claim with new evidence, merged into its saved evidence statistics",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("claim", help="Claim analyzed before with a result store")
+    parser.add_argument("evidence", nargs="?", default="-",
+                        help="JSON lines of {source, summary, type, reliability, supports_claim} ('-' reads stdin)")
+    parser.add_argument("--store", default="results/results.db", help="Result store holding the claim")
+    parser.add_argument("-c", "--cycles", type=int, default=100, help="Number of debate cycles")
+    parser.add_argument("-f", "--framework", default="Scientific_Empirical", choices=FRAMEWORKS,
+                        help="Analysis framework to use")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="RNG seed for the debate")
+    parser.add_argument("--dedup", type=float, nargs="?", const=0.8, default=None, metavar="THRESHOLD",
+                        help="Collapse duplicate new evidence before merging")
+    parser.add_argument("--weights", default=None, help="Scoring weights file")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.analyzer import TruthAnalyzer
+    from quantum_truth.events import NULL_EVENTS
+    stream = sys.stdin if args.evidence == "-" else open(args.evidence)
+    try:
+        with stream:
+            evidence = [json.loads(line) for line in stream if line.strip()]
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading evidence: {e}", file=sys.stderr)
+        sys.exit(1)
+    analyzer = TruthAnalyzer(cycles=args.cycles, seed=args.seed, render="none", store=args.store,
+                             events=NULL_EVENTS, dedup=args.dedup, weights=args.weights)
+    analyzer.output_dir = os.path.dirname(args.store) or "."
+    try:
+        result = analyzer.update(args.claim, evidence, framework=args.framework, verbose=False)
+    except (LookupError, ValueError) as e:
+        print(f"❌ Error updating claim: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        analyzer.close()
+    print(json.dumps(result))
+
+GRAPH_QUERIES = ("related", "contradictions", "sources", "history")
+
+def graph_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth graph",
+        description="Query the truth graph built by analyses run with --graph",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("graph", help="Truth graph file")
+    parser.add_argument("query", choices=GRAPH_QUERIES, help="What to look up for the claim")
+    parser.add_argument("claim", help="Claim to look up")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="Maximum rows for related/contradictions")
+    args = parser.parse_args(argv)
+
+    from quantum_truth.graph import TruthGraph
+    graph = TruthGraph(args.graph)
+    try:
+        if args.query == "related":
+            rows = [{"claim": claim, "shared_sources": shared}
+                    for claim, shared in graph.related_claims(args.claim, args.limit)]
+        elif args.query == "contradictions":
+            rows = [{"claim": claim, "source": source}
+                    for claim, source in graph.contradictions(args.claim, args.limit)]
+        elif args.query == "sources":
+            rows = [{"source": source, "stance": stance} for source, stance in graph.sources(args.claim).items()]
+        else:
+            rows = graph.history(args.claim)
+    finally:
+        graph.close()
+    for row in rows:
+        print(json.dumps(row))
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="quantum-truth serve",
+        description="Serve analyses from warm worker processes over HTTP or a Unix socket",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    from quantum_truth.server import add_server_arguments, serve
+    add_server_arguments(parser)
+    add_analysis_arguments(parser)
+    parser.set_defaults(render="none", output="analysis_results")
+    serve(parser.parse_args(argv))
+
+COMMANDS = {
+    "batch": batch_main,
+    "render": render_main,
+    "index": index_main,
+    "ingest": ingest_main,
+    "serve": serve_main,
+    "graph": graph_main,
+    "results": results_main,
+    "calibrate": calibrate_main,
+    "update": update_main,
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+
+    parser = argparse.ArgumentParser(
+        description="Quantum Truth Analysis System CLI",
+        epilog=f"Subcommands: {', '.join(COMMANDS)} (run 'quantum-truth <command> -h')",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("claim", type=str, help="Claim to analyze")
+    add_analysis_arguments(parser)
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Enable verbose output")
+    parser.add_argument("--log-format", default="text", choices=("text", "jsonl", "none"),
+                        help="Analysis output: console text, JSON lines events, or nothing")
+    parser.add_argument("--progress", action="store_true", default=None,
+                        help="Report streaming progress (default: only on a terminal)")
+    parser.add_argument("--no-progress", dest="progress", action="store_false",
+                        help="Never report streaming progress")
+    parser.add_argument("--stats-workers", type=int, default=None,
+                        help="Processes that reduce the claim's --corpus evidence in parallel "
+                             "when it spans more than one chunk")
+    parser.add_argument("--metrics", type=str, default=None,
+                        help="Write stage metrics: .json for a Chrome trace, otherwise Prometheus text")
+    parser.add_argument("--profile", type=str, default=None,
+                        help="Run under cProfile and write pstats output to this file")
+    parser.add_argument("--server", type=str, default=None,
+                        help="Forward the claim to a running 'quantum-truth serve' (http:// or unix:// URL)")
     parser.add_argument("--version", action="version", version="Quantum Truth Analyzer 1.0.0")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    # Machine formats get nothing but their events on stdout
+    say = print if args.log_format == "text" else lambda *parts, **kwargs: None
+
+    say(f"🔍 Starting Quantum Truth Analysis for: '{args.claim}'")
+    say(f"   Pages: {args.pages}, Cycles: {args.cycles}, Framework: {args.framework}")
 
-    print(f"🔍 Starting Quantum Truth Analysis for: '{args.claim}'")
-    print(f"   Pages: {args.pages}, Cycles: {args.cycles}, Framework: {args.framework}")
+    if args.server:
+        from quantum_truth.server import analyze_remote
+        try:
+            result = analyze_remote(args.server, args.claim, args.framework)
+        except Exception as e:
+            print(f"❌ Error from analysis server: {e}", file=sys.stderr)
+            sys.exit(1)
+        say("\n✅ Analysis complete!")
+        say(f"   Verdict: {result['verdict']}")
+        say(f"   Final Truth Probability: {result['truth_percentage_avg']:.4%}")
+        return
 
-    analyzer = TruthAnalyzer(pages=args.pages, cycles=args.cycles)
+    # Imported here so --help, --version and --server skip numpy and the engines
+    from quantum_truth.analyzer import TruthAnalyzer
+    metrics = None
+    if args.metrics or args.profile:
+        from quantum_truth.metrics import Metrics
+        metrics = Metrics(profile=bool(args.profile))
+    from quantum_truth.events import event_log
+    events = event_log(args.log_format, progress=args.progress)
+    if args.log_format == "text" and args.verbose and sys.stdout.isatty():
+        # Give a reader time to follow the debate
+        events.sink.pause = 0.3
+
+    analyzer = TruthAnalyzer(pages=args.pages, cycles=args.cycles, render=args.render, cache=args.cache,
+                             knowledge_base=args.knowledge, chunk_size=args.chunk_size, metrics=metrics,
+                             graph=args.graph, tolerance=args.tolerance, min_cycles=args.min_cycles,
+                             events=events, dedup=args.dedup, weights=args.weights, corpus=args.corpus,
+                             stats_workers=args.stats_workers, debate_format=args.debate_format)
     analyzer.output_dir = args.output
     try:
         result = analyzer.analyze(args.claim, framework=args.framework, verbose=args.verbose)
+        analyzer.close()
     except Exception as e:
         print(f"❌ Error during analysis: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print("\n✅ Analysis complete!")
-    print(f"   Results saved to: {args.output}/")
-    print(f"   Final Truth Probability: {result:.4%}")
+    if args.metrics:
+        metrics.export(args.metrics)
+        say(f"   Metrics written to: {args.metrics}")
+    if args.profile:
+        metrics.export_profile(args.profile)
+        say(f"   Profile written to: {args.profile}")
+
+    say("\n✅ Analysis complete!")
+    say(f"   Results saved to: {args.output}/")
+    say(f"   Final Truth Probability: {result:.4%}")
 
 if __name__ == "__main__":
     main()
@@ -8,11 +8,19 @@ claims = [
     "Global warming is a hoax"
 ]
 
-analyzer = TruthAnalyzer(pages=30, cycles=30)
 
-for claim in claims:
-    print(f"\n{'='*60}")
-    print(f"ANALYZING: {claim}")
-    result = analyzer.analyze(claim, verbose=False)
-    print(f"RESULT: {result:.2%} truth probability")
-    print("="*60)
+def main():
+    analyzer = TruthAnalyzer(pages=30, cycles=30, seed=42)
+
+    # Claims are spread across a process pool; results come back in input order
+    for result in analyzer.analyze_many(claims, workers=4):
+        print(f"\n{'='*60}")
+        print(f"ANALYZED: {result['claim']}")
+        print(f"RESULT: {result['truth_percentage_avg']:.2%} truth probability ({result['verdict']})")
+        print("="*60)
+    analyzer.close()
+
+
+# Worker processes re-import this module under the spawn start method (macOS, Windows)
+if __name__ == "__main__":
+    main()
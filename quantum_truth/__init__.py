@@ -0,0 +1,37 @@
+"""
+Quantum Truth Analysis System
+
+Submodules load on first attribute access, so `import quantum_truth` stays
+cheap and the plotting stack is only imported when something is rendered.
+"""
+import importlib
+
+__version__ = "1.0.0"
+
+_EXPORTS = {
+    "TruthAnalyzer": "analyzer",
+    "ChatbotEngine": "engines",
+    "SearchEngine": "engines",
+    "AxiomaticFramework": "frameworks",
+    "DebateAgent": "agents",
+    "EvidenceBatch": "evidence",
+    "EvidenceStats": "evidence",
+    "KnowledgeBase": "knowledge",
+    "ResultCache": "cache",
+    "Metrics": "metrics",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'quantum_truth' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
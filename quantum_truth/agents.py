@@ -1,67 +1,156 @@
-class DebateAgent:
-    def __init__(self, role, expertise, bias_factor=0.0):
+from collections import deque
+from .events import NULL_EVENTS
+from .evidence import EvidenceStats
+from .frameworks import list_conflicts
+
+# Confidences kept per agent for the current claim
+CONFIDENCE_HISTORY_SIZE = 1000
+
+# Shared evidence features: each is computed at most once per debate and
+# handed to every agent that declared it
+FEATURES = {
+    "stats": lambda stats: stats,
+    "total": lambda stats: stats.total,
+    "verified": lambda stats: stats.verified,
+    "first_verified": lambda stats: stats.first_verified,
+    "reliable": lambda stats: stats.reliable,
+    "unreliable": lambda stats: stats.unreliable,
+    "contradictions": lambda stats: stats.contradictions,
+    "scientific": lambda stats: stats.count('scientific'),
+    "scientific_reliability": lambda stats: stats.type_reliability.get('scientific', 0.0),
+    "historical": lambda stats: stats.count('historical'),
+    "historical_support": lambda stats: stats.type_support.get('historical', 0),
+}
+
+AGENT_REGISTRY = {}
+DEFAULT_AGENTS = ("FactChecker", "Scientist", "Logician", "Historian", "AxiomRegulator")
+
+
+def register_feature(name, compute):
+    """Make compute(stats) available to agents that declare `name` in requires"""
+    FEATURES[name] = compute
+
+
+def evidence_features(evidence, names):
+    stats = EvidenceStats.of(evidence)
+    return {name: FEATURES[name](stats) for name in names}
+
+
+class AgentSpec:
+    __slots__ = ("role", "expertise", "argue", "weight", "bias_factor", "requires")
+
+    def __init__(self, role, expertise, argue, weight, bias_factor, requires):
         self.role = role
         self.expertise = expertise
+        self.argue = argue
+        self.weight = weight
         self.bias_factor = bias_factor
+        self.requires = tuple(requires)
+
+
+def register_agent(role, expertise, weight=0.0, bias_factor=0.0, requires=()):
+    """Decorator registering argue(claim, features, framework) -> (arguments, confidence) as an agent role.
+
+    requires names the FEATURES the agent reads; only declared features are
+    computed, so an agent with an expensive feature costs nothing to debates
+    that do not include it.
+    """
+    unknown = [name for name in requires if name not in FEATURES]
+    if unknown:
+        raise ValueError(f"Unknown evidence features for agent '{role}': {', '.join(unknown)}")
+
+    def decorator(argue):
+        AGENT_REGISTRY[role] = AgentSpec(role, expertise, argue, weight, bias_factor, requires)
+        return argue
+    return decorator
+
+
+class DebateAgent:
+    __slots__ = ("role", "expertise", "bias_factor", "weight", "requires", "arguments", "influence",
+                 "confidence", "confidence_history", "framework", "claim", "_argue")
+
+    def __init__(self, role, expertise=None, bias_factor=None, weight=None):
+        spec = AGENT_REGISTRY.get(role)
+        if spec is None:
+            raise ValueError(f"Unknown agent role '{role}'")
+        self.role = role
+        self.expertise = expertise or spec.expertise
+        self.bias_factor = spec.bias_factor if bias_factor is None else bias_factor
+        self.weight = spec.weight if weight is None else weight
+        self.requires = spec.requires
         self.arguments = []
         self.influence = 1.0
         self.confidence = 0.0
-        self.confidence_history = []
+        self.confidence_history = deque(maxlen=CONFIDENCE_HISTORY_SIZE)
         self.framework = None
+        self.claim = None
+        self._argue = spec.argue
 
-    def formulate_argument(self, claim, evidence, framework):
+    def formulate_argument(self, claim, evidence, framework, features=None, events=NULL_EVENTS):
+        """Argue about claim; features, when given, must hold every name in self.requires.
+
+        A failing argument is reported to events as agent.error and yields
+        low confidence.
+        """
         self.framework = framework
+        if claim != self.claim:
+            # Agents live across debates; history covers the current claim only
+            self.claim = claim
+            self.confidence_history.clear()
         try:
-            if self.role == "FactChecker":
-                verified = [ev for ev in evidence if ev['reliability'] > 0.7]
-                self.arguments = [f"Verified {len(verified)} sources" + 
-                                 (f": {verified[0]['source']} states '{verified[0]['summary'][:30]}...'" 
-                                  if verified else "")]
-                self.confidence = min(1.0, len(verified) * 0.3)
-                
-            elif self.role == "Scientist":
-                scientific_evidence = [ev for ev in evidence if ev['type'] == 'scientific']
-                if scientific_evidence:
-                    consensus = sum(ev['reliability'] for ev in scientific_evidence)/len(scientific_evidence)
-                    self.arguments = [f"Scientific consensus ({len(scientific_evidence)} studies, {consensus:.0%} reliability)"]
-                    self.confidence = consensus
-                else:
-                    self.arguments = ["No scientific evidence"]
-                    self.confidence = 0.1
-                    
-            elif self.role == "Logician":
-                if evidence:
-                    first_support = evidence[0]['supports_claim']
-                    contradictions = sum(1 for ev in evidence if ev['supports_claim'] != first_support)
-                    consistency = 1.0 - (contradictions / max(1, len(evidence)))
-                    self.arguments = [f"Logical consistency: {consistency:.0%}"]
-                    self.confidence = consistency
-                else:
-                    self.arguments = ["Insufficient data"]
-                    self.confidence = 0.1
-                    
-            elif self.role == "Historian":
-                historical_evidence = [ev for ev in evidence if ev['type'] == 'historical']
-                if historical_evidence:
-                    support = sum(1 for ev in historical_evidence if ev['supports_claim']) / len(historical_evidence)
-                    self.arguments = [f"Historical precedent: {len(historical_evidence)} cases, {support:.0%} similar"]
-                    self.confidence = support
-                else:
-                    self.arguments = ["No historical precedent"]
-                    self.confidence = 0.1
-                    
-            elif self.role == "AxiomRegulator":
-                truth_percent, conflicts = framework.evaluate_statement(claim)
-                self.arguments = [f"Axiomatic Truth: {truth_percent:.2f}% in '{framework.name}' framework"]
-                self.confidence = truth_percent / 100
-                if conflicts:
-                    self.arguments.append(f"Conflicts: {', '.join(conflicts)}")
-            
-            self.confidence = max(0.01, min(1.0, self.confidence + self.bias_factor))
+            if features is None:
+                features = evidence_features(evidence, self.requires)
+            self.arguments, confidence = self._argue(claim, features, framework)
+            self.confidence = max(0.01, min(1.0, confidence + self.bias_factor))
             self.confidence_history.append(self.confidence)
             return self.arguments
         except Exception as e:
-            print(f"Error in {self.role} agent: {str(e)}")
+            events.emit("agent.error", agent=self.role, claim=claim, error=str(e))
             self.arguments = ["Analysis error"]
             self.confidence = 0.1
             return self.arguments
+
+
+@register_agent("FactChecker", "Evidence Verification", weight=0.30, requires=("verified", "first_verified"))
+def fact_checker(claim, features, framework):
+    verified = features["first_verified"]
+    arguments = [f"Verified {features['verified']} sources" +
+                 (f": {verified['source']} states '{verified['summary'][:30]}...'"
+                  if verified else "")]
+    return arguments, min(1.0, features["verified"] * 0.3)
+
+
+@register_agent("Scientist", "Scientific Consensus", weight=0.25, bias_factor=-0.1,
+                requires=("scientific", "scientific_reliability"))
+def scientist(claim, features, framework):
+    scientific_count = features["scientific"]
+    if not scientific_count:
+        return ["No scientific evidence"], 0.1
+    consensus = features["scientific_reliability"] / scientific_count
+    return [f"Scientific consensus ({scientific_count} studies, {consensus:.0%} reliability)"], consensus
+
+
+@register_agent("Logician", "Logical Analysis", weight=0.20, requires=("total", "contradictions"))
+def logician(claim, features, framework):
+    if not features["total"]:
+        return ["Insufficient data"], 0.1
+    consistency = 1.0 - (features["contradictions"] / max(1, features["total"]))
+    return [f"Logical consistency: {consistency:.0%}"], consistency
+
+
+@register_agent("Historian", "Historical Context", weight=0.15, requires=("historical", "historical_support"))
+def historian(claim, features, framework):
+    historical_count = features["historical"]
+    if not historical_count:
+        return ["No historical precedent"], 0.1
+    support = features["historical_support"] / historical_count
+    return [f"Historical precedent: {historical_count} cases, {support:.0%} similar"], support
+
+
+@register_agent("AxiomRegulator", "Truth Framework", weight=0.10)
+def axiom_regulator(claim, features, framework):
+    truth_percent, conflicts = framework.evaluate_statement(claim)
+    arguments = [f"Axiomatic Truth: {truth_percent:.2f}% in '{framework.name}' framework"]
+    if conflicts:
+        arguments.append(f"Conflicts: {list_conflicts(conflicts)}")
+    return arguments, truth_percent / 100
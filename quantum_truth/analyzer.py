@@ -1,64 +1,348 @@
 import time
 from datetime import datetime
 import numpy as np
-import json
 import os
-from tqdm import tqdm
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .agents import DEFAULT_AGENTS
 from .engines import ChatbotEngine, SearchEngine
+from .evidence import EvidenceBatch, EvidenceStats
+from .dedup import DEFAULT_THRESHOLD, deduplicate
+from .cache import ResultCache, claim_digest, make_key
+from .graph import TruthGraph
+from .knowledge import load_knowledge_base
+from .ingest import EvidenceCorpus
+from .shared import StatsPool
+from .metrics import NULL_METRICS
+from .events import NULL_EVENTS, EventLog
+from .store import ResultStore
+from .rendering import (Renderer, SPEC_FILE, DEBATE_FORMATS, debate_spec, debate_animation_spec, confidence_spec,
+                        truth_evolution_spec)
+
+# Result keys carrying the per-cycle truth series and the evidence statistics
+# (EvidenceStats.to_dict) from analysis to the result store
+SERIES_KEY = "truth_series"
+STATS_KEY = "evidence_stats"
 
 class TruthAnalyzer:
-    def __init__(self, pages=100, cycles=100):
-        self.chatbot_engine = ChatbotEngine()
-        self.search_engine = SearchEngine(pages)
+    def __init__(self, pages=100, cycles=100, seed=None, render="inline", cache=False, knowledge_base=None,
+                 chunk_size=65536, metrics=None, graph=None, tolerance=None, min_cycles=10, agents=None,
+                 store=True, events=None, dedup=None, weights=None, corpus=None, stats_workers=None,
+                 debate_format="gif"):
+        if isinstance(knowledge_base, str):
+            knowledge_base = load_knowledge_base(knowledge_base)
+        if isinstance(corpus, str):
+            corpus = EvidenceCorpus(corpus)
+        if isinstance(graph, str):
+            graph = TruthGraph(graph)
+        self.chatbot_engine = ChatbotEngine(graph, agents or DEFAULT_AGENTS, weights=weights)
+        # Calibrated weights change verdicts, so they are part of the cache key
+        self.weights = self.chatbot_engine.weight_config() if weights is not None else None
+        self.search_engine = SearchEngine(pages, knowledge_base, corpus=corpus)
         self.claim_history = {}
         self.pages = pages
         self.cycles = cycles
+        # With a tolerance, cycles is an upper bound: debates stop once the
+        # 95% confidence interval of the mean truth is narrower than tolerance
+        self.tolerance = tolerance
+        self.min_cycles = min_cycles
+        self.seed = seed
+        self.renderer = Renderer(render)
+        if debate_format not in DEBATE_FORMATS:
+            raise ValueError(f"Unknown debate format '{debate_format}', expected one of {DEBATE_FORMATS}")
+        self.debate_format = debate_format
+        self.cache = cache
+        self.store = store
+        self.chunk_size = chunk_size
+        # Near-duplicate threshold for collapsing evidence into weighted rows (True for the default)
+        self.dedup = DEFAULT_THRESHOLD if dedup is True else dedup
+        self.on_partial = None
+        # Processes that split the reduction of one claim's corpus evidence (see shared)
+        self.stats_workers = stats_workers
+        self._stats_pool = None
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.chatbot_engine.metrics = self.metrics
+        # Console text by default; NULL_EVENTS (or a JSON lines EventLog) for machine use
+        self.events = events if events is not None else EventLog()
+        self.chatbot_engine.events = self.search_engine.events = self.events
         self.output_dir = "analysis_results"
         os.makedirs(self.output_dir, exist_ok=True)
     
     def analyze(self, claim, framework="Scientific_Empirical", verbose=True):
+        try:
+            result = self._record(self._analyze_claim(claim, framework, verbose, self.seed))
+        finally:
+            self.events.flush()
+        self._flush_store()
+        return result["truth_percentage_avg"]
+
+    def update(self, claim, new_evidence, framework="Scientific_Empirical", verbose=True):
+        """Re-analyze claim with new_evidence added, without revisiting its earlier evidence.
+
+        The evidence statistics saved with the claim's last result are merged
+        with those of new_evidence (an EvidenceBatch or evidence dicts) in
+        O(new rows), and the debate reruns on the merged statistics. New
+        evidence counts as coming after the old, so the claim's first row
+        stays the anchor for consistency and the FactChecker citation.
+        Returns the result dict; raises LookupError when nothing was saved.
+        """
+        store = self._get_store()
+        saved = store.load_stats(claim) if store is not None else None
+        if saved is None:
+            raise LookupError(f"No saved evidence statistics for '{claim}'; analyze it with a result store first")
+        evidence = EvidenceStats.from_dict(saved)
+        new_evidence = self._deduplicate(EvidenceBatch.coerce(new_evidence))
+        with self.metrics.span("evidence.stats", pages=new_evidence.pages):
+            evidence.merge(EvidenceStats.of(new_evidence))
+        # Cached verdicts for the claim were computed from the old evidence
+        cache = self._get_cache()
+        if cache is not None:
+            cache.invalidate(claim)
+        if self.seed is not None:
+            self._seed_claim(self.seed, claim)
+        try:
+            result = self._record(self._run_analysis(claim, framework, verbose, evidence))
+        finally:
+            self.events.flush()
+        self._flush_store()
+        return result
+
+    def analyze_many(self, claims, framework="Scientific_Empirical", workers=None, ordered=True, seed=None):
+        """Analyze claims across a process pool, yielding one result dict per claim.
+
+        Each claim gets its own RNG seed derived from (seed, claim), so results
+        are reproducible regardless of worker count or scheduling.
+        With ordered=False results are yielded as soon as they complete.
+        """
+        seed = seed if seed is not None else self.seed
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        workers = workers or os.cpu_count() or 1
+        try:
+            if workers == 1:
+                for claim in claims:
+                    result = self._record(self._analyze_claim(claim, framework, False, seed))
+                    self.events.flush()
+                    yield result
+            else:
+                for result in self._analyze_in_pool(claims, framework, workers, ordered, seed):
+                    yield self._record(result)
+        finally:
+            self._flush_store()
+
+    def _analyze_in_pool(self, claims, framework, workers, ordered, seed):
+        cache = self._get_cache()
+        cache_config = (cache.max_entries, cache.directory, cache.ttl) if cache is not None else None
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self._worker_options(), cache_config, self.output_dir)) as pool:
+            pending = deque()
+            for claim in claims:
+                pending.append(pool.submit(_analyze_in_worker, claim, framework, seed))
+                # Keep a bounded window in flight so claims can be streamed lazily
+                if len(pending) >= workers * 4:
+                    yield from _drain(pending, ordered)
+            while pending:
+                yield from _drain(pending, ordered)
+
+    def _worker_options(self):
+        """Keyword arguments that rebuild this analyzer in a worker process"""
+        # Workers reopen the knowledge base and graph from their files;
+        # in-memory ones fall back to the default knowledge base and no graph
+        knowledge_source = self.search_engine.knowledge_base.source
+        graph_source = self.chatbot_engine.truth_graph.path
+        return {
+            "pages": self.pages,
+            "cycles": self.cycles,
+            "render": self.renderer.mode,
+            "debate_format": self.debate_format,
+            "knowledge_base": None if knowledge_source == ":memory:" else knowledge_source,
+            "chunk_size": self.chunk_size,
+            "graph": None if graph_source == ":memory:" else graph_source,
+            "tolerance": self.tolerance,
+            "min_cycles": self.min_cycles,
+            "dedup": self.dedup,
+            "weights": self.weights,
+            "corpus": self.search_engine.corpus.path if self.search_engine.corpus is not None else None,
+            # Workers hand results back; this process writes them to the store
+            "store": False,
+            "agents": [agent.role for agent in self.chatbot_engine.agents]
+        }
+
+    def _get_cache(self):
+        if self.cache is True:
+            self.cache = ResultCache(directory=os.path.join(self.output_dir, "cache"))
+        return self.cache if isinstance(self.cache, ResultCache) else None
+
+    def _get_store(self):
+        if self.store is True:
+            self.store = ResultStore(os.path.join(self.output_dir, "results.db"))
+        elif isinstance(self.store, str):
+            self.store = ResultStore(self.store)
+        return self.store if isinstance(self.store, ResultStore) else None
+
+    def _flush_store(self):
+        if isinstance(self.store, ResultStore):
+            self.store.flush()
+
+    def cache_stats(self):
+        cache = self._get_cache()
+        return cache.stats() if cache is not None else None
+
+    def _analyze_claim(self, claim, framework, verbose, seed):
+        cache = self._get_cache()
+        adaptive = (self.tolerance, self.min_cycles) if self.tolerance is not None else None
+        corpus = self.search_engine.corpus
+        knowledge = self.search_engine.knowledge_base.source
+        agents = tuple(agent.role for agent in self.chatbot_engine.agents)
+        key = make_key(claim, framework, self.pages, self.cycles, seed, adaptive, self.weights,
+                       corpus.path if corpus is not None else None,
+                       None if knowledge == ":memory:" else knowledge,
+                       None if agents == DEFAULT_AGENTS else agents)
+        if cache is not None:
+            result = cache.get(key)
+            self.metrics.incr("cache.hits" if result is not None else "cache.misses")
+            if result is not None:
+                self.events.emit("analysis.cached", claim=claim, verdict=result["verdict"],
+                                 truth_percentage_avg=result["truth_percentage_avg"])
+                return result
+        
+        if seed is not None:
+            self._seed_claim(seed, claim)
+        self.metrics.start_profile()
+        try:
+            result = self._run_analysis(claim, framework, verbose)
+        finally:
+            self.metrics.stop_profile()
+        if cache is not None:
+            cache.put(key, {name: value for name, value in result.items() if name not in (SERIES_KEY, STATS_KEY)})
+        return result
+
+    def _record(self, result):
+        """Move a fresh result's truth series and evidence statistics into the result store;
+        cached results are already stored"""
+        series = result.pop(SERIES_KEY, None)
+        stats = result.pop(STATS_KEY, None)
+        if series is not None:
+            with self.metrics.span("results.save"):
+                self._save_results(result, series, stats)
+        return result
+
+    def _seed_claim(self, seed, claim):
+        """Give the engines independent streams derived from (seed, claim) alone,
+        so a claim's result does not depend on which worker runs it or when"""
+        search, debate = np.random.SeedSequence([seed, int(claim_digest(claim), 16)]).spawn(2)
+        self.search_engine.rng = np.random.default_rng(search)
+        self.chatbot_engine.rng = np.random.default_rng(debate)
+
+    def _gather_evidence(self, claim, framework, verbose):
+        """Evidence statistics for claim.
+
+        Evidence beyond chunk_size pages is streamed through an incremental
+        accumulator in constant memory, reporting a partial verdict to
+        on_partial and as rate-limited progress events after every chunk.
+        With stats_workers, corpus evidence beyond chunk_size is instead
+        reduced chunk by chunk in a process pool, with the same result and
+        the same reporting after every merged chunk.
+        """
+        corpus = self.search_engine.corpus
+        rows = min(self.pages, corpus.count(claim)) if corpus is not None else 0
+        if self.stats_workers and self.stats_workers > 1 and rows > self.chunk_size:
+            if self._stats_pool is None:
+                self._stats_pool = StatsPool(self.stats_workers)
+            stats = EvidenceStats()
+            with self.metrics.span("evidence.stats", rows=rows, workers=self.stats_workers):
+                for stats in self._stats_pool.iter_reduce(corpus.path, claim, rows, self.chunk_size, self.dedup):
+                    self._report_partial(claim, stats, framework)
+            return stats
+
+        if self.pages <= self.chunk_size:
+            with self.metrics.span("evidence.search", pages=self.pages):
+                evidence = self.search_engine.search_claim(claim)
+            evidence = self._deduplicate(evidence)
+            with self.metrics.span("evidence.stats"):
+                return EvidenceStats.of(evidence)
+        
+        stats = EvidenceStats()
+        chunks = self.search_engine.iter_evidence(claim, self.chunk_size)
+        while True:
+            with self.metrics.span("evidence.search", pages=min(self.chunk_size, self.pages - stats.total)):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            chunk = self._deduplicate(chunk)
+            with self.metrics.span("evidence.stats"):
+                stats.update(chunk)
+            self._report_partial(claim, stats, framework)
+        return stats
+
+    def _report_partial(self, claim, stats, framework):
+        """Progress event and on_partial callback for the evidence counted so far"""
+        if not self.events.progress_enabled and self.on_partial is None:
+            return
+        partial = self.chatbot_engine.expected_truth(claim, stats, framework)
+        self.events.progress("evidence.progress", stats.total, self.pages, claim=claim,
+                             truth_percentage=partial)
+        if self.on_partial is not None:
+            self.on_partial({
+                "claim": claim,
+                "pages_processed": stats.total,
+                "truth_percentage": partial,
+                "verdict": self._determine_verdict(partial)
+            })
+
+    def _deduplicate(self, evidence):
+        if not self.dedup:
+            return evidence
+        with self.metrics.span("evidence.dedup", rows=len(evidence)):
+            evidence = deduplicate(evidence, self.dedup)
+        self.metrics.incr("evidence.dedup_rows", len(evidence))
+        return evidence
+
+    def _run_analysis(self, claim, framework="Scientific_Empirical", verbose=True, evidence=None):
+        """Analyze claim; evidence, when given, is the claim's EvidenceStats and replaces the search"""
         start_time = time.time()
-        print(f"\n{'='*60}")
-        print(f"TRUTH ANALYSIS: {claim}")
-        print(f"Pages: {self.pages} | Cycles: {self.cycles}")
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*60)
+        metrics = self.metrics
+        metrics.incr("analyses")
+        os.makedirs(self.output_dir, exist_ok=True)
+        pages = self.pages if evidence is None else evidence.total
+        self.events.emit("analysis.start", claim=claim, pages=pages, cycles=self.cycles,
+                         timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         
-        evidence = self.search_engine.search_claim(claim)
-        evidence_analysis = self.search_engine.analyze_evidence(evidence)
+        if evidence is None:
+            evidence = self._gather_evidence(claim, framework, verbose)
+        with metrics.span("evidence.analysis"):
+            evidence_analysis = self.search_engine.analyze_evidence(evidence)
+        metrics.incr("evidence.rows", evidence_analysis["total"])
         
         if verbose:
-            print("\n=== EVIDENCE ANALYSIS ===")
-            print(f"Total sources: {evidence_analysis['total']}")
-            print(f"Scientific: {evidence_analysis['scientific']}")
-            print(f"Reliable sources: {evidence_analysis['reliable']}")
-            print(f"Unreliable sources: {evidence_analysis['unreliable']}")
-            print(f"Historical: {evidence_analysis['historical']}")
-            print(f"Conspiracy: {evidence_analysis['conspiracy']}")
-            print(f"Supporting: {evidence_analysis['support']} | Opposing: {evidence_analysis['oppose']}")
+            self.events.emit("evidence.summary", claim=claim, **evidence_analysis)
         
-        truth_percentages = []
-        all_agents = []
-        framework_obj = None
-        
-        for cycle in tqdm(range(self.cycles), desc="Debate Cycles"):
-            verbose_cycle = verbose and (cycle == 0 or cycle == self.cycles-1)
-            tp, debate_rounds, agents, framework_obj = self.chatbot_engine.conduct_debate(
-                claim, evidence, cycle, framework, verbose_cycle)
-            truth_percentages.append(tp)
-            all_agents = agents
-            
-            # Save visualization for key cycles
-            if cycle in [0, self.cycles-1] or (cycle % max(1, self.cycles//10)) == 0:
-                self.chatbot_engine.visualize_debate(claim, debate_rounds, tp, cycle, framework_obj)
+        with metrics.span("debate", cycles=self.cycles):
+            truth_percentages, debate_rounds, all_agents, framework_obj = self.chatbot_engine.debate_series(
+                claim, evidence, self.cycles, framework, verbose, self.tolerance, self.min_cycles)
+        cycles_used = len(truth_percentages)
+        metrics.incr("debate.cycles", cycles_used)
         
         avg_truth = np.mean(truth_percentages)
         std_truth = np.std(truth_percentages)
         
-        # Generate confidence plot
-        self._plot_confidence(claim, all_agents)
-        # Generate truth percentage plot
-        self._plot_truth_evolution(claim, truth_percentages)
+        if self.renderer.enabled:
+            with metrics.span("visualization", mode=self.renderer.mode):
+                # Visualize key cycles
+                key_cycles = [cycle for cycle in range(cycles_used)
+                              if cycle in [0, cycles_used-1] or (cycle % max(1, cycles_used//10)) == 0]
+                if self.debate_format == "png":
+                    self._render([debate_spec(claim, debate_rounds, truth_percentages[cycle], cycle, framework_obj,
+                                              self.output_dir)
+                                  for cycle in key_cycles])
+                else:
+                    self._render([debate_animation_spec(claim, debate_rounds,
+                                                        [(cycle, truth_percentages[cycle]) for cycle in key_cycles],
+                                                        framework_obj, self.output_dir, self.debate_format)])
+                # Generate confidence plot
+                self._plot_confidence(claim, all_agents)
+                # Generate truth percentage plot
+                self._plot_truth_evolution(claim, truth_percentages)
         
         # Save results
         result = {
@@ -67,63 +351,58 @@ class TruthAnalyzer:
             "truth_percentage_std": std_truth,
             "evidence_analysis": evidence_analysis,
             "cycles": self.cycles,
-            "pages": self.pages,
+            "cycles_used": cycles_used,
+            "pages": pages,
             "timestamp": datetime.now().isoformat(),
             "execution_time": time.time() - start_time,
-            "framework": framework
+            "framework": framework,
+            SERIES_KEY: truth_percentages,
+            STATS_KEY: evidence.to_dict()
         }
         
-        self._save_results(claim, result)
-        
         # Determine verdict
         veracity = self._determine_verdict(avg_truth)
+        result["verdict"] = veracity
+        
+        with metrics.span("graph.update"):
+            self.chatbot_engine.record_analysis(claim, evidence, framework, debate_rounds, avg_truth, veracity)
         
         # Get transformation pathway
         transformation_path = framework_obj.transformation_pathway(claim)
         
-        print("\n" + "="*60)
-        print(f"FINAL VERDICT AFTER {self.cycles} CYCLES: {veracity}")
-        print(f"Average Truth Confidence: {avg_truth:.4%} ± {std_truth:.4%}")
-        print(f"Evidence Processed: {self.pages} pages")
-        print(f"Framework: {framework_obj.name}")
-        print(f"Execution Time: {time.time() - start_time:.2f} seconds")
-        print("\n=== TRANSFORMATION PATHWAY ===")
-        print(transformation_path)
-        print("="*60)
+        self.events.emit("analysis.verdict", claim=claim, verdict=veracity, cycles_used=cycles_used,
+                         truth_percentage_avg=float(avg_truth), truth_percentage_std=float(std_truth),
+                         pages=pages, framework=framework_obj.name,
+                         execution_time=time.time() - start_time, pathway=transformation_path)
         
-        return avg_truth
+        return result
+
+    def close(self):
+        """Wait for background renders, then release the result store and truth graph"""
+        self.renderer.close()
+        if self._stats_pool is not None:
+            self._stats_pool.close()
+            self._stats_pool = None
+        if isinstance(self.store, ResultStore):
+            self.store.close()
+            self.store = self.store.path
+        self.chatbot_engine.truth_graph.close()
+
+    def _render(self, specs):
+        self.renderer.submit(specs, os.path.join(self.output_dir, SPEC_FILE))
 
     def _plot_confidence(self, claim, agents):
-        import matplotlib.pyplot as plt
-        plt.figure(figsize=(12, 6))
-        for agent in agents:
-            plt.plot(agent.confidence_history, label=agent.role, alpha=0.8)
-        plt.title(f"Agent Confidence: '{claim[:30]}'")
-        plt.xlabel("Debate Cycle")
-        plt.ylabel("Confidence")
-        plt.legend()
-        plt.grid(True)
-        conf_path = f"{self.output_dir}/confidence_{claim[:20]}.png"
-        plt.savefig(conf_path)
-        plt.close()
+        self._render([confidence_spec(claim, agents, self.output_dir)])
 
     def _plot_truth_evolution(self, claim, truth_percentages):
-        import matplotlib.pyplot as plt
-        plt.figure(figsize=(12, 6))
-        plt.plot(truth_percentages, color='purple')
-        plt.title(f"Truth Percentage Evolution: '{claim[:30]}'")
-        plt.xlabel("Debate Cycle")
-        plt.ylabel("Truth Percentage")
-        plt.ylim(0, 1)
-        plt.grid(True)
-        truth_path = f"{self.output_dir}/truth_evolution_{claim[:20]}.png"
-        plt.savefig(truth_path)
-        plt.close()
-
-    def _save_results(self, claim, result):
-        json_path = f"{self.output_dir}/results_{claim[:20]}.json"
-        with open(json_path, "w") as f:
-            json.dump(result, f, indent=2)
+        self._render([truth_evolution_spec(claim, truth_percentages, self.output_dir)])
+
+    def _save_results(self, result, series, stats=None):
+        store = self._get_store()
+        if store is not None:
+            store.append(result, series)
+            if stats is not None:
+                store.save_stats(result["claim"], stats, result["timestamp"])
 
     def _determine_verdict(self, avg_truth):
         if avg_truth < 0.05:
@@ -136,3 +415,32 @@ class TruthAnalyzer:
             return "LIKELY TRUE"
         else:
             return "HIGHLY LIKELY"
+
+
+_worker_analyzer = None
+
+
+def _init_worker(options, cache_config, output_dir):
+    global _worker_analyzer
+    cache = ResultCache(*cache_config) if cache_config else False
+    # Workers only hand results back; console output would just contend for the parent's stdout
+    _worker_analyzer = TruthAnalyzer(cache=cache, events=NULL_EVENTS, **options)
+    _worker_analyzer.output_dir = output_dir
+
+
+def _analyze_in_worker(claim, framework, seed):
+    return _worker_analyzer._analyze_claim(claim, framework, False, seed)
+
+
+def _drain(pending, ordered):
+    """Wait for at least one result and yield every result that is ready"""
+    if ordered:
+        while pending:
+            yield pending.popleft().result()
+            if not pending or not pending[0].done():
+                return
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield future.result()
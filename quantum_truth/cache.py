@@ -0,0 +1,151 @@
+"""
+Result cache for Quantum Truth Analysis System
+Content-addressed verdict cache with an in-memory LRU tier and an optional
+on-disk tier that survives restarts.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_claim(claim):
+    """Case, punctuation and whitespace insensitive form of a claim"""
+    return " ".join(re.sub(r"[^\w\s]", " ", claim.lower()).split())
+
+
+def claim_digest(claim):
+    return hashlib.sha256(normalize_claim(claim).encode("utf-8")).hexdigest()[:16]
+
+
+def make_key(claim, framework, pages, cycles, seed=None, adaptive=None, weights=None, corpus=None,
+             knowledge=None, agents=None):
+    """Cache key: claim digest followed by a digest of the analysis parameters.
+
+    The claim digest prefix lets every entry for a claim be invalidated at once.
+    adaptive is the (tolerance, min_cycles) of early-stopping analyses and
+    weights a non-default scoring weight config. corpus is the path of
+    an ingested evidence corpus the analysis reads from, and knowledge the
+    source of a knowledge base other than the built-in one. agents is a
+    debate roster other than the default one, in order.
+    """
+    params = [framework, pages, cycles, seed]
+    if adaptive is not None:
+        params.append(list(adaptive))
+    if weights is not None:
+        params.append(weights)
+    if corpus is not None:
+        params.append(os.path.abspath(corpus))
+    if knowledge is not None:
+        params.append({"knowledge": os.path.abspath(knowledge)})
+    if agents is not None:
+        params.append({"agents": list(agents)})
+    params = json.dumps(params, sort_keys=True)
+    return f"{claim_digest(claim)}-{hashlib.sha256(params.encode('utf-8')).hexdigest()[:16]}"
+
+
+class ResultCache:
+    def __init__(self, max_entries=1024, directory=None, ttl=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._invalidation_hooks = []
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0], now):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, entry)
+        return entry[1]
+
+    def put(self, key, result):
+        entry = (time.time(), result)
+        with self._lock:
+            self._store(key, entry)
+        if self.directory:
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"stored_at": entry[0], "result": result}, f)
+            os.replace(tmp_path, path)
+
+    def invalidate(self, claim=None):
+        """Drop every entry for claim, or the whole cache when claim is None"""
+        prefix = claim_digest(claim) if claim is not None else ""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.startswith(prefix) and name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+        for hook in self._invalidation_hooks:
+            hook(claim)
+
+    def add_invalidation_hook(self, hook):
+        """Register hook(claim) to be called after invalidate(); claim is None for a full clear"""
+        self._invalidation_hooks.append(hook)
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits
+        }
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _expired(self, stored_at, now):
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key, now):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self._expired(data["stored_at"], now):
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            return None
+        return data["stored_at"], data["result"]
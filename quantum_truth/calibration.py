@@ -0,0 +1,190 @@
+"""
+Weight calibration for Quantum Truth Analysis System
+Fits the scoring weights against labelled claims. Each claim is reduced
+once to the numbers the scorer combines (evidence quality, consensus and
+consistency, its framework truth and every agent's confidence), so scoring
+a weight vector is two matrix products and thousands of candidates are
+evaluated together instead of rerunning analyze once per combination:
+
+    calibration = Calibration.from_claims(analyzer, load_labels("labels.jsonl"))
+    best, scores, candidates = calibration.search(5000, metric="brier")
+    write_weights("weights.ini", calibration.weight_config(candidates[best]))
+    TruthAnalyzer(weights="weights.ini")
+"""
+import configparser
+import json
+import numpy as np
+from .engines import SCORING_WEIGHTS
+from .evidence import EvidenceStats
+
+CERTAINTY_COLUMNS = ("quality", "consensus", "consistency")
+BLEND_COLUMNS = ("certainty", "framework", "agents")
+METRICS = ("accuracy", "brier", "auc")
+LOWER_IS_BETTER = ("brier",)
+# Mean of the uniform(0.95, 0.99) certainty jitter, and certainty when there is no evidence
+MEAN_JITTER = 0.97
+NO_EVIDENCE_CERTAINTY = 0.45
+# Candidates scored per matrix product, bounding memory at claims x CHUNK_SIZE floats
+CHUNK_SIZE = 2048
+
+
+def load_labels(path):
+    """[(claim, framework or None, label)] from JSON lines with "claim", "label" and optional "framework"."""
+    labelled = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                labelled.append((entry["claim"], entry.get("framework"), bool(entry["label"])))
+    return labelled
+
+
+def read_weights(path):
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    if not parser.read(path):
+        raise FileNotFoundError(f"Weights file not found: {path}")
+    return {section: {name: parser.getfloat(section, name) for name in parser[section]}
+            for section in ("Scoring", "Agents") if parser.has_section(section)}
+
+
+def write_weights(path, config, comment=None):
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    for section, values in config.items():
+        parser[section] = {name: repr(float(value)) for name, value in values.items()}
+    with open(path, "w") as f:
+        if comment:
+            f.write(f"# {comment}\n")
+        parser.write(f)
+
+
+class Calibration:
+    """Sufficient statistics of labelled claims and batched evaluation of weight vectors.
+
+    A weight vector has one entry per column in self.columns: the three
+    certainty weights, the three truth blend weights, then one weight per
+    agent role. Rows of a (candidates, columns) matrix are scored at once.
+    """
+    def __init__(self, claims, labels, evidence, framework_truth, confidence, roles, base_weights=None):
+        self.claims = list(claims)
+        self.labels = np.asarray(labels, dtype=bool)
+        # (claims, 3) quality/consensus/consistency, NaN rows for claims without evidence
+        self.evidence = np.asarray(evidence, dtype=np.float64)
+        self.framework_truth = np.asarray(framework_truth, dtype=np.float64)
+        self.confidence = np.asarray(confidence, dtype=np.float64).reshape(len(self.claims), len(roles))
+        self.roles = tuple(roles)
+        self.columns = CERTAINTY_COLUMNS + BLEND_COLUMNS + self.roles
+        self.base = np.array([SCORING_WEIGHTS[name] for name in CERTAINTY_COLUMNS + BLEND_COLUMNS] +
+                             [0.0] * len(self.roles))
+        self.base = self.vector(base_weights or {})
+
+    @classmethod
+    def from_claims(cls, analyzer, labelled, framework="Scientific_Empirical", seed=0):
+        """Gather evidence for every (claim, framework, label) once, seeded per claim like analyze_many"""
+        engine = analyzer.chatbot_engine
+        claims, labels, evidence, framework_truth, confidence = [], [], [], [], []
+        for claim, claim_framework, label in labelled:
+            claim_framework = claim_framework or framework
+            analyzer._seed_claim(seed, claim)
+            stats = EvidenceStats.of(analyzer.search_engine.search_claim(claim))
+            _, rounds, _, framework_obj = engine.debate_series(claim, stats, 1, claim_framework, verbose=False)
+            claims.append(claim)
+            labels.append(label)
+            if stats.total:
+                evidence.append((stats.reliability_sum / stats.total, stats.support / stats.total,
+                                 1.0 - stats.contradictions / stats.total))
+            else:
+                evidence.append((np.nan,) * 3)
+            framework_truth.append(framework_obj.evaluate_statement(claim)[0] / 100)
+            confidence.append([entry["confidence"] for entry in rounds])
+        return cls(claims, labels, evidence, framework_truth, confidence,
+                   [agent.role for agent in engine.agents], engine.weight_config())
+
+    def __len__(self):
+        return len(self.claims)
+
+    def vector(self, config):
+        """Weight vector for a weight_config() style dict; missing entries keep self.base"""
+        values = dict(zip(self.columns, self.base))
+        values.update(config.get("Scoring", {}))
+        values.update(config.get("Agents", {}))
+        return np.array([values[name] for name in self.columns], dtype=np.float64)
+
+    def weight_config(self, vector):
+        vector = [float(value) for value in vector]
+        return {"Scoring": dict(zip(CERTAINTY_COLUMNS + BLEND_COLUMNS, vector[:6])),
+                "Agents": dict(zip(self.roles, vector[6:]))}
+
+    def truth(self, weights):
+        """(claims, candidates) expected truth percentages for a (candidates, columns) weight matrix"""
+        weights = np.atleast_2d(weights)
+        certainty = np.clip((np.nan_to_num(self.evidence) @ weights[:, :3].T) * MEAN_JITTER, 0.01, 0.99)
+        certainty[np.isnan(self.evidence).any(axis=1)] = NO_EVIDENCE_CERTAINTY
+        agents = self.confidence @ weights[:, 6:].T
+        truth = certainty * weights[:, 3] + self.framework_truth[:, None] * weights[:, 4] + agents * weights[:, 5]
+        return np.clip(truth, 0.01, 0.99)
+
+    def evaluate(self, weights):
+        """{metric: (candidates,) scores}; accuracy counts truth >= 0.5 as a true verdict"""
+        weights = np.atleast_2d(weights)
+        scores = {metric: np.empty(len(weights)) for metric in METRICS}
+        labels = self.labels[:, None]
+        for start in range(0, len(weights), CHUNK_SIZE):
+            chunk = slice(start, start + CHUNK_SIZE)
+            truth = self.truth(weights[chunk])
+            scores["accuracy"][chunk] = ((truth >= 0.5) == labels).mean(axis=0)
+            scores["brier"][chunk] = ((truth - labels) ** 2).mean(axis=0)
+            scores["auc"][chunk] = _auc(truth, self.labels)
+        return scores
+
+    def candidates(self, count, rng=None):
+        """count weight vectors, the first being the current weights; the rest draw each weight
+        group (certainty, blend, agents) uniformly from the simplex"""
+        rng = np.random.default_rng(rng)
+        groups = (len(CERTAINTY_COLUMNS), len(BLEND_COLUMNS), len(self.roles))
+        draws = np.hstack([rng.dirichlet(np.ones(size), count) for size in groups if size])
+        draws[0] = self.base
+        return draws
+
+    def search(self, count=5000, metric="brier", rng=None):
+        """Best of count candidates by metric: (index of the best, {metric: scores}, candidates)"""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}' (use one of {', '.join(METRICS)})")
+        weights = self.candidates(count, rng)
+        scores = self.evaluate(weights)
+        ranking = scores[metric] if metric in LOWER_IS_BETTER else -scores[metric]
+        return int(np.nanargmin(ranking)), scores, weights
+
+    def sweep(self, base=None, **axes):
+        """Sensitivity surface: scores over the grid of the named columns' values, others held at base.
+
+        sweep(certainty=np.linspace(0, 1, 11), framework=np.linspace(0, 1, 11))
+        returns {metric: array of shape (11, 11)}. Values are used as given,
+        so blends are not renormalized.
+        """
+        unknown = [name for name in axes if name not in self.columns]
+        if unknown:
+            raise ValueError(f"Unknown weight columns: {', '.join(unknown)}")
+        base = self.base if base is None else np.asarray(base, dtype=np.float64)
+        grids = np.meshgrid(*axes.values(), indexing="ij")
+        weights = np.repeat(base[None, :], grids[0].size if grids else 1, axis=0)
+        for name, grid in zip(axes, grids):
+            weights[:, self.columns.index(name)] = grid.ravel()
+        shape = grids[0].shape if grids else ()
+        return {metric: values.reshape(shape) for metric, values in self.evaluate(weights).items()}
+
+
+def _auc(truth, labels):
+    """Column-wise ROC AUC (tied scores count half) via average ranks of all columns in one sort"""
+    claims, candidates = truth.shape
+    positives = int(labels.sum())
+    negatives = claims - positives
+    if not positives or not negatives:
+        return np.full(candidates, np.nan)
+    # Offsetting each column by 2 keeps columns apart, so one sort ranks them all
+    shifted = (truth + 2.0 * np.arange(candidates)).T.ravel()
+    ordered = np.sort(shifted)
+    ranks = (np.searchsorted(ordered, shifted, "left") + np.searchsorted(ordered, shifted, "right") + 1) / 2
+    ranks = ranks.reshape(candidates, claims) - claims * np.arange(candidates)[:, None]
+    return (ranks[:, labels].sum(axis=1) - positives * (positives + 1) / 2) / (positives * negatives)
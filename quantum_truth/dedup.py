@@ -0,0 +1,136 @@
+"""
+Evidence deduplication for Quantum Truth Analysis System
+Collapses evidence into weighted rows before scoring. Summaries are first
+clustered with MinHash/LSH so reworded copies share one key; rows are then
+grouped by exact key (summary cluster, source, type, stance and
+reliability class) and each group becomes one row weighted by its size.
+Groups never straddle a reliability threshold and keep their mean
+reliability, so EvidenceStats over the weighted rows matches the original.
+"""
+import numpy as np
+from .evidence import EvidenceBatch, EvidenceStats
+
+DEFAULT_THRESHOLD = 0.8
+NUM_BINS = 64
+BANDS = 16
+SHINGLE_SIZE = 4
+EMPTY = np.iinfo(np.uint32).max
+# Multiply-shift hash of a shingle: (a * x + b) >> 32 with odd a, in wrapping uint64 arithmetic
+_HASH_A, _HASH_B = np.random.default_rng(0x5EED).integers(1, 1 << 63, size=2, dtype=np.uint64)
+_HASH_A |= np.uint64(1)
+_BAND_MIX = np.random.default_rng(0xBA4D).integers(1, 1 << 63, size=NUM_BINS, dtype=np.uint64) | np.uint64(1)
+
+
+def minhash_signatures(texts, num_bins=NUM_BINS, shingle_size=SHINGLE_SIZE):
+    """(len(texts), num_bins) MinHash signatures over lower-cased character shingles.
+
+    One-permutation hashing: each shingle is hashed once and its low bits
+    pick the bin it competes in, so the cost is one hash per shingle rather
+    than one per shingle and permutation. Bins a short text leaves empty
+    borrow the next filled bin (rotation densification), which keeps the
+    fraction of equal bins an unbiased estimate of Jaccard similarity.
+    """
+    bits = num_bins.bit_length() - 1
+    if num_bins != 1 << bits:
+        raise ValueError("num_bins must be a power of two")
+    encoded = [" ".join(text.lower().split()).ljust(shingle_size).encode() for text in texts]
+    if not encoded:
+        return np.empty((0, num_bins), dtype=np.uint32)
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    # Every shingle of shingle_size bytes as one integer, then only those inside a single text
+    grams = np.zeros(len(data) - shingle_size + 1, dtype=np.uint64)
+    for offset in range(shingle_size):
+        grams = (grams << np.uint64(8)) | data[offset:len(data) - shingle_size + 1 + offset]
+    counts = lengths - shingle_size + 1
+    owners = np.repeat(np.arange(len(encoded)), counts)
+    positions = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts - np.cumsum(lengths) + lengths, counts)
+    hashes = ((grams[positions] * _HASH_A + _HASH_B) >> np.uint64(32)).astype(np.uint32)
+
+    signatures = np.full(len(encoded) * num_bins, EMPTY, dtype=np.uint32)
+    np.minimum.at(signatures, owners * num_bins + (hashes & np.uint32(num_bins - 1)), hashes >> np.uint32(bits))
+    signatures = signatures.reshape(len(encoded), num_bins)
+    filled = signatures != EMPTY
+    if not filled.all():
+        doubled = np.concatenate([signatures, signatures], axis=1)
+        nearest = np.where(np.concatenate([filled, filled], axis=1), np.arange(2 * num_bins), 2 * num_bins)
+        nearest = np.minimum.accumulate(nearest[:, ::-1], axis=1)[:, ::-1][:, :num_bins]
+        # Borrowed values are tagged with the distance they travelled, in the bits the bin index freed
+        distance = (nearest - np.arange(num_bins)).astype(np.uint32)
+        signatures = np.take_along_axis(doubled, nearest, axis=1) | (distance << np.uint32(32 - bits))
+    return signatures
+
+
+def near_duplicate_clusters(texts, threshold=DEFAULT_THRESHOLD, num_bins=NUM_BINS, bands=BANDS):
+    """Cluster label per text: the index of the first text of its near-duplicate cluster.
+
+    LSH banding proposes candidate pairs; a pair is joined when its
+    signatures estimate a Jaccard similarity of at least threshold.
+    """
+    labels = np.arange(len(texts))
+    if len(texts) < 2:
+        return labels
+    signatures = minhash_signatures(texts, num_bins)
+    rows = num_bins // bands
+    left, right = [], []
+    for band in range(bands):
+        columns = slice(band * rows, (band + 1) * rows)
+        keys = (signatures[:, columns].astype(np.uint64) * _BAND_MIX[columns]).sum(axis=1)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        leaders = first[inverse.ravel()]
+        candidates = np.flatnonzero(leaders != labels)
+        similar = (signatures[candidates] == signatures[leaders[candidates]]).mean(axis=1) >= threshold
+        left.append(candidates[similar])
+        right.append(leaders[candidates[similar]])
+    left, right = np.concatenate(left), np.concatenate(right)
+    # Connected components: propagate the smallest index until nothing changes
+    while len(left):
+        lowest = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, lowest)
+        np.minimum.at(updated, right, lowest)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return labels
+
+
+def deduplicate(evidence, threshold=DEFAULT_THRESHOLD):
+    """Weighted EvidenceBatch with exact and near-duplicate rows collapsed.
+
+    threshold is the estimated Jaccard similarity at which two summaries
+    count as the same; None only collapses exact duplicates. Rows keep the
+    order and text of each group's first row.
+    """
+    batch = EvidenceBatch.coerce(evidence)
+    if not len(batch):
+        return batch
+    summary_keys = batch.summary_codes
+    if threshold is not None:
+        used, inverse = np.unique(batch.summary_codes, return_inverse=True)
+        labels = near_duplicate_clusters([batch.summaries[code] for code in used], threshold)
+        summary_keys = labels[inverse.ravel()]
+
+    reliability = batch.reliability
+    classes = ((reliability < EvidenceStats.UNRELIABLE_THRESHOLD).astype(np.int64) |
+               (reliability > EvidenceStats.VERIFIED_THRESHOLD) << 1 |
+               (reliability > EvidenceStats.RELIABLE_THRESHOLD) << 2)
+    _, pairs = np.unique((summary_keys.astype(np.int64) << 32) | batch.source_codes.astype(np.int64),
+                         return_inverse=True)
+    keys = (pairs.ravel().astype(np.int64) << 12 | batch.type_codes.astype(np.int64) << 4 |
+            batch.supports_claim.astype(np.int64) << 3 | classes)
+    _, first, groups = np.unique(keys, return_index=True, return_inverse=True)
+    groups = groups.ravel()
+
+    weight = batch.weight if batch.weight is not None else np.ones(len(batch), dtype=np.int64)
+    pages = np.bincount(groups, weights=weight)
+    reliability_sums = np.bincount(groups, weights=reliability.astype(np.float64) * weight)
+    order = np.argsort(first)
+    rows = first[order]
+    return EvidenceBatch(
+        (reliability_sums[order] / pages[order]).astype(np.float32), batch.supports_claim[rows],
+        batch.type_codes[rows], batch.source_codes[rows], batch.summary_codes[rows],
+        batch.types, batch.sources, batch.summaries, pages[order].astype(np.int64),
+        batch.synthetic
+    )
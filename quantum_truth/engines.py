@@ -1,258 +1,287 @@
-import random
-import time
-import networkx as nx
-import matplotlib.pyplot as plt
-from collections import defaultdict
-from .frameworks import AxiomaticFramework
-from .agents import DebateAgent
+import numpy as np
+from collections import defaultdict, deque
+from .frameworks import default_frameworks, evaluate_all
+from .agents import DEFAULT_AGENTS, DebateAgent, evidence_features
+from .evidence import EvidenceBatch, EvidenceStats, StringTable, EVIDENCE_TYPES
+from .rendering import debate_spec, render_spec
+from .knowledge import BASE_KNOWLEDGE, default_knowledge_base
+from .graph import NULL_GRAPH
+from .metrics import NULL_METRICS
+from .events import NULL_EVENTS
+
+# Finished debates remembered per claim
+DEBATE_HISTORY_SIZE = 100
+SYNONYMS = {
+    "show": ["demonstrate", "prove", "confirm"],
+    "impossible": ["not feasible", "impractical", "unachievable"],
+    "evidence": ["proof", "data", "findings"],
+    "ancient": ["historical", "archaic", "prehistoric"]
+}
+SYNONYM_CHOICES = 3
+# Certainty mixes evidence quality, consensus and consistency; truth blends certainty, the
+# framework score and the agents' weighted confidence. See calibration for fitting them.
+SCORING_WEIGHTS = {
+    "quality": 0.6,
+    "consensus": 0.3,
+    "consistency": 0.1,
+    "certainty": 0.7,
+    "framework": 0.3,
+    "agents": 0.0
+}
 
 class ChatbotEngine:
-    def __init__(self):
-        self.debate_history = defaultdict(list)
-        self.truth_graph = nx.Graph()
-        self.frameworks = {
-            "Scientific_Empirical": AxiomaticFramework("Scientific_Empirical", [
-                "Earth_Orbits_Sun",
-                "Energy_Conservation",
-                "Natural_Selection",
-                "Gravity"
-            ]),
-            "Historical_Consensus": AxiomaticFramework("Historical_Consensus", [
-                "Pyramids_Built_by_Egyptians",
-                "Moon_Landing_Occurred",
-                "Industrial_Revolution_Origin"
-            ]),
-            "Ethical_Framework": AxiomaticFramework("Ethical_Framework", [
-                "Truthfulness_Required",
-                "Greater_Good_Priority",
-                "Individual_Rights"
-            ])
-        }
-        
-    def calculate_certainty(self, evidence):
+    def __init__(self, truth_graph=None, agents=DEFAULT_AGENTS, rng=None, weights=None):
+        self.metrics = NULL_METRICS
+        self.events = NULL_EVENTS
+        self.rng = np.random.default_rng(rng)
+        # Agents persist across cycles and debates; features they declare are computed once per debate
+        self.agents = [DebateAgent(role) for role in agents]
+        self.features = tuple(dict.fromkeys(name for agent in self.agents for name in agent.requires))
+        self.debate_history = defaultdict(lambda: deque(maxlen=DEBATE_HISTORY_SIZE))
+        self.truth_graph = truth_graph if truth_graph is not None else NULL_GRAPH
+        self.frameworks = default_frameworks()
+        self.weights = dict(SCORING_WEIGHTS)
+        if weights is not None:
+            self.load_weights(weights)
+
+    def load_weights(self, config):
+        """Apply scoring and agent weights from an INI file written by calibration or a weight_config() dict"""
+        if isinstance(config, str):
+            from .calibration import read_weights
+            config = read_weights(config)
+        self.weights.update(config.get("Scoring", {}))
+        agent_weights = config.get("Agents", {})
+        for agent in self.agents:
+            agent.weight = agent_weights.get(agent.role, agent.weight)
+
+    def weight_config(self):
+        return {"Scoring": dict(self.weights), "Agents": {agent.role: agent.weight for agent in self.agents}}
+
+    def record_analysis(self, claim, evidence, framework_name, debate_rounds, truth_percentage, verdict=None):
+        """Remember a finished debate and add it to the truth graph"""
+        self.debate_history[claim].append({
+            "framework": framework_name,
+            "truth_percentage": float(truth_percentage),
+            "confidences": {entry["agent"]: entry["confidence"] for entry in debate_rounds}
+        })
+        return self.truth_graph.add_analysis(claim, framework_name, EvidenceStats.of(evidence),
+                                             truth_percentage, verdict)
+
+    def _certainty_base(self, evidence):
+        """Deterministic part of calculate_certainty, or None when evidence is unusable"""
         try:
-            if not evidence:
-                return random.uniform(0.3, 0.6)
+            stats = EvidenceStats.of(evidence)
+            if not stats.total:
+                return None
                 
-            quality = sum(ev['reliability'] for ev in evidence) / len(evidence)
-            support_count = sum(1 for ev in evidence if ev['supports_claim'])
-            consensus = support_count / len(evidence)
+            quality = stats.reliability_sum / stats.total
+            consensus = stats.support / stats.total
             
-            first_support = evidence[0]['supports_claim']
-            contradictions = sum(1 for ev in evidence if ev['supports_claim'] != first_support)
-            consistency = 1.0 - (contradictions / len(evidence))
+            consistency = 1.0 - (stats.contradictions / stats.total)
             
-            certainty = (quality * 0.6) + (consensus * 0.3) + (consistency * 0.1)
-            return max(0.01, min(0.99, certainty * random.uniform(0.95, 0.99)))
+            weights = self.weights
+            return (quality * weights["quality"]) + (consensus * weights["consensus"]) + \
+                (consistency * weights["consistency"])
         except:
-            return random.uniform(0.3, 0.6)
+            return None
+    
+    def calculate_certainty(self, evidence):
+        certainty = self._certainty_base(evidence)
+        if certainty is None:
+            return float(self.rng.uniform(0.3, 0.6))
+        return max(0.01, min(0.99, certainty * float(self.rng.uniform(0.95, 0.99))))
+    
+    def certainty_series(self, evidence, cycles):
+        """calculate_certainty for `cycles` independent jitters, drawn as one array"""
+        certainty = self._certainty_base(evidence)
+        if certainty is None:
+            return self.rng.uniform(0.3, 0.6, cycles)
+        return np.clip(certainty * self.rng.uniform(0.95, 0.99, cycles), 0.01, 0.99)
+    
+    def expected_truth(self, claim, evidence, framework_name="Scientific_Empirical"):
+        """Truth percentage at the mean certainty jitter, without the agent term,
+        cheap enough to report on partial evidence"""
+        framework = self.frameworks.get(framework_name, self.frameworks["Scientific_Empirical"])
+        certainty = self._certainty_base(evidence)
+        certainty = 0.45 if certainty is None else max(0.01, min(0.99, certainty * 0.97))
+        framework_truth, _ = framework.evaluate_statement(claim)
+        return max(0.01, min(0.99, (certainty * self.weights["certainty"]) +
+                             (framework_truth/100 * self.weights["framework"])))
     
+    def evaluate_frameworks(self, claim):
+        """Axiomatic (truth_percentage, conflicts) of claim under every framework"""
+        return evaluate_all(self.frameworks, claim)
+
     def conduct_debate(self, claim, evidence, cycle, framework_name="Scientific_Empirical", verbose=True):
+        truth_percentages, debate_rounds, agents, framework = self.debate_series(
+            claim, evidence, 1, framework_name, verbose and cycle == 0)
+        return float(truth_percentages[0]), debate_rounds, agents, framework
+    
+    def debate_series(self, claim, evidence, cycles, framework_name="Scientific_Empirical", verbose=True,
+                      tolerance=None, min_cycles=10):
+        """Run `cycles` debate cycles at once.
+
+        Agent arguments and the framework evaluation do not change between
+        cycles, so they are computed once; only the certainty jitter is
+        drawn per cycle. Returns the truth percentages as an array. With a
+        tolerance, cycles is the maximum and the array may be shorter (see converge).
+        """
         framework = self.frameworks.get(framework_name, self.frameworks["Scientific_Empirical"])
+        evidence = EvidenceStats.of(evidence)
         
-        agents = [
-            DebateAgent("FactChecker", "Evidence Verification"),
-            DebateAgent("Scientist", "Scientific Consensus", bias_factor=-0.1),
-            DebateAgent("Logician", "Logical Analysis"),
-            DebateAgent("Historian", "Historical Context"),
-            DebateAgent("AxiomRegulator", "Truth Framework", bias_factor=0.0)
-        ]
+        agents = self.agents
+        with self.metrics.span("debate.features"):
+            features = evidence_features(evidence, self.features)
         
-        if verbose and cycle == 0:
-            print(f"\n=== Debate: '{claim}' ===")
-            print(f"Framework: {framework.name}")
-            print("Debating agents:")
-            for agent in agents:
-                print(f"- {agent.role} ({agent.expertise})")
+        if verbose:
+            self.events.emit("debate.start", claim=claim, framework=framework.name,
+                             agents=[(agent.role, agent.expertise) for agent in agents])
         
         debate_rounds = []
         for agent in agents:
-            args = agent.formulate_argument(claim, evidence, framework)
+            with self.metrics.span(f"agent.{agent.role}"):
+                args = agent.formulate_argument(claim, evidence, framework, features, self.events)
             debate_rounds.append({
                 "agent": agent.role,
                 "arguments": args,
                 "confidence": agent.confidence
             })
-            if verbose and cycle == 0:
-                print(f"\n{agent.role}: {args[0]}")
-                if len(args) > 1:
-                    for arg in args[1:]:
-                        print(f"  - {arg}")
-                print(f"Confidence: {agent.confidence:.0%}")
-                time.sleep(0.3)
-        
-        confidence_scores = [agent.confidence for agent in agents]
-        weights = [0.30, 0.25, 0.20, 0.15, 0.10]  # AxiomRegulator added
-        weighted_confidence = sum(c * w for c, w in zip(confidence_scores, weights))
-        truth_percentage = self.calculate_certainty(evidence)
+            if verbose:
+                self.events.emit("debate.argument", agent=agent.role, arguments=list(args),
+                                 confidence=agent.confidence)
         
+        weighted_confidence = sum(agent.confidence * agent.weight for agent in agents)
         # Incorporate framework truth percentage
         framework_truth, _ = framework.evaluate_statement(claim)
-        combined_truth = (truth_percentage * 0.7) + (framework_truth/100 * 0.3)
+        with self.metrics.span("debate.certainty", cycles=cycles):
+            if tolerance is None:
+                truth_percentages = self.truth_series(evidence, framework_truth, cycles, weighted_confidence)
+            else:
+                truth_percentages = self.converge(evidence, framework_truth, cycles, tolerance, min_cycles,
+                                                  agent_confidence=weighted_confidence)
         
-        truth_percentage = max(0.01, min(0.99, combined_truth))
+        if verbose:
+            self.events.emit("debate.conclusion", claim=claim, truth_percentage=float(truth_percentages[0]))
         
-        if verbose and cycle == 0:
-            print(f"\n=== Debate Conclusion ===")
-            print(f"Claim: '{claim}'")
-            print(f"TRUTH PERCENTAGE: {truth_percentage:.4%}")
-            print(f"FICTION PERCENTAGE: {1 - truth_percentage:.4%}")
-        
-        return truth_percentage, debate_rounds, agents, framework
+        return truth_percentages, debate_rounds, agents, framework
     
+    def truth_series(self, evidence, framework_truth, cycles, agent_confidence=0.0):
+        weights = self.weights
+        combined_truth = (self.certainty_series(evidence, cycles) * weights["certainty"]) + \
+            (framework_truth/100 * weights["framework"]) + (agent_confidence * weights["agents"])
+        return np.clip(combined_truth, 0.01, 0.99)
+
+    def converge(self, evidence, framework_truth, max_cycles, tolerance, min_cycles=10, z=1.96,
+                 agent_confidence=0.0):
+        """truth_series that stops early once the z-interval of its mean is narrower than tolerance.
+
+        Draws min_cycles first, then as many more as the observed spread says
+        are needed, so the result is a prefix of the fixed-length series.
+        """
+        series = self.truth_series(evidence, framework_truth, min(max_cycles, max(2, min_cycles)), agent_confidence)
+        while len(series) < max_cycles:
+            spread = 2 * z * series.std(ddof=1)
+            if spread / np.sqrt(len(series)) <= tolerance:
+                break
+            needed = int(np.ceil((spread / tolerance) ** 2))
+            more = min(max_cycles, max(needed, len(series) + min_cycles)) - len(series)
+            series = np.concatenate([series, self.truth_series(evidence, framework_truth, more, agent_confidence)])
+        return series
+
     def visualize_debate(self, claim, debate_rounds, truth_percentage, cycle, framework):
-        try:
-            plt.figure(figsize=(14, 10))
-            G = nx.DiGraph()
-            positions = {}
-            node_colors = []
-            claim_label = claim[:25] + "..." if len(claim) > 25 else claim
-            
-            # Framework node
-            G.add_node(framework.name, type='framework')
-            positions[framework.name] = (0.5, 0.95)
-            node_colors.append('purple')
-            
-            # Claim node
-            G.add_node(claim_label, type='claim')
-            positions[claim_label] = (0.5, 0.85)
-            node_colors.append('red')
-            G.add_edge(framework.name, claim_label)
-            
-            y_pos = 0.75
-            for i, round_data in enumerate(debate_rounds):
-                agent = round_data['agent']
-                arg = round_data['arguments'][0][:40] + "..." if len(round_data['arguments'][0]) > 40 else round_data['arguments'][0]
-                confidence = round_data['confidence']
-                
-                G.add_node(agent, type='agent')
-                positions[agent] = (0.3, y_pos)
-                node_colors.append('skyblue')
-                G.add_edge(claim_label, agent)
-                
-                arg_node = f"{agent}_arg"
-                G.add_node(arg_node, type='argument')
-                positions[arg_node] = (0.7, y_pos)
-                node_colors.append('lightgreen' if confidence > 0.5 else 'lightcoral')
-                G.add_edge(agent, arg_node)
-                
-                y_pos -= 0.15
-            
-            truth_node = f"Truth: {truth_percentage:.2%}"
-            G.add_node(truth_node, type='conclusion')
-            positions[truth_node] = (0.5, 0.05)
-            node_colors.append('gold')
-            G.add_edge(claim_label, truth_node)
-            
-            # Transformation pathway
-            pathway = framework.transformation_pathway(claim)
-            pathway_node = "Transformation Pathway"
-            G.add_node(pathway_node, type='pathway')
-            positions[pathway_node] = (0.5, 0.15)
-            node_colors.append('orange')
-            G.add_edge(truth_node, pathway_node)
-            
-            nx.draw(G, positions, with_labels=True, node_size=3000, 
-                    node_color=node_colors, font_size=9, 
-                    arrowsize=20, arrowstyle='->')
-            
-            plt.title(f"Analysis: '{claim_label}'\nCycle {cycle+1} | Framework: {framework.name}", fontsize=16)
-            plt.tight_layout()
-            plt.savefig(f"analysis_{claim[:10]}_cycle_{cycle+1}.png")
-            plt.close()
-            
-            # Save transformation pathway
-            with open(f"pathway_{claim[:10]}_cycle_{cycle+1}.txt", "w") as f:
-                f.write(pathway)
-                
-            return True
-        except Exception as e:
-            print(f"Visualization error: {str(e)}")
-            return False
+        return render_spec(debate_spec(claim, debate_rounds, truth_percentage, cycle, framework))
 
 class SearchEngine:
-    def __init__(self, pages=100):
+    def __init__(self, pages=100, knowledge_base=None, rng=None, corpus=None):
         self.pages = pages
-        self.base_knowledge = {
-            "flat_earth": [
-                {"source": "NASA", "summary": "Space missions show Earth's spherical shape", "type": "scientific", "reliability": 0.99, "supports_claim": False},
-                {"source": "Historical Records", "summary": "Earth known to be spherical since ancient times", "type": "historical", "reliability": 0.95, "supports_claim": False},
-                {"source": "Conspiracy Site", "summary": "NASA images are fabrications", "type": "conspiracy", "reliability": 0.05, "supports_claim": True}
-            ],
-            "vaccine_microchips": [
-                {"source": "WHO", "summary": "Vaccines contain no microchips", "type": "scientific", "reliability": 0.97, "supports_claim": False},
-                {"source": "Tech Journal", "summary": "Microchips impossible to inject via vaccines", "type": "scientific", "reliability": 0.96, "supports_claim": False},
-                {"source": "Social Media", "summary": "Tracking chips admitted by executives", "type": "conspiracy", "reliability": 0.01, "supports_claim": True}
-            ],
-            "moon_landing": [
-                {"source": "NASA Archives", "summary": "Complete documentation of Apollo missions", "type": "historical", "reliability": 0.98, "supports_claim": True},
-                {"source": "Physics Review", "summary": "Analysis confirms feasibility of moon landing", "type": "scientific", "reliability": 0.96, "supports_claim": True},
-                {"source": "Conspiracy Forum", "summary": "Studio lighting visible in photos", "type": "conspiracy", "reliability": 0.02, "supports_claim": False}
-            ],
-            "pyramids_aliens": [
-                {"source": "Archaeology Journal", "summary": "Evidence shows pyramids built by ancient Egyptians", "type": "historical", "reliability": 0.92, "supports_claim": False},
-                {"source": "Alternative History", "summary": "Advanced technology required for pyramid construction", "type": "conspiracy", "reliability": 0.15, "supports_claim": True}
-            ]
-        }
+        self.rng = np.random.default_rng(rng)
+        self.events = NULL_EVENTS
+        self.knowledge_base = knowledge_base if knowledge_base is not None else default_knowledge_base()
+        # Ingested evidence (see ingest.EvidenceCorpus); claims found there skip generation
+        self.corpus = corpus
     
-    def generate_evidence(self, base_evidence):
-        evidence = []
-        for _ in range(self.pages):
-            template = random.choice(base_evidence).copy()
-            
-            # Modify reliability
-            template['reliability'] = max(0.01, min(0.99, template['reliability'] * random.uniform(0.9, 1.1)))
+    @property
+    def base_knowledge(self):
+        return BASE_KNOWLEDGE
+    
+    def generate_evidence(self, base_evidence, pages=None):
+        pages = self.pages if pages is None else pages
+        templates = EvidenceBatch.coerce(base_evidence)
+        rng = self.rng
+        picks = rng.integers(len(templates), size=pages)
+        
+        # Modify reliability
+        jitter = rng.uniform(0.9, 1.1, pages)
+        reliability = np.clip(templates.reliability[picks] * jitter, 0.01, 0.99).astype(np.float32)
+        
+        # Flip support with probability
+        flips = rng.random(pages) < 0.15
+        
+        # Modify summary: column 0 keeps the template text, columns 1-3 hold its synonym rewrites
+        rewrite = rng.random(pages) < 0.4
+        choices = rng.integers(SYNONYM_CHOICES, size=pages)
+        summaries = templates.summaries
+        variants = np.empty((len(templates), SYNONYM_CHOICES + 1), dtype=np.int32)
+        for t in range(len(templates)):
+            summary = summaries[templates.summary_codes[t]]
+            variants[t] = templates.summary_codes[t]
+            for word, replacements in SYNONYMS.items():
+                if word in summary:
+                    variants[t, 1:] = summaries.codes(summary.replace(word, r) for r in replacements)
+                    break
+        summary_codes = variants[picks, np.where(rewrite, choices + 1, 0)]
             
-            # Flip support with probability
-            if random.random() < 0.15:
-                template['supports_claim'] = not template['supports_claim']
-                
-            # Modify summary
-            if random.random() < 0.4:
-                synonyms = {
-                    "show": ["demonstrate", "prove", "confirm"],
-                    "impossible": ["not feasible", "impractical", "unachievable"],
-                    "evidence": ["proof", "data", "findings"],
-                    "ancient": ["historical", "archaic", "prehistoric"]
-                }
-                for word, replacements in synonyms.items():
-                    if word in template['summary']:
-                        template['summary'] = template['summary'].replace(word, random.choice(replacements))
-                        break
-                        
-            evidence.append(template)
-        return evidence
+        return EvidenceBatch(
+            reliability, templates.supports_claim[picks] ^ flips, templates.type_codes[picks],
+            templates.source_codes[picks], summary_codes,
+            templates.types, templates.sources, summaries
+        )
+    
+    def synthetic_evidence(self, claim, start=0, pages=None):
+        """Synthetic pages start+1..start+pages for claims missing from the knowledge base"""
+        pages = self.pages if pages is None else pages
+        types = StringTable(EVIDENCE_TYPES)
+        type_choices = types.codes(["scientific", "historical", "news", "social", "official"])
+        sources = StringTable()
+        summaries = StringTable()
+        rng = self.rng
+        reliability = rng.triangular(0.3, 0.8, 0.95, pages).astype(np.float32)
+        supports = rng.random(pages) < 0.3
+        type_codes = np.asarray(type_choices, dtype=np.uint8)[rng.integers(len(type_choices), size=pages)]
+        return EvidenceBatch(
+            reliability, supports, type_codes,
+            sources.codes(f"Source {i+1}" for i in range(start, start + pages)),
+            summaries.codes(f"Evidence point {i+1} about '{claim}'" for i in range(start, start + pages)),
+            types, sources, summaries, synthetic=True
+        )
     
     def search_claim(self, claim):
-        claim_key = claim.lower().replace("?", "").replace("'", "").replace(",", "").replace(" ", "_")
-        
-        if claim_key in self.base_knowledge:
-            return self.generate_evidence(self.base_knowledge[claim_key])
+        if self.corpus is not None and claim in self.corpus:
+            return self.corpus.evidence(claim, 0, self.pages)
+        templates = self.knowledge_base.lookup(claim)
+        if templates:
+            return self.generate_evidence(templates)
         
         # For unknown claims
-        print(f"\n🔍 Generating {self.pages} synthetic evidence pages...")
-        evidence = []
-        for i in range(self.pages):
-            reliability = random.triangular(0.3, 0.95, 0.8)
-            supports = random.random() < 0.3
-            evidence.append({
-                "source": f"Source {i+1}",
-                "summary": f"Evidence point {i+1} about '{claim}'",
-                "type": random.choice(["scientific", "historical", "news", "social", "official"]),
-                "reliability": reliability,
-                "supports_claim": supports
-            })
-        return evidence
+        self.events.emit("evidence.search", pages=self.pages, streaming=False)
+        return self.synthetic_evidence(claim)
+    
+    def iter_evidence(self, claim, chunk_size=65536):
+        """Yield the same evidence as search_claim in EvidenceBatch chunks of at most chunk_size rows"""
+        if self.corpus is not None and claim in self.corpus:
+            stop = min(self.pages, self.corpus.count(claim))
+            for start in range(0, stop, chunk_size):
+                yield self.corpus.evidence(claim, start, min(start + chunk_size, stop))
+            return
+        templates = self.knowledge_base.lookup(claim)
+        if not templates:
+            self.events.emit("evidence.search", pages=self.pages, streaming=True)
+        for start in range(0, self.pages, chunk_size):
+            pages = min(chunk_size, self.pages - start)
+            if templates:
+                yield self.generate_evidence(templates, pages)
+            else:
+                yield self.synthetic_evidence(claim, start, pages)
     
     def analyze_evidence(self, evidence):
-        analysis = {
-            "total": len(evidence),
-            "scientific": sum(1 for e in evidence if e['type'] == 'scientific'),
-            "reliable": sum(1 for e in evidence if e['reliability'] > 0.8),
-            "unreliable": sum(1 for e in evidence if e['reliability'] < 0.3),
-            "historical": sum(1 for e in evidence if e['type'] == 'historical'),
-            "conspiracy": sum(1 for e in evidence if e['type'] == 'conspiracy'),
-            "support": sum(1 for e in evidence if e['supports_claim']),
-            "oppose": sum(1 for e in evidence if not e['supports_claim'])
-        }
-        return analysis
+        return EvidenceStats.of(evidence).analysis()
@@ -0,0 +1,201 @@
+"""
+Event output for Quantum Truth Analysis System
+Analyses report progress as structured events (a name plus fields) rather
+than printing. An EventLog hands them to a sink: NullSink drops them,
+TextSink renders console text in buffered blocks and JsonLinesSink writes
+one JSON object per event for machines. NULL_EVENTS is the quiet mode
+used by batch and server workers: nothing is formatted, written or slept.
+"""
+import json
+import sys
+import time
+
+RULE = "=" * 60
+
+
+def _analysis_start(e):
+    return [f"\n{RULE}", f"TRUTH ANALYSIS: {e['claim']}", f"Pages: {e['pages']} | Cycles: {e['cycles']}",
+            f"Timestamp: {e['timestamp']}", RULE]
+
+
+def _evidence_summary(e):
+    return ["\n=== EVIDENCE ANALYSIS ===",
+            f"Total sources: {e['total']}",
+            f"Scientific: {e['scientific']}",
+            f"Reliable sources: {e['reliable']}",
+            f"Unreliable sources: {e['unreliable']}",
+            f"Historical: {e['historical']}",
+            f"Conspiracy: {e['conspiracy']}",
+            f"Supporting: {e['support']} | Opposing: {e['oppose']}"]
+
+
+def _debate_start(e):
+    return ([f"\n=== Debate: '{e['claim']}' ===", f"Framework: {e['framework']}", "Debating agents:"] +
+            [f"- {role} ({expertise})" for role, expertise in e["agents"]])
+
+
+def _debate_argument(e):
+    return ([f"\n{e['agent']}: {e['arguments'][0]}"] + [f"  - {arg}" for arg in e["arguments"][1:]] +
+            [f"Confidence: {e['confidence']:.0%}"])
+
+
+def _analysis_verdict(e):
+    return [f"\n{RULE}",
+            f"FINAL VERDICT AFTER {e['cycles_used']} CYCLES: {e['verdict']}",
+            f"Average Truth Confidence: {e['truth_percentage_avg']:.4%} ± {e['truth_percentage_std']:.4%}",
+            f"Evidence Processed: {e['pages']} pages",
+            f"Framework: {e['framework']}",
+            f"Execution Time: {e['execution_time']:.2f} seconds",
+            "\n=== TRANSFORMATION PATHWAY ===",
+            e["pathway"],
+            RULE]
+
+
+TEXT_FORMATS = {
+    "analysis.start": _analysis_start,
+    "analysis.cached": lambda e: [f"\n♻️  Cached verdict for '{e['claim']}': {e['verdict']} "
+                                  f"({e['truth_percentage_avg']:.4%})"],
+    "evidence.search": lambda e: [f"\n🔍 {'Streaming' if e['streaming'] else 'Generating'} "
+                                  f"{e['pages']} synthetic evidence pages..."],
+    "evidence.progress": lambda e: [f"   {e['done']}/{e['total']} pages | partial truth {e['truth_percentage']:.2%}"],
+    "evidence.summary": _evidence_summary,
+    "debate.start": _debate_start,
+    "debate.argument": _debate_argument,
+    "agent.error": lambda e: [f"Error in {e['agent']} agent: {e['error']}"],
+    "debate.conclusion": lambda e: ["\n=== Debate Conclusion ===", f"Claim: '{e['claim']}'",
+                                    f"TRUTH PERCENTAGE: {e['truth_percentage']:.4%}",
+                                    f"FICTION PERCENTAGE: {1 - e['truth_percentage']:.4%}"],
+    "analysis.verdict": _analysis_verdict,
+    "batch.progress": lambda e: [f"   {e['done']} claims analyzed"],
+}
+
+
+class NullSink:
+    def write(self, event, fields):
+        pass
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+class TextSink:
+    """Console text built from TEXT_FORMATS.
+
+    Lines are buffered and written in one block per flush (or every
+    buffer_size lines), not one write per line. pause sleeps after every
+    debate argument for interactive pacing; it is off by default.
+    """
+    def __init__(self, stream=None, buffer_size=256, pause=0.0):
+        self._stream = stream
+        self.buffer_size = buffer_size
+        self.pause = pause
+        self._lines = []
+
+    @property
+    def stream(self):
+        # Resolved per write so redirected or patched stdout is honoured
+        return self._stream if self._stream is not None else sys.stdout
+
+    def write(self, event, fields):
+        format_event = TEXT_FORMATS.get(event)
+        if format_event is None:
+            self._lines.append(f"{event}: " + ", ".join(f"{name}={value}" for name, value in fields.items()))
+        else:
+            self._lines.extend(format_event(fields))
+        if self.pause and event == "debate.argument":
+            self.flush()
+            time.sleep(self.pause)
+        elif len(self._lines) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            lines, self._lines = self._lines, []
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+
+    def isatty(self):
+        return getattr(self.stream, "isatty", lambda: False)()
+
+
+class JsonLinesSink(TextSink):
+    """One {"event", "time", ...fields} JSON object per line, buffered like TextSink"""
+    def __init__(self, stream=None, buffer_size=256):
+        super().__init__(stream, buffer_size)
+
+    def write(self, event, fields):
+        self._lines.append(json.dumps({"event": event, "time": time.time(), **fields}, default=_json_default))
+        if len(self._lines) >= self.buffer_size:
+            self.flush()
+
+
+def _json_default(value):
+    # numpy scalars and arrays
+    return value.tolist() if hasattr(value, "tolist") else str(value)
+
+
+SINKS = {
+    "text": TextSink,
+    "jsonl": JsonLinesSink,
+    "none": NullSink,
+}
+
+
+class EventLog:
+    """Hands events to a sink.
+
+    progress() events are rate-limited to one per progress_interval
+    seconds per event name (the final one, done == total, always passes)
+    and are off unless the sink writes to a terminal or progress=True.
+    """
+    enabled = True
+
+    def __init__(self, sink=None, progress=None, progress_interval=0.5):
+        self.sink = sink if sink is not None else TextSink()
+        self.progress_enabled = self.sink.isatty() if progress is None else progress
+        self.progress_interval = progress_interval
+        self._last_progress = {}
+
+    def emit(self, event, **fields):
+        self.sink.write(event, fields)
+
+    def progress(self, event, done, total=None, **fields):
+        if not self.progress_enabled:
+            return
+        now = time.monotonic()
+        last = self._last_progress.get(event)
+        if last is not None and now - last < self.progress_interval and (total is None or done < total):
+            return
+        self._last_progress[event] = now
+        self.sink.write(event, dict(fields, done=done, total=total))
+        self.sink.flush()
+
+    def flush(self):
+        self.sink.flush()
+
+
+class NullEvents:
+    enabled = False
+    progress_enabled = False
+
+    def emit(self, event, **fields):
+        pass
+
+    def progress(self, event, done, total=None, **fields):
+        pass
+
+    def flush(self):
+        pass
+
+
+NULL_EVENTS = NullEvents()
+
+
+def event_log(kind="text", stream=None, **options):
+    """EventLog for a SINKS name; "none" gives NULL_EVENTS"""
+    if kind == "none":
+        return NULL_EVENTS
+    return EventLog(SINKS[kind](stream), **options)
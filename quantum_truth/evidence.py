@@ -0,0 +1,316 @@
+"""
+Columnar evidence storage for Quantum Truth Analysis System
+Evidence is held as struct-of-arrays instead of one dict per page.
+"""
+import numpy as np
+
+EVIDENCE_FIELDS = ("source", "summary", "type", "reliability", "supports_claim")
+EVIDENCE_TYPES = ("scientific", "historical", "conspiracy", "news", "social", "official")
+# type_codes are uint8
+MAX_TYPES = 256
+
+
+class StringTable:
+    """Interned string pool mapping each distinct value to an int32 code"""
+    def __init__(self, values=()):
+        self.values = []
+        self.index = {}
+        for value in values:
+            self.intern(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, code):
+        return self.values[code]
+
+    def intern(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.index[value] = code
+            self.values.append(value)
+        return code
+
+    def codes(self, values):
+        return np.fromiter((self.intern(v) for v in values), dtype=np.int32)
+
+    def code_of(self, value):
+        return self.index.get(value, -1)
+
+
+class EvidenceBatch:
+    """Evidence pages stored column-wise.
+
+    Iterating or indexing with an int yields the legacy evidence dicts, so
+    code written against lists of dicts keeps working unchanged. weight,
+    when set, is how many pages each row stands for (see dedup); None
+    means one page per row. synthetic marks generated placeholder pages,
+    whose numbered sources are not real sources.
+    """
+    def __init__(self, reliability, supports_claim, type_codes, source_codes, summary_codes,
+                 types=None, sources=None, summaries=None, weight=None, synthetic=False):
+        self.reliability = np.asarray(reliability, dtype=np.float32)
+        self.supports_claim = np.asarray(supports_claim, dtype=bool)
+        self.type_codes = np.asarray(type_codes, dtype=np.uint8)
+        self.source_codes = np.asarray(source_codes, dtype=np.int32)
+        self.summary_codes = np.asarray(summary_codes, dtype=np.int32)
+        self.types = types if types is not None else StringTable(EVIDENCE_TYPES)
+        if len(self.types) > MAX_TYPES:
+            raise ValueError(f"At most {MAX_TYPES} distinct evidence types are supported, got {len(self.types)}")
+        self.sources = sources if sources is not None else StringTable()
+        self.summaries = summaries if summaries is not None else StringTable()
+        self.weight = np.asarray(weight, dtype=np.int64) if weight is not None else None
+        self.synthetic = synthetic
+
+    @classmethod
+    def empty(cls):
+        return cls.from_records([])
+
+    @classmethod
+    def from_records(cls, records, types=None, sources=None, summaries=None):
+        types = types if types is not None else StringTable(EVIDENCE_TYPES)
+        sources = sources if sources is not None else StringTable()
+        summaries = summaries if summaries is not None else StringTable()
+        records = list(records)
+        return cls(
+            np.fromiter((r['reliability'] for r in records), dtype=np.float32, count=len(records)),
+            np.fromiter((bool(r['supports_claim']) for r in records), dtype=bool, count=len(records)),
+            types.codes(r['type'] for r in records).astype(np.uint8),
+            sources.codes(r['source'] for r in records),
+            summaries.codes(r['summary'] for r in records),
+            types, sources, summaries
+        )
+
+    @classmethod
+    def coerce(cls, evidence):
+        if isinstance(evidence, cls):
+            return evidence
+        if not evidence:
+            return cls.empty()
+        return cls.from_records(evidence)
+
+    def __len__(self):
+        return len(self.reliability)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.record(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.record(key)
+        return self.take(key)
+
+    def __repr__(self):
+        return (f"EvidenceBatch(rows={len(self)}, pages={self.pages}, sources={len(self.sources)}, "
+                f"summaries={len(self.summaries)})")
+
+    @property
+    def pages(self):
+        """Pages represented, counting each row weight times"""
+        return len(self) if self.weight is None else int(self.weight.sum())
+
+    def record(self, i):
+        return {
+            "source": self.sources[self.source_codes[i]],
+            "summary": self.summaries[self.summary_codes[i]],
+            "type": self.types[self.type_codes[i]],
+            "reliability": float(self.reliability[i]),
+            "supports_claim": bool(self.supports_claim[i])
+        }
+
+    def to_records(self):
+        return list(self)
+
+    def take(self, index):
+        """Row subset (slice, mask or index array) sharing this batch's string tables"""
+        return EvidenceBatch(
+            self.reliability[index], self.supports_claim[index], self.type_codes[index],
+            self.source_codes[index], self.summary_codes[index],
+            self.types, self.sources, self.summaries,
+            self.weight[index] if self.weight is not None else None, self.synthetic
+        )
+
+    def type_mask(self, evidence_type):
+        code = self.types.code_of(evidence_type)
+        if code < 0:
+            return np.zeros(len(self), dtype=bool)
+        return self.type_codes == code
+
+    def first_index(self, mask):
+        """Index of the first row selected by mask, or -1"""
+        hits = np.flatnonzero(mask)
+        return int(hits[0]) if len(hits) else -1
+
+
+class EvidenceStats:
+    """Running sufficient statistics over evidence.
+
+    Holds every count and sum that analyze_evidence, calculate_certainty
+    and the debate agents need, so evidence can be consumed chunk by chunk
+    in constant memory. Chunks must be fed in evidence order: the first
+    row seen anchors the consistency measure and the FactChecker citation.
+    Per-source tallies keep at most MAX_SOURCES sources, favouring the
+    busiest, so a long tail of one-off sources cannot grow them unbounded.
+    synthetic is set once any synthetic evidence has been counted.
+    Weighted rows count weight times. to_dict/from_dict persist the stats
+    so later evidence can be merged without revisiting the earlier rows.
+    """
+    VERIFIED_THRESHOLD = 0.7
+    RELIABLE_THRESHOLD = 0.8
+    UNRELIABLE_THRESHOLD = 0.3
+    MAX_SOURCES = 256
+    FIELDS = ("total", "reliability_sum", "support", "reliable", "unreliable", "verified", "type_counts",
+              "type_reliability", "type_support", "source_counts", "source_support", "first_support",
+              "first_verified", "synthetic")
+
+    def __init__(self):
+        self.total = 0
+        self.reliability_sum = 0.0
+        self.support = 0
+        self.reliable = 0
+        self.unreliable = 0
+        self.verified = 0
+        self.type_counts = {}
+        self.type_reliability = {}
+        self.type_support = {}
+        self.source_counts = {}
+        self.source_support = {}
+        self.first_support = None
+        self.first_verified = None
+        self.synthetic = False
+
+    @classmethod
+    def of(cls, evidence):
+        """Stats for evidence given as stats, an EvidenceBatch or a list of dicts"""
+        if isinstance(evidence, cls):
+            return evidence
+        stats = cls()
+        stats.update(EvidenceBatch.coerce(evidence))
+        return stats
+
+    def __len__(self):
+        return self.total
+
+    def to_dict(self):
+        """JSON-serializable state; from_dict restores it exactly"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, state):
+        stats = cls()
+        for name in cls.FIELDS:
+            # Fields added later keep their defaults when restoring older state
+            value = state.get(name, getattr(stats, name))
+            setattr(stats, name, dict(value) if isinstance(value, dict) else value)
+        return stats
+
+    def update(self, batch):
+        batch = EvidenceBatch.coerce(batch)
+        if not len(batch):
+            return self
+        reliability = batch.reliability
+        supports = batch.supports_claim
+        weight = batch.weight
+        if weight is None:
+            count = np.count_nonzero
+            weighted_reliability = reliability
+        else:
+            count = lambda mask: weight[mask].sum()
+            weighted_reliability = reliability * weight
+        self.total += batch.pages
+        self.synthetic = self.synthetic or batch.synthetic
+        self.reliability_sum += float(weighted_reliability.sum(dtype=np.float64))
+        self.support += int(count(supports))
+        self.reliable += int(count(reliability > self.RELIABLE_THRESHOLD))
+        self.unreliable += int(count(reliability < self.UNRELIABLE_THRESHOLD))
+        verified = reliability > self.VERIFIED_THRESHOLD
+        self.verified += int(count(verified))
+        support_weight = None if weight is None else weight[supports]
+
+        codes = batch.type_codes
+        counts = np.bincount(codes, weights=weight, minlength=len(batch.types))
+        reliability_sums = np.bincount(codes, weights=weighted_reliability, minlength=len(batch.types))
+        support_counts = np.bincount(codes[supports], weights=support_weight, minlength=len(batch.types))
+        for code in np.flatnonzero(counts):
+            name = batch.types[code]
+            self.type_counts[name] = self.type_counts.get(name, 0) + int(counts[code])
+            self.type_reliability[name] = self.type_reliability.get(name, 0.0) + float(reliability_sums[code])
+            self.type_support[name] = self.type_support.get(name, 0) + int(support_counts[code])
+
+        codes = batch.source_codes
+        used = None
+        if len(batch.sources) > 4 * len(batch):
+            # A slice of a large shared table (an ingested corpus): count only the codes present
+            used, codes = np.unique(codes, return_inverse=True)
+            codes = codes.ravel()
+        sources = len(used) if used is not None else len(batch.sources)
+        counts = np.bincount(codes, weights=weight, minlength=sources)
+        support_counts = np.bincount(codes[supports], weights=support_weight, minlength=sources)
+        busiest = np.flatnonzero(counts)
+        if len(busiest) > self.MAX_SOURCES:
+            busiest = busiest[np.argsort(-counts[busiest], kind="stable")[:self.MAX_SOURCES]]
+        for code in busiest:
+            name = batch.sources[used[code] if used is not None else code]
+            self._add_source(name, int(counts[code]), int(support_counts[code]))
+
+        if self.first_support is None:
+            self.first_support = bool(supports[0])
+        if self.first_verified is None:
+            first = batch.first_index(verified)
+            if first >= 0:
+                record = batch[first]
+                self.first_verified = {"source": record["source"], "summary": record["summary"]}
+        return self
+
+    def merge(self, other):
+        """Fold in stats for evidence that comes after this evidence"""
+        self.total += other.total
+        self.synthetic = self.synthetic or other.synthetic
+        self.reliability_sum += other.reliability_sum
+        self.support += other.support
+        self.reliable += other.reliable
+        self.unreliable += other.unreliable
+        self.verified += other.verified
+        for name, count in other.type_counts.items():
+            self.type_counts[name] = self.type_counts.get(name, 0) + count
+            self.type_reliability[name] = self.type_reliability.get(name, 0.0) + other.type_reliability[name]
+            self.type_support[name] = self.type_support.get(name, 0) + other.type_support[name]
+        for name, count in other.source_counts.items():
+            self._add_source(name, count, other.source_support[name])
+        if self.first_support is None:
+            self.first_support = other.first_support
+        if self.first_verified is None:
+            self.first_verified = other.first_verified
+        return self
+
+    def _add_source(self, name, count, support):
+        if name not in self.source_counts:
+            if len(self.source_counts) >= self.MAX_SOURCES:
+                return
+            self.source_counts[name] = self.source_support[name] = 0
+        self.source_counts[name] += count
+        self.source_support[name] += support
+
+    def count(self, evidence_type):
+        return self.type_counts.get(evidence_type, 0)
+
+    @property
+    def contradictions(self):
+        """Rows whose support disagrees with the first row's"""
+        if self.first_support is None:
+            return 0
+        return self.total - self.support if self.first_support else self.support
+
+    def analysis(self):
+        return {
+            "total": self.total,
+            "scientific": self.count('scientific'),
+            "reliable": self.reliable,
+            "unreliable": self.unreliable,
+            "historical": self.count('historical'),
+            "conspiracy": self.count('conspiracy'),
+            "support": self.support,
+            "oppose": self.total - self.support
+        }
@@ -1,39 +1,107 @@
+import re
+from functools import lru_cache
+
+CORE_AXIOMS = {
+    "Scientific_Empirical": [
+        "Earth_Orbits_Sun",
+        "Energy_Conservation",
+        "Natural_Selection",
+        "Gravity"
+    ],
+    "Historical_Consensus": [
+        "Pyramids_Built_by_Egyptians",
+        "Moon_Landing_Occurred",
+        "Industrial_Revolution_Origin"
+    ],
+    "Ethical_Framework": [
+        "Truthfulness_Required",
+        "Greater_Good_Priority",
+        "Individual_Rights"
+    ]
+}
+MAX_LISTED_CONFLICTS = 10
+
+
+def list_conflicts(conflicts):
+    """Comma-separated conflicts: the first MAX_LISTED_CONFLICTS, then how many more"""
+    listed = ", ".join(conflicts[:MAX_LISTED_CONFLICTS])
+    if len(conflicts) > MAX_LISTED_CONFLICTS:
+        listed += f" and {len(conflicts) - MAX_LISTED_CONFLICTS} more"
+    return listed
+
+
+def normalize_axiom(text):
+    """'Earth_Orbits_Sun', 'earth orbits sun' and 'Earth-orbits-Sun!' share one key"""
+    return " ".join(re.sub(r"[\W_]+", " ", text.lower()).split())
+
+
 class AxiomaticFramework:
-    """Axiomatic Truth/Fantasy Regulator Framework"""
-    def __init__(self, name, core_axioms):
+    """Axiomatic Truth/Fantasy Regulator Framework
+
+    Axioms are compiled into a hash index of normalized keys, so evaluating
+    a statement is one lookup regardless of how many axioms there are.
+    Evaluations are memoized and the framework holds no per-call state,
+    so one instance can be shared between threads and engines.
+    """
+    def __init__(self, name, core_axioms, memo_size=4096):
         self.name = name
-        self.core_axioms = core_axioms
-        self.conflicts = []
-        self.truth_percentage = 100.0
-        
+        self.memo_size = memo_size
+        self._compile(core_axioms)
+
+    def _compile(self, core_axioms):
+        self.core_axioms = tuple(core_axioms)
+        self._index = {}
+        for axiom in self.core_axioms:
+            self._index.setdefault(normalize_axiom(axiom), axiom)
+        self._evaluate = lru_cache(maxsize=self.memo_size)(self._evaluate_key)
+
+    def add_axioms(self, axioms):
+        self._compile(self.core_axioms + tuple(axioms))
+
     def evaluate_statement(self, statement):
         """Evaluate statement against framework axioms"""
-        conflicts = []
-        for axiom in self.core_axioms:
-            if axiom != statement:
-                conflicts.append(axiom)
-        
-        if conflicts:
-            self.conflicts = conflicts
-            self.truth_percentage = max(1.05, 100 - (len(conflicts) * 30))
-        else:
-            self.conflicts = []
-            self.truth_percentage = 100.0
-            
-        return self.truth_percentage, conflicts
-    
+        return self._evaluate(normalize_axiom(statement))
+
+    def _evaluate_key(self, key):
+        if key in self._index:
+            return 100.0, ()
+        # A statement outside the axiom set has to be reconciled with every axiom
+        conflicts = self.core_axioms
+        if not conflicts:
+            return 100.0, ()
+        return max(1.05, 100 - (len(conflicts) * 30)), conflicts
+
+    def cache_info(self):
+        return self._evaluate.cache_info()
+
     def transformation_pathway(self, statement):
         """Generate transformation pathway to resolve conflicts"""
-        if not self.conflicts:
+        _, conflicts = self.evaluate_statement(statement)
+        if not conflicts:
             return "No transformation needed - axiom-compatible"
-            
+
+        existing = list_conflicts(conflicts)
         pathway = [
             f"To integrate '{statement}' into '{self.name}' framework:",
             "1. Framework Reconciliation: Resolve conflicts between:",
             f"   - Proposed: {statement}",
-            f"   - Existing: {', '.join(self.conflicts)}",
+            f"   - Existing: {existing}",
             "2. Constructual Diplomacy: Re-evaluate framework core principles",
             "3. Multi-Perspective Integration: Create bridging axioms",
             "4. Axiomogenesis: Reweave internal reality to integrate new truth"
         ]
         return "\n".join(pathway)
+
+
+def evaluate_all(frameworks, statement):
+    """Evaluate statement against every framework, normalizing it once.
+
+    frameworks is a mapping of name -> AxiomaticFramework; returns
+    name -> (truth_percentage, conflicts).
+    """
+    key = normalize_axiom(statement)
+    return {name: framework._evaluate(key) for name, framework in frameworks.items()}
+
+
+def default_frameworks():
+    return {name: AxiomaticFramework(name, axioms) for name, axioms in CORE_AXIOMS.items()}
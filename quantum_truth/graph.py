@@ -0,0 +1,197 @@
+"""
+Cross-claim truth graph for Quantum Truth Analysis System
+Claims, sources and frameworks are nodes. Every analysis appends its edges
+(source -supports/opposes-> claim, claim -evaluated-> framework) to an
+SQLite file in one transaction, so the graph grows incrementally across
+runs and processes. Queries are indexed joins over the edge log rather
+than an in-memory graph, so they stay fast as edges accumulate.
+The graph is opt-in: NULL_GRAPH records nothing and answers every query
+with no results.
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from .cache import claim_digest
+
+
+class TruthGraph:
+    """Append-only claim/source/framework graph.
+
+    path is an SQLite file (":memory:" for a private in-memory graph). The
+    database is opened on first use, so an unused graph costs nothing.
+    """
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._ids = {}
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            if self.path != ":memory:":
+                # WAL lets worker processes append while others query
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS nodes (
+                    id INTEGER PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    UNIQUE (kind, key)
+                );
+                CREATE TABLE IF NOT EXISTS analyses (
+                    id INTEGER PRIMARY KEY,
+                    claim INTEGER NOT NULL,
+                    framework INTEGER NOT NULL,
+                    truth REAL NOT NULL,
+                    verdict TEXT,
+                    pages INTEGER,
+                    timestamp TEXT
+                );
+                CREATE TABLE IF NOT EXISTS edges (
+                    analysis INTEGER NOT NULL,
+                    src INTEGER NOT NULL,
+                    dst INTEGER NOT NULL,
+                    relation TEXT NOT NULL,
+                    weight REAL
+                );
+                CREATE INDEX IF NOT EXISTS edges_src ON edges (src, relation);
+                CREATE INDEX IF NOT EXISTS edges_dst ON edges (dst, relation);
+                CREATE INDEX IF NOT EXISTS analyses_claim ON analyses (claim);
+            """)
+        return self._conn
+
+    def add_analysis(self, claim, framework, stats, truth, verdict=None):
+        """Append one analysis: the claim's sources with their stance and its framework score.
+
+        Synthetic evidence has numbered placeholder sources, not real ones,
+        so only its framework score is recorded.
+        """
+        with self._lock, self.conn:
+            claim_id = self._node("claim", claim_digest(claim), claim)
+            framework_id = self._node("framework", framework, framework)
+            analysis_id = self.conn.execute(
+                "INSERT INTO analyses (claim, framework, truth, verdict, pages, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                (claim_id, framework_id, float(truth), verdict, stats.total, datetime.now().isoformat())
+            ).lastrowid
+            edges = [(analysis_id, claim_id, framework_id, "evaluated", float(truth))]
+            for source, count in ({} if stats.synthetic else stats.source_counts).items():
+                stance = "supports" if stats.source_support[source] * 2 >= count else "opposes"
+                edges.append((analysis_id, self._node("source", source, source), claim_id, stance, count))
+            self.conn.executemany(
+                "INSERT INTO edges (analysis, src, dst, relation, weight) VALUES (?, ?, ?, ?, ?)", edges)
+        return analysis_id
+
+    def sources(self, claim):
+        """{source: stance} for claim, from its most recent analysis of each source"""
+        rows = self._query("""
+            SELECT s.label, e.relation FROM edges e JOIN nodes s ON s.id = e.src
+            WHERE e.dst = ? AND e.relation IN ('supports', 'opposes') ORDER BY e.analysis
+        """, claim)
+        return dict(rows)
+
+    def related_claims(self, claim, limit=10):
+        """[(claim, shared source count)] for claims citing the same sources, most shared first"""
+        return self._query("""
+            SELECT c.label, COUNT(DISTINCT b.src) AS shared
+            FROM edges a JOIN edges b ON b.src = a.src AND b.dst != a.dst JOIN nodes c ON c.id = b.dst
+            WHERE a.dst = ? AND a.relation IN ('supports', 'opposes') AND b.relation IN ('supports', 'opposes')
+            GROUP BY b.dst ORDER BY shared DESC, c.label LIMIT ?
+        """, claim, limit)
+
+    def shared_sources(self, claim, other):
+        """Sources cited by both claims"""
+        with self._lock:
+            other_id = self._node_id("claim", claim_digest(other))
+        return [row[0] for row in self._query("""
+            SELECT DISTINCT s.label FROM edges a JOIN edges b ON b.src = a.src JOIN nodes s ON s.id = a.src
+            WHERE a.dst = ? AND b.dst = ? AND a.relation IN ('supports', 'opposes')
+              AND b.relation IN ('supports', 'opposes')
+            ORDER BY s.label
+        """, claim, other_id)]
+
+    def contradictions(self, claim, limit=10):
+        """[(claim, source)] where a source backing one side of claim takes the other side of a neighbour"""
+        return self._query("""
+            SELECT DISTINCT c.label, s.label
+            FROM edges a JOIN edges b ON b.src = a.src AND b.dst != a.dst AND b.relation != a.relation
+            JOIN nodes c ON c.id = b.dst JOIN nodes s ON s.id = a.src
+            WHERE a.dst = ? AND a.relation IN ('supports', 'opposes') AND b.relation IN ('supports', 'opposes')
+            ORDER BY c.label, s.label LIMIT ?
+        """, claim, limit)
+
+    def history(self, claim):
+        """Every recorded analysis of claim, oldest first"""
+        rows = self._query("""
+            SELECT f.label, a.truth, a.verdict, a.pages, a.timestamp
+            FROM analyses a JOIN nodes f ON f.id = a.framework WHERE a.claim = ? ORDER BY a.id
+        """, claim)
+        return [dict(zip(("framework", "truth_percentage", "verdict", "pages", "timestamp"), row)) for row in rows]
+
+    def stats(self):
+        with self._lock:
+            count = lambda table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            return {"nodes": count("nodes"), "edges": count("edges"), "analyses": count("analyses")}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._ids.clear()
+
+    def _node(self, kind, key, label):
+        node_id = self._node_id(kind, key)
+        if node_id is None:
+            self.conn.execute("INSERT OR IGNORE INTO nodes (kind, key, label) VALUES (?, ?, ?)", (kind, key, label))
+            node_id = self._node_id(kind, key)
+        return node_id
+
+    def _node_id(self, kind, key):
+        # Nodes are never removed, so ids can be remembered once seen
+        node_id = self._ids.get((kind, key))
+        if node_id is None:
+            row = self.conn.execute("SELECT id FROM nodes WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+            if row:
+                node_id = self._ids[(kind, key)] = row[0]
+        return node_id
+
+    def _query(self, sql, claim, *params):
+        with self._lock:
+            claim_id = self._node_id("claim", claim_digest(claim))
+            if claim_id is None:
+                return []
+            return self.conn.execute(sql, (claim_id,) + params).fetchall()
+
+
+class NullGraph:
+    path = None
+
+    def add_analysis(self, claim, framework, stats, truth, verdict=None):
+        return None
+
+    def sources(self, claim):
+        return {}
+
+    def related_claims(self, claim, limit=10):
+        return []
+
+    def shared_sources(self, claim, other):
+        return []
+
+    def contradictions(self, claim, limit=10):
+        return []
+
+    def history(self, claim):
+        return []
+
+    def stats(self):
+        return {"nodes": 0, "edges": 0, "analyses": 0}
+
+    def close(self):
+        pass
+
+
+NULL_GRAPH = NullGraph()
@@ -0,0 +1,146 @@
+"""
+Minimal asyncio HTTP/1.1 plumbing for Quantum Truth Analysis System
+Just enough of the protocol for JSON request/response traffic over
+keep-alive connections: a pooled client and a request handler loop for
+servers. Bodies must carry Content-Length; chunked encoding is not used.
+"""
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+MAX_HEADER_LINES = 100
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           429: "Too Many Requests", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, body=b""):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.body = body
+
+
+async def _read_headers(reader):
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("connection closed while reading headers")
+        line = line.decode("latin-1").rstrip("\r\n")
+        if not line:
+            return headers
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise HTTPError(400)
+
+
+async def _read_body(reader, headers):
+    length = int(headers.get("content-length", 0))
+    return await reader.readexactly(length) if length else b""
+
+
+def _encode(start_line, headers, body):
+    lines = [start_line] + [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class ConnectionPool:
+    """Keep-alive connections to a single HTTP origin, capped at max_connections"""
+    def __init__(self, base_url, max_connections=8):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.unix_socket = None
+        if parts.scheme == "unix":
+            # unix:///path/to/socket -> requests go to the socket with root paths
+            self.unix_socket = parts.path
+            self.base_path = ""
+        elif parts.scheme not in ("http", ""):
+            raise ValueError(f"Unsupported URL scheme '{parts.scheme}'")
+        self._idle = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def request(self, method, path, payload=None, headers=None):
+        """Send a JSON request and return (status, decoded JSON body or None)"""
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        request_headers = {
+            "Host": f"{self.host}:{self.port}",
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive",
+        }
+        request_headers.update(headers or {})
+        data = _encode(f"{method} {self.base_path}{path} HTTP/1.1", request_headers, body)
+
+        async with self._slots:
+            reader, writer = await self._acquire()
+            try:
+                writer.write(data)
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line:
+                    raise ConnectionError("connection closed before response")
+                status = int(status_line.split()[1])
+                response_headers = await _read_headers(reader)
+                response_body = await _read_body(reader, response_headers)
+            except BaseException:
+                writer.close()
+                raise
+            if response_headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+        return status, json.loads(response_body) if response_body else None
+
+    async def _acquire(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        if self.unix_socket:
+            return await asyncio.open_unix_connection(self.unix_socket)
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+def json_handler(route):
+    """Wrap route(method, path, payload) -> (status, payload) as an asyncio stream handler"""
+    async def handle(reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                    headers = await _read_headers(reader)
+                    body = await _read_body(reader, headers)
+                    payload = json.loads(body) if body else None
+                    status, response = await route(method, path, payload)
+                except HTTPError as e:
+                    status, response = e.status, {"error": REASONS.get(e.status, "Error")}
+                except ValueError:
+                    status, response = 400, {"error": "Malformed request"}
+                response_body = json.dumps(response).encode("utf-8")
+                writer.write(_encode(f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}", {
+                    "Content-Type": "application/json",
+                    "Content-Length": str(len(response_body)),
+                    "Connection": "keep-alive",
+                }, response_body))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    return handle
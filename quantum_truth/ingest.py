@@ -0,0 +1,425 @@
+"""
+Evidence ingestion for Quantum Truth Analysis System
+Bulk-loads evidence dumps (JSON lines or CSV with claim, source, summary,
+type, reliability and supports_claim fields) into an on-disk corpus:
+
+    corpus/
+      manifest.json            claim digest -> [claim, first row, rows]
+      <column>.npy             one array per EvidenceBatch column, rows grouped by claim
+      sources.bin, summaries.bin            UTF-8 string pools
+      sources.offsets.npy, summaries.offsets.npy
+
+Files are split into newline-aligned byte ranges that worker processes
+parse, validate and coerce in parallel. EvidenceCorpus memory-maps the
+result, so a claim's evidence is a zero-copy slice of every column.
+CSV records must not contain line breaks.
+"""
+import csv
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .cache import claim_digest
+from .evidence import EvidenceBatch, StringTable, EVIDENCE_TYPES
+
+MANIFEST = "manifest.json"
+FIELDS = ("claim", "source", "summary", "type", "reliability", "supports_claim")
+# Column name -> dtype, matching EvidenceBatch
+COLUMNS = {
+    "reliability": np.float32,
+    "supports_claim": np.bool_,
+    "type_codes": np.uint8,
+    "source_codes": np.int32,
+    "summary_codes": np.int32,
+}
+STRING_POOLS = ("sources", "summaries")
+TRUE_VALUES = frozenset(("true", "1", "yes", "y", "t"))
+FALSE_VALUES = frozenset(("false", "0", "no", "n", "f"))
+CHUNK_BYTES = 32 << 20
+MAX_ERROR_SAMPLES = 20
+# Rows gathered per block when sorting spilled rows into claim order
+SORT_BLOCK = 1 << 20
+
+
+def coerce_row(row):
+    """Validated (claim, source, summary, type, reliability, supports_claim); raises ValueError"""
+    missing = [name for name in FIELDS if row.get(name) in (None, "")]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    claim, source, summary = (str(row[name]).strip() for name in ("claim", "source", "summary"))
+    if not claim or not source or not summary:
+        raise ValueError("claim, source and summary must not be blank")
+    evidence_type = str(row["type"]).strip().lower()
+    if evidence_type not in EVIDENCE_TYPES:
+        raise ValueError(f"unknown type '{row['type']}'")
+    try:
+        reliability = float(row["reliability"])
+    except (TypeError, ValueError):
+        raise ValueError(f"reliability '{row['reliability']}' is not a number")
+    if not 0.0 <= reliability <= 1.0:
+        raise ValueError(f"reliability {reliability} outside [0, 1]")
+    supports = row["supports_claim"]
+    if not isinstance(supports, bool):
+        text = str(supports).strip().lower()
+        if text not in TRUE_VALUES and text not in FALSE_VALUES:
+            raise ValueError(f"supports_claim '{supports}' is not a boolean")
+        supports = text in TRUE_VALUES
+    return claim, source, summary, evidence_type, reliability, supports
+
+
+def plan_chunks(paths, chunk_bytes=CHUNK_BYTES):
+    """(path, format, header, start, end) byte ranges covering every file"""
+    chunks = []
+    for path in paths:
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+        header = None
+        if fmt == "csv":
+            with open(path, newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f), None)
+            if header is None:
+                continue
+            header = [name.strip() for name in header]
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), chunk_bytes):
+            chunks.append((path, fmt, header, start, min(size, start + chunk_bytes)))
+    return chunks
+
+
+def _read_lines(path, start, end):
+    """Lines that begin inside [start, end)"""
+    with open(path, "rb") as f:
+        if start:
+            # Finish the line that straddles start; it belongs to the previous range
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+
+
+def parse_chunk(chunk):
+    """Parse one byte range into columns with chunk-local string tables"""
+    path, fmt, header, start, end = chunk
+    claims, sources, summaries = StringTable(), StringTable(), StringTable()
+    types = StringTable(EVIDENCE_TYPES)
+    columns = {name: [] for name in ("claim", "source", "summary", "type", "reliability", "supports_claim")}
+    errors, samples = 0, []
+    lines = _read_lines(path, start, end)
+    if fmt == "csv":
+        if start == 0:
+            next(lines, None)
+        rows = (dict(zip(header, values)) for values in csv.reader(io.TextIOWrapper(_LineStream(lines),
+                                                                                     encoding="utf-8")))
+    else:
+        rows = (_json_row(line) for line in lines if line.strip())
+    for number, row in enumerate(rows):
+        try:
+            if isinstance(row, Exception):
+                raise row
+            claim, source, summary, evidence_type, reliability, supports = coerce_row(row)
+        except (ValueError, AttributeError) as e:
+            errors += 1
+            if len(samples) < MAX_ERROR_SAMPLES:
+                samples.append(f"{path} bytes {start}-{end}, record {number + 1}: {e}")
+            continue
+        columns["claim"].append(claims.intern(claim))
+        columns["source"].append(sources.intern(source))
+        columns["summary"].append(summaries.intern(summary))
+        columns["type"].append(types.intern(evidence_type))
+        columns["reliability"].append(reliability)
+        columns["supports_claim"].append(supports)
+    return {
+        "claims": claims.values,
+        "sources": sources.values,
+        "summaries": summaries.values,
+        "claim_codes": np.asarray(columns["claim"], dtype=np.int32),
+        "source_codes": np.asarray(columns["source"], dtype=np.int32),
+        "summary_codes": np.asarray(columns["summary"], dtype=np.int32),
+        "type_codes": np.asarray(columns["type"], dtype=np.uint8),
+        "reliability": np.asarray(columns["reliability"], dtype=np.float32),
+        "supports_claim": np.asarray(columns["supports_claim"], dtype=np.bool_),
+        "errors": errors,
+        "error_samples": samples,
+    }
+
+
+def _json_row(line):
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return ValueError(f"invalid JSON ({e})")
+
+
+class _LineStream(io.RawIOBase):
+    """Readable byte stream over an iterator of lines, for csv via TextIOWrapper"""
+    def __init__(self, lines):
+        self._lines = lines
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            self._pending = next(self._lines, None)
+            if self._pending is None:
+                self._pending = b""
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def ingest(paths, output, workers=None, chunk_bytes=CHUNK_BYTES):
+    """Parse evidence files into a corpus directory at output; returns the manifest.
+
+    Rows keep their file order within each claim. Invalid records are
+    skipped and counted, with the first few reasons kept in the manifest.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    os.makedirs(output, exist_ok=True)
+    chunks = plan_chunks(paths, chunk_bytes)
+    workers = workers or os.cpu_count() or 1
+    partitions = StringTable()
+    claim_texts = []
+    sources, summaries = StringTable(), StringTable()
+    errors, samples = 0, []
+    spill = {name: open(_spill_path(output, name), "wb") for name in ("claim_codes",) + tuple(COLUMNS)}
+    try:
+        for parsed in _parse_all(chunks, workers):
+            errors += parsed["errors"]
+            samples.extend(parsed["error_samples"][:MAX_ERROR_SAMPLES - len(samples)])
+            claim_map = np.empty(len(parsed["claims"]), dtype=np.int32)
+            for code, claim in enumerate(parsed["claims"]):
+                claim_map[code] = partitions.intern(claim_digest(claim))
+                if claim_map[code] == len(claim_texts):
+                    claim_texts.append(claim)
+            remapped = {
+                "claim_codes": _remap(claim_map, parsed["claim_codes"]),
+                "source_codes": _remap(sources.codes(parsed["sources"]), parsed["source_codes"]),
+                "summary_codes": _remap(summaries.codes(parsed["summaries"]), parsed["summary_codes"]),
+            }
+            for name, handle in spill.items():
+                remapped.get(name, parsed.get(name)).tofile(handle)
+    finally:
+        for handle in spill.values():
+            handle.close()
+
+    rows = _write_partitions(output, len(claim_texts))
+    offsets = np.concatenate(([0], np.cumsum(rows)))
+    for name, table in zip(STRING_POOLS, (sources, summaries)):
+        _write_strings(output, name, table.values)
+    manifest = {
+        "rows": int(offsets[-1]),
+        "types": list(EVIDENCE_TYPES),
+        "claims": {digest: [claim_texts[i], int(offsets[i]), int(rows[i])]
+                   for i, digest in enumerate(partitions.values)},
+        "errors": errors,
+        "error_samples": samples,
+        "files": [os.path.abspath(path) for path in paths],
+    }
+    with open(os.path.join(output, MANIFEST), "w") as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def write_corpus(output, evidence):
+    """Write {claim: evidence} to a corpus directory without parsing; returns the manifest.
+
+    Each batch's string codes are remapped into the corpus tables, and
+    weighted batches (see dedup) keep their weights.
+    """
+    os.makedirs(output, exist_ok=True)
+    types, sources, summaries = StringTable(EVIDENCE_TYPES), StringTable(), StringTable()
+    columns = {name: [] for name in COLUMNS}
+    weights = []
+    weighted = False
+    claims = {}
+    offset = 0
+    for claim, batch in evidence.items():
+        batch = EvidenceBatch.coerce(batch)
+        digest = claim_digest(claim)
+        if digest in claims:
+            raise ValueError(f"Claim '{claim}' given twice")
+        claims[digest] = [claim, offset, len(batch)]
+        offset += len(batch)
+        columns["reliability"].append(batch.reliability)
+        columns["supports_claim"].append(batch.supports_claim)
+        columns["type_codes"].append(_recode(types, batch.types, batch.type_codes))
+        columns["source_codes"].append(_recode(sources, batch.sources, batch.source_codes))
+        columns["summary_codes"].append(_recode(summaries, batch.summaries, batch.summary_codes))
+        weighted = weighted or batch.weight is not None
+        weights.append(batch.weight if batch.weight is not None else np.ones(len(batch), dtype=np.int64))
+    for name, dtype in COLUMNS.items():
+        np.save(os.path.join(output, f"{name}.npy"), np.concatenate(columns[name] or [np.empty(0)]).astype(dtype))
+    if weighted:
+        np.save(os.path.join(output, "weight.npy"), np.concatenate(weights))
+    for name, table in zip(STRING_POOLS, (sources, summaries)):
+        _write_strings(output, name, table.values)
+    manifest = {"rows": offset, "types": list(types.values), "claims": claims,
+                "errors": 0, "error_samples": [], "files": []}
+    with open(os.path.join(output, MANIFEST), "w") as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def _recode(target, table, codes):
+    """codes of table as codes of target, decoding only the strings actually used"""
+    if not len(codes):
+        return np.empty(0, dtype=np.int32)
+    used, inverse = np.unique(codes, return_inverse=True)
+    return target.codes(table[code] for code in used)[inverse.ravel()]
+
+
+def _parse_all(chunks, workers):
+    if workers == 1 or len(chunks) == 1:
+        yield from map(parse_chunk, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(parse_chunk, chunk))
+            # Parsed chunks are merged in file order; keep a bounded window in flight
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _remap(mapping, codes):
+    return mapping[codes] if len(codes) else codes
+
+
+def _spill_path(output, name):
+    return os.path.join(output, f".{name}.spill")
+
+
+def _map_spill(output, name, dtype):
+    """Read-only memory map of a spill file (mmap refuses empty files)"""
+    path = _spill_path(output, name)
+    if not os.path.getsize(path):
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def _write_partitions(output, claims):
+    """Reorder spilled rows so each claim's rows are contiguous; returns rows per claim.
+
+    Spilled columns are memory-mapped, so only the blocks being gathered
+    are paged in. The claim codes and the int64 sort order are still held
+    in memory, O(rows).
+    """
+    claim_codes = _map_spill(output, "claim_codes", np.int32)
+    order = np.argsort(claim_codes, kind="stable")
+    rows = np.bincount(claim_codes, minlength=claims)
+    del claim_codes
+    os.remove(_spill_path(output, "claim_codes"))
+    for name, dtype in COLUMNS.items():
+        source = _map_spill(output, name, dtype)
+        target = np.lib.format.open_memmap(os.path.join(output, f"{name}.npy"), mode="w+",
+                                           dtype=dtype, shape=(len(order),))
+        for start in range(0, len(order), SORT_BLOCK):
+            target[start:start + SORT_BLOCK] = source[order[start:start + SORT_BLOCK]]
+        target.flush()
+        del target, source
+        os.remove(_spill_path(output, name))
+    return rows
+
+
+def encode_strings(values):
+    """(UTF-8 pool as uint8, int64 offsets) for a sequence of strings"""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _write_strings(output, name, values):
+    pool, offsets = encode_strings(values)
+    np.save(os.path.join(output, f"{name}.offsets.npy"), offsets)
+    pool.tofile(os.path.join(output, f"{name}.bin"))
+
+
+class MappedStrings:
+    """Read-only string table over a UTF-8 pool and its offsets, decoded on access.
+
+    The arrays are typically memory-mapped or in shared memory, so the
+    table costs nothing until strings are read.
+    """
+    def __init__(self, pool, offsets):
+        self.pool = pool
+        self.offsets = offsets
+        self._index = None
+
+    @classmethod
+    def load(cls, directory, name):
+        path = os.path.join(directory, f"{name}.bin")
+        pool = np.memmap(path, dtype=np.uint8, mode="r") if os.path.getsize(path) else np.empty(0, np.uint8)
+        return cls(pool, np.load(os.path.join(directory, f"{name}.offsets.npy"), mmap_mode="r"))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, code):
+        return self.pool[self.offsets[code]:self.offsets[code + 1]].tobytes().decode("utf-8")
+
+    def code_of(self, value):
+        if self._index is None:
+            self._index = {self[code]: code for code in range(len(self))}
+        return self._index.get(value, -1)
+
+
+class EvidenceCorpus:
+    """An ingested corpus, memory-mapped.
+
+    evidence(claim) returns an EvidenceBatch whose columns are views into
+    the mapped files, so nothing is parsed or copied until it is read.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            manifest = json.load(f)
+        self.partitions = manifest["claims"]
+        self.rows = manifest["rows"]
+        self.errors = manifest["errors"]
+        self.types = StringTable(manifest["types"])
+        self.sources = MappedStrings.load(path, "sources")
+        self.summaries = MappedStrings.load(path, "summaries")
+        self.columns = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in COLUMNS}
+        weight = os.path.join(path, "weight.npy")
+        self.weight = np.load(weight, mmap_mode="r") if os.path.exists(weight) else None
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, claim):
+        return claim_digest(claim) in self.partitions
+
+    def claims(self):
+        return [claim for claim, _, _ in self.partitions.values()]
+
+    def count(self, claim):
+        partition = self.partitions.get(claim_digest(claim))
+        return partition[2] if partition else 0
+
+    def evidence(self, claim, start=0, stop=None):
+        """Rows start..stop of claim's evidence as a zero-copy EvidenceBatch, or None for unknown claims"""
+        partition = self.partitions.get(claim_digest(claim))
+        if partition is None:
+            return None
+        _, offset, rows = partition
+        stop = rows if stop is None else min(stop, rows)
+        window = slice(offset + min(start, stop), offset + stop)
+        columns = self.columns
+        return EvidenceBatch(
+            columns["reliability"][window], columns["supports_claim"][window], columns["type_codes"][window],
+            columns["source_codes"][window], columns["summary_codes"][window],
+            self.types, self.sources, self.summaries,
+            self.weight[window] if self.weight is not None else None
+        )
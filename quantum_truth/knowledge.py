@@ -0,0 +1,255 @@
+"""
+Knowledge base for Quantum Truth Analysis System
+Claims and their template evidence live in SQLite with an FTS5 inverted
+token index, so lookups are normalized, typo tolerant and ranked, and the
+corpus can be loaded from disk instead of rebuilt for every SearchEngine.
+"""
+import difflib
+import json
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+
+BASE_KNOWLEDGE = {
+    "flat_earth": [
+        {"source": "NASA", "summary": "Space missions show Earth's spherical shape", "type": "scientific", "reliability": 0.99, "supports_claim": False},
+        {"source": "Historical Records", "summary": "Earth known to be spherical since ancient times", "type": "historical", "reliability": 0.95, "supports_claim": False},
+        {"source": "Conspiracy Site", "summary": "NASA images are fabrications", "type": "conspiracy", "reliability": 0.05, "supports_claim": True}
+    ],
+    "vaccine_microchips": [
+        {"source": "WHO", "summary": "Vaccines contain no microchips", "type": "scientific", "reliability": 0.97, "supports_claim": False},
+        {"source": "Tech Journal", "summary": "Microchips impossible to inject via vaccines", "type": "scientific", "reliability": 0.96, "supports_claim": False},
+        {"source": "Social Media", "summary": "Tracking chips admitted by executives", "type": "conspiracy", "reliability": 0.01, "supports_claim": True}
+    ],
+    "moon_landing": [
+        {"source": "NASA Archives", "summary": "Complete documentation of Apollo missions", "type": "historical", "reliability": 0.98, "supports_claim": True},
+        {"source": "Physics Review", "summary": "Analysis confirms feasibility of moon landing", "type": "scientific", "reliability": 0.96, "supports_claim": True},
+        {"source": "Conspiracy Forum", "summary": "Studio lighting visible in photos", "type": "conspiracy", "reliability": 0.02, "supports_claim": False}
+    ],
+    "pyramids_aliens": [
+        {"source": "Archaeology Journal", "summary": "Evidence shows pyramids built by ancient Egyptians", "type": "historical", "reliability": 0.92, "supports_claim": False},
+        {"source": "Alternative History", "summary": "Advanced technology required for pyramid construction", "type": "conspiracy", "reliability": 0.15, "supports_claim": True}
+    ]
+}
+
+# The statement each entry's supports_claim flags refer to
+BASE_CLAIMS = {
+    "flat_earth": "The Earth is flat",
+    "vaccine_microchips": "Vaccines contain microchips",
+    "moon_landing": "The moon landing happened",
+    "pyramids_aliens": "Aliens built the pyramids"
+}
+
+STOPWORDS = frozenset("""
+a an the is are was were be been being am do does did of to in on at by for with from as
+and or but that this these those it its there their they he she we you i
+what who whom which how why when where whether
+""".split())
+
+# Negation words all normalize to one term, so "not flat" never matches "flat"
+NEGATION = "not"
+NEGATIONS = frozenset({"not", "no", "never", "nor"})
+
+
+def legacy_key(claim):
+    """The exact key format SearchEngine has always used"""
+    return claim.lower().replace("?", "").replace("'", "").replace(",", "").replace(" ", "_")
+
+
+def normalize_terms(text):
+    """Lowercase word tokens without stopwords, with a light plural stemmer.
+
+    Negations (not, no, never, nor, n't) are kept as the single term "not".
+    """
+    terms = []
+    text = re.sub(r"n['\u2019]t\b", " not", text.lower().replace("_", " "))
+    for word in re.findall(r"[a-z0-9]+", text):
+        if word in STOPWORDS:
+            continue
+        if word in NEGATIONS:
+            terms.append(NEGATION)
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+class KnowledgeBase:
+    """Claim -> template evidence store with ranked fuzzy lookup.
+
+    path is an SQLite file (":memory:" for a private in-memory index).
+    lookup() results are memoized, so repeated claims never touch SQLite.
+    """
+    def __init__(self, path=":memory:", min_score=0.75, fuzzy_cutoff=0.8, memo_size=4096):
+        self.path = path
+        self.source = path
+        self.min_score = min_score
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                key TEXT UNIQUE NOT NULL,
+                claim TEXT,
+                terms TEXT NOT NULL,
+                evidence TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS entry_index USING fts5(terms);
+            CREATE VIRTUAL TABLE IF NOT EXISTS entry_vocab USING fts5vocab(entry_index, 'row');
+        """)
+
+    @classmethod
+    def from_jsonl(cls, path, db_path=":memory:", **kwargs):
+        """Build an index from JSON lines of {"key", "claim", "aliases", "evidence"}"""
+        kb = cls(db_path, **kwargs)
+        with open(path) as f:
+            kb.add_many(json.loads(line) for line in f if line.strip())
+        return kb
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def add(self, key, evidence, claim=None, aliases=()):
+        self.add_many([{"key": key, "evidence": evidence, "claim": claim, "aliases": aliases}])
+
+    def add_many(self, entries, batch_size=10000):
+        """Insert or replace entries in batched transactions"""
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                self._insert(batch)
+                batch = []
+        if batch:
+            self._insert(batch)
+        with self._lock:
+            self._memo.clear()
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT evidence FROM entries WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def lookup(self, claim):
+        """Template evidence for the best matching entry, or None"""
+        with self._lock:
+            if claim in self._memo:
+                self._memo.move_to_end(claim)
+                return self._memo[claim]
+
+        evidence = self.get(legacy_key(claim))
+        if evidence is None:
+            matches = self.search(claim, k=1)
+            if matches and matches[0][1] >= self.min_score:
+                evidence = self.get(matches[0][0])
+
+        with self._lock:
+            self._memo[claim] = evidence
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return evidence
+
+    def search(self, claim, k=5):
+        """Top-k (key, score) matches ranked by term overlap, BM25 breaking ties.
+
+        score is the F1 overlap between the claim's terms and the entry's
+        terms, after mapping unknown claim terms to their closest indexed term.
+        Entries whose negation differs from the claim's are never matched,
+        since their supports_claim flags would point the wrong way.
+        """
+        terms = set(self._expand(normalize_terms(claim)))
+        if not terms:
+            return []
+        negated = NEGATION in terms
+        query = " OR ".join(f'"{term}"' for term in sorted(terms))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT e.key, e.terms, bm25(entry_index) FROM entry_index "
+                "JOIN entries e ON e.id = entry_index.rowid "
+                "WHERE entry_index MATCH ? ORDER BY bm25(entry_index) LIMIT ?",
+                (query, max(k * 10, 50))
+            ).fetchall()
+        ranked = []
+        for key, entry_terms, bm25 in rows:
+            entry_terms = set(entry_terms.split())
+            if (NEGATION in entry_terms) != negated:
+                continue
+            overlap = len(terms & entry_terms)
+            score = 2 * overlap / (len(terms) + len(entry_terms))
+            ranked.append((score, -bm25, key))
+        ranked.sort(reverse=True)
+        return [(key, score) for score, _, key in ranked[:k]]
+
+    def close(self):
+        self._conn.close()
+
+    def _insert(self, entries):
+        rows = []
+        for entry in entries:
+            text = " ".join([entry["key"], entry.get("claim") or ""] + list(entry.get("aliases") or ()))
+            terms = " ".join(sorted(set(normalize_terms(text))))
+            rows.append((entry["key"], entry.get("claim"), terms, json.dumps(entry["evidence"])))
+        with self._lock, self._conn:
+            for key, claim, terms, evidence in rows:
+                old = self._conn.execute("SELECT id FROM entries WHERE key = ?", (key,)).fetchone()
+                if old:
+                    self._conn.execute("DELETE FROM entry_index WHERE rowid = ?", old)
+                    self._conn.execute("DELETE FROM entries WHERE id = ?", old)
+                cursor = self._conn.execute(
+                    "INSERT INTO entries (key, claim, terms, evidence) VALUES (?, ?, ?, ?)",
+                    (key, claim, terms, evidence))
+                self._conn.execute("INSERT INTO entry_index (rowid, terms) VALUES (?, ?)",
+                                   (cursor.lastrowid, terms))
+
+    def _expand(self, terms):
+        """Replace terms missing from the index with their closest indexed term"""
+        expanded = []
+        for term in terms:
+            if term == NEGATION:
+                expanded.append(term)
+                continue
+            prefix = term[:2] if len(term) > 3 else term[:1]
+            with self._lock:
+                candidates = [row[0] for row in self._conn.execute(
+                    "SELECT term FROM entry_vocab WHERE term >= ? AND term < ?",
+                    (prefix, prefix + "\uffff"))]
+            if term in candidates:
+                expanded.append(term)
+                continue
+            close = difflib.get_close_matches(term, candidates, n=1, cutoff=self.fuzzy_cutoff)
+            expanded.append(close[0] if close else term)
+        return expanded
+
+
+def load_knowledge_base(path):
+    """Open an SQLite knowledge base file, or index a .jsonl corpus in memory"""
+    if path.endswith(".jsonl"):
+        kb = KnowledgeBase.from_jsonl(path)
+        kb.source = path
+        return kb
+    return KnowledgeBase(path)
+
+
+_default_knowledge_base = None
+_default_lock = threading.Lock()
+
+
+def default_knowledge_base():
+    """Process-wide knowledge base with the built-in entries, built on first use"""
+    global _default_knowledge_base
+    with _default_lock:
+        if _default_knowledge_base is None:
+            kb = KnowledgeBase()
+            kb.add_many({"key": key, "claim": BASE_CLAIMS.get(key), "evidence": evidence}
+                        for key, evidence in BASE_KNOWLEDGE.items())
+            _default_knowledge_base = kb
+        return _default_knowledge_base
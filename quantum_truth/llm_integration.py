@@ -1,22 +1,186 @@
 """
 LLM Integration for Quantum Truth Analysis System
 Handles interaction with selected LLM providers (OpenAI, Anthropic, etc.)
+
+AsyncLLMProvider talks to an HTTP completion endpoint that accepts batches:
+
+    POST {base_url}/v1/batch  {"requests": [{"prompt": ..., **params}, ...]}
+    -> {"responses": [{"text": ...}, ...]}
+
+quantum_truth.llm_stub ships a local stand-in server speaking this protocol.
+Providers with a different wire format override encode_batch/decode_batch.
 """
+import asyncio
+import json
 import os
+import random
+from collections import OrderedDict
+from .httpio import ConnectionPool
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 class LLMProvider:
-    def __init__(self, provider=None, api_key=None):
+    def __init__(self, provider=None, api_key=None, base_url=None):
         self.provider = provider or os.getenv("LLM_PROVIDER", "openai")
         self.api_key = api_key or os.getenv("LLM_API_KEY")
+        self.base_url = base_url or os.getenv("LLM_BASE_URL")
 
     def query(self, prompt, **kwargs):
-        # Placeholder: Implement actual LLM API calls here
-        # Example: For OpenAI, use openai.ChatCompletion.create(...)
-        # Example: For Anthropic, use anthropic.Client(...)
-        raise NotImplementedError(
-            "LLM integration not implemented. Please configure an LLM provider."
-        )
+        if not self.base_url:
+            # Example: For OpenAI, use openai.ChatCompletion.create(...)
+            # Example: For Anthropic, use anthropic.Client(...)
+            raise NotImplementedError(
+                "LLM integration not implemented. Please configure an LLM provider."
+            )
+        # Blocking convenience wrapper; agents should use AsyncLLMProvider directly
+        async def run():
+            async with AsyncLLMProvider(self.base_url, self.api_key, self.provider) as llm:
+                return await llm.query(prompt, **kwargs)
+        return asyncio.run(run())
+
+
+class AsyncLLMProvider:
+    """asyncio LLM client built for many concurrent agent prompts.
+
+    - pooled keep-alive HTTP connections (max_connections)
+    - at most max_concurrency batch requests in flight
+    - identical in-flight prompts are coalesced into one request
+    - prompts arriving within batch_window seconds share a request, up to batch_size
+    - per-request timeout with exponential-backoff retries
+    - LRU response cache of cache_size entries
+    """
+    def __init__(self, base_url=None, api_key=None, provider=None, max_connections=8,
+                 max_concurrency=16, batch_size=16, batch_window=0.005, timeout=30.0,
+                 retries=3, backoff=0.1, cache_size=1024):
+        self.base_url = base_url or os.getenv("LLM_BASE_URL", "http://127.0.0.1:8765")
+        self.api_key = api_key or os.getenv("LLM_API_KEY")
+        self.provider = provider or os.getenv("LLM_PROVIDER", "openai")
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_size = cache_size
+        self.stats = {"queries": 0, "cache_hits": 0, "coalesced": 0, "requests": 0, "retries": 0}
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._pending = []
+        self._flush_handle = None
+        self._tasks = set()
+        self._pool = None
+        self._slots = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def query(self, prompt, **params):
+        self.stats["queries"] += 1
+        key = json.dumps([prompt, params], sort_keys=True)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return self._cache[key]
+        if key in self._inflight:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._pending.append((key, dict(params, prompt=prompt), future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return await asyncio.shield(future)
+
+    async def query_many(self, prompts, **params):
+        return await asyncio.gather(*(self.query(prompt, **params) for prompt in prompts))
+
+    async def close(self):
+        if self._pending:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    def encode_batch(self, requests):
+        return {"model": self.provider, "requests": requests}
+
+    def decode_batch(self, payload):
+        return [response["text"] for response in payload["responses"]]
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+        if self._pending:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch):
+        try:
+            texts = await self._post_with_retry([request for _, request, _ in batch])
+            if len(texts) != len(batch):
+                raise ValueError(f"Expected {len(batch)} responses, got {len(texts)}")
+        except Exception as e:
+            for key, _, future in batch:
+                self._inflight.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (key, _, future), text in zip(batch, texts):
+            self._inflight.pop(key, None)
+            self._remember(key, text)
+            if not future.done():
+                future.set_result(text)
+
+    async def _post_with_retry(self, requests):
+        if self._pool is None:
+            self._pool = ConnectionPool(self.base_url, self.max_connections)
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        attempt = 0
+        while True:
+            try:
+                async with self._slots:
+                    self.stats["requests"] += 1
+                    status, payload = await asyncio.wait_for(
+                        self._pool.request("POST", "/v1/batch", self.encode_batch(requests), headers),
+                        self.timeout)
+                if status == 200:
+                    return self.decode_batch(payload)
+                if status not in RETRY_STATUSES:
+                    raise RuntimeError(f"LLM provider returned HTTP {status}: {payload}")
+                error = RuntimeError(f"LLM provider returned HTTP {status}")
+            except (asyncio.TimeoutError, ConnectionError, OSError) as e:
+                error = e
+            if attempt >= self.retries:
+                raise error
+            self.stats["retries"] += 1
+            await asyncio.sleep(self.backoff * (2 ** attempt) * (1 + random.random()))
+            attempt += 1
+
+    def _remember(self, key, text):
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
 # Usage Example:
 # llm = LLMProvider(provider="openai", api_key="sk-...")
 # response = llm.query("Summarize this evidence...")
+#
+# async with AsyncLLMProvider("http://127.0.0.1:8765") as llm:
+#     answers = await llm.query_many(["Assess source A", "Assess source B"])
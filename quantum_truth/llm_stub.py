@@ -0,0 +1,88 @@
+"""
+Local stand-in LLM server for Quantum Truth Analysis System
+Speaks the AsyncLLMProvider batch protocol with deterministic answers so
+the LLM path can be tested and benchmarked offline:
+
+    python -m quantum_truth.llm_stub --port 8765 --latency 0.05
+"""
+import argparse
+import asyncio
+import hashlib
+from .httpio import json_handler
+
+
+def stub_completion(prompt):
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+    return f"[stub:{digest}] {prompt[:60]}"
+
+
+class StubLLMServer:
+    """latency: seconds slept per batch request; fail_first: number of
+    requests answered with HTTP 503 before the server starts succeeding"""
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, fail_first=0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.fail_first = fail_first
+        self.requests = 0
+        self.prompts = 0
+        self._server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(json_handler(self.route), self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def route(self, method, path, payload):
+        if path != "/v1/batch":
+            return 404, {"error": "Not Found"}
+        if method != "POST":
+            return 405, {"error": "Method Not Allowed"}
+        self.requests += 1
+        if self.requests <= self.fail_first:
+            return 503, {"error": "Service Unavailable"}
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        requests = payload.get("requests", [])
+        self.prompts += len(requests)
+        return 200, {"responses": [{"text": stub_completion(r["prompt"])} for r in requests]}
+
+
+async def _serve(args):
+    server = await StubLLMServer(args.host, args.port, args.latency).start()
+    print(f"Stub LLM server listening on {server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of simulated latency per request")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Instrumentation for Quantum Truth Analysis System
+Stage spans, counters and latency histograms with Chrome trace and
+Prometheus text export, plus an optional cProfile mode. The default
+NULL_METRICS does nothing, so instrumented code costs one no-op call per
+span when metrics are off.
+"""
+import bisect
+import cProfile
+import json
+import os
+import pstats
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class Metrics:
+    """Collects spans, counters and histograms for one process.
+
+    Spans become Chrome trace events (capped at max_events) and feed the
+    per-stage latency histogram. With profile=True a cProfile profiler
+    runs between start_profile() and stop_profile().
+    """
+    enabled = True
+
+    def __init__(self, profile=False, max_events=100000):
+        self.counters = {}
+        self.histograms = {}
+        self.events = []
+        self.max_events = max_events
+        self.dropped_events = 0
+        self.profiler = cProfile.Profile() if profile else None
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._record(name, start, end, args)
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def start_profile(self):
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def stop_profile(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def summary(self):
+        return {
+            "counters": dict(self.counters),
+            "stages": {name: {"count": h.count, "total_seconds": h.sum, "mean_seconds": h.sum / h.count}
+                       for name, h in self.histograms.items() if h.count}
+        }
+
+    def export_chrome_trace(self, path):
+        """Write spans in Chrome trace event format (chrome://tracing, Perfetto)"""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms",
+                       "otherData": {"dropped_events": self.dropped_events}}, f)
+
+    def export_prometheus(self, path):
+        """Write counters and stage histograms in Prometheus text exposition format"""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"quantum_truth_{_sanitize(name)}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        if self.histograms:
+            metric = "quantum_truth_stage_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, h in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(list(h.buckets) + ["+Inf"], h.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{stage="{name}"}} {h.sum}')
+                lines.append(f'{metric}_count{{stage="{name}"}} {h.count}')
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def export_profile(self, path):
+        if self.profiler is not None:
+            pstats.Stats(self.profiler).dump_stats(path)
+
+    def export(self, path):
+        """Export by extension: .json -> Chrome trace, .prof -> cProfile stats, else Prometheus text"""
+        if path.endswith(".json"):
+            self.export_chrome_trace(path)
+        elif path.endswith(".prof"):
+            self.export_profile(path)
+        else:
+            self.export_prometheus(path)
+
+    def _record(self, name, start, end, args):
+        self.observe(name, end - start)
+        with self._lock:
+            if len(self.events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            self.events.append({
+                "name": name, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+                "ts": (start - self._origin) * 1e6, "dur": (end - start) * 1e6, "args": args
+            })
+
+
+class NullMetrics:
+    enabled = False
+    _span = nullcontext()
+
+    def span(self, name, **args):
+        return self._span
+
+    def incr(self, name, value=1):
+        pass
+
+    def observe(self, name, value):
+        pass
+
+    def start_profile(self):
+        pass
+
+    def stop_profile(self):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+def _sanitize(name):
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
@@ -0,0 +1,334 @@
+"""
+Rendering stage for Quantum Truth Analysis System
+Analysis only records compact, JSON-serializable render specs; this module
+turns them into images, either inline, in a background process pool, or
+later from a spec file (`quantum-truth render`).
+"""
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from .cache import claim_digest
+
+RENDER_MODES = ("inline", "background", "deferred", "none")
+SPEC_FILE = "render_queue.jsonl"
+# Debate images: one animation per claim (gif, webp) or one PNG per key cycle (png)
+DEBATE_FORMATS = ("gif", "webp", "png")
+FRAME_MS = 500
+
+
+def debate_spec(claim, debate_rounds, truth_percentage, cycle, framework, output_dir=None):
+    return {
+        "kind": "debate",
+        "claim": claim,
+        "framework": framework.name,
+        "cycle": cycle,
+        "truth_percentage": float(truth_percentage),
+        "rounds": [{"agent": r["agent"], "argument": r["arguments"][0], "confidence": float(r["confidence"])}
+                   for r in debate_rounds],
+        "pathway": framework.transformation_pathway(claim),
+        "path": _join(output_dir, f"analysis_{file_stem(claim, 10)}_cycle_{cycle+1}.png"),
+        "pathway_path": _join(output_dir, f"pathway_{file_stem(claim, 10)}_cycle_{cycle+1}.txt")
+    }
+
+
+def debate_animation_spec(claim, debate_rounds, frames, framework, output_dir=None, image_format="gif",
+                          frame_ms=FRAME_MS):
+    """One animated image for the (cycle, truth_percentage) frames of a debate"""
+    return {
+        "kind": "debate_animation",
+        "claim": claim,
+        "framework": framework.name,
+        "frames": [{"cycle": cycle, "truth_percentage": float(truth)} for cycle, truth in frames],
+        "rounds": [{"agent": r["agent"], "argument": r["arguments"][0], "confidence": float(r["confidence"])}
+                   for r in debate_rounds],
+        "pathway": framework.transformation_pathway(claim),
+        "frame_ms": frame_ms,
+        "path": _join(output_dir, f"analysis_{file_stem(claim, 10)}.{image_format}"),
+        "pathway_path": _join(output_dir, f"pathway_{file_stem(claim, 10)}.txt")
+    }
+
+
+def confidence_spec(claim, agents, output_dir=None):
+    return {
+        "kind": "confidence",
+        "claim": claim,
+        "series": {agent.role: [float(c) for c in agent.confidence_history] for agent in agents},
+        "path": _join(output_dir, f"confidence_{file_stem(claim)}.png")
+    }
+
+
+def truth_evolution_spec(claim, truth_percentages, output_dir=None):
+    return {
+        "kind": "truth_evolution",
+        "claim": claim,
+        "series": [float(t) for t in truth_percentages],
+        "path": _join(output_dir, f"truth_evolution_{file_stem(claim)}.png")
+    }
+
+
+def file_stem(claim, length=20):
+    """Readable, filesystem-safe file name part that stays unique for claims sharing a prefix"""
+    prefix = re.sub(r"[^\w-]+", "_", claim[:length]).strip("_")
+    return f"{prefix}_{claim_digest(claim)[:8]}"
+
+
+def _join(output_dir, filename):
+    return os.path.join(output_dir, filename) if output_dir else filename
+
+
+def _debate_graph(claim_label, framework_name, rounds, truth_node):
+    """Graph, fixed node positions and colors of a debate figure"""
+    import networkx as nx
+
+    G = nx.DiGraph()
+    positions = {}
+    node_colors = []
+
+    # Framework node
+    G.add_node(framework_name, type='framework')
+    positions[framework_name] = (0.5, 0.95)
+    node_colors.append('purple')
+
+    # Claim node
+    G.add_node(claim_label, type='claim')
+    positions[claim_label] = (0.5, 0.85)
+    node_colors.append('red')
+    G.add_edge(framework_name, claim_label)
+
+    y_pos = 0.75
+    for round_data in rounds:
+        agent = round_data['agent']
+        confidence = round_data['confidence']
+
+        G.add_node(agent, type='agent')
+        positions[agent] = (0.3, y_pos)
+        node_colors.append('skyblue')
+        G.add_edge(claim_label, agent)
+
+        arg_node = f"{agent}_arg"
+        G.add_node(arg_node, type='argument')
+        positions[arg_node] = (0.7, y_pos)
+        node_colors.append('lightgreen' if confidence > 0.5 else 'lightcoral')
+        G.add_edge(agent, arg_node)
+
+        y_pos -= 0.15
+
+    G.add_node(truth_node, type='conclusion')
+    positions[truth_node] = (0.5, 0.05)
+    node_colors.append('gold')
+    G.add_edge(claim_label, truth_node)
+
+    # Transformation pathway
+    pathway_node = "Transformation Pathway"
+    G.add_node(pathway_node, type='pathway')
+    positions[pathway_node] = (0.5, 0.15)
+    node_colors.append('orange')
+    G.add_edge(truth_node, pathway_node)
+    return G, positions, node_colors
+
+
+def _claim_label(claim):
+    return claim[:25] + "..." if len(claim) > 25 else claim
+
+
+def _debate_title(claim_label, cycle, framework_name):
+    return f"Analysis: '{claim_label}'\nCycle {cycle+1} | Framework: {framework_name}"
+
+
+def draw_debate(spec):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    claim_label = _claim_label(spec["claim"])
+    framework_name = spec["framework"]
+    plt.figure(figsize=(14, 10))
+    G, positions, node_colors = _debate_graph(claim_label, framework_name, spec["rounds"],
+                                              f"Truth: {spec['truth_percentage']:.2%}")
+
+    nx.draw(G, positions, with_labels=True, node_size=3000,
+            node_color=node_colors, font_size=9,
+            arrowsize=20, arrowstyle='->')
+
+    plt.title(_debate_title(claim_label, spec['cycle'], framework_name), fontsize=16)
+    plt.tight_layout()
+    plt.savefig(spec["path"])
+    plt.close()
+
+    # Save transformation pathway
+    with open(spec["pathway_path"], "w") as f:
+        f.write(spec["pathway"])
+
+
+def draw_debate_animation(spec):
+    """One animated image of a debate's key cycles.
+
+    Only the truth label and the title change between cycles, so the graph,
+    layout and node artists are drawn once on an Agg canvas and saved as a
+    background; each frame restores it and redraws just those two texts.
+    """
+    import networkx as nx
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from PIL import Image
+
+    claim_label = _claim_label(spec["claim"])
+    framework_name = spec["framework"]
+    figure = Figure(figsize=(14, 10))
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    truth_node = "Truth"
+    G, positions, node_colors = _debate_graph(claim_label, framework_name, spec["rounds"], truth_node)
+    nx.draw_networkx_nodes(G, positions, ax=ax, node_size=3000, node_color=node_colors)
+    nx.draw_networkx_edges(G, positions, ax=ax, node_size=3000, arrowsize=20, arrowstyle='->')
+    labels = nx.draw_networkx_labels(G, positions, ax=ax, font_size=9)
+    ax.set_axis_off()
+    truth_label = labels[truth_node]
+    title = ax.set_title(_debate_title(claim_label, spec["frames"][0]["cycle"], framework_name), fontsize=16)
+    figure.tight_layout()
+
+    truth_label.set_animated(True)
+    title.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(figure.bbox)
+    base = Image.fromarray(np.asarray(canvas.buffer_rgba())[..., :3])
+    palette = None
+    frames = []
+    for frame in spec["frames"]:
+        canvas.restore_region(background)
+        truth_label.set_text(f"Truth: {frame['truth_percentage']:.2%}")
+        title.set_text(_debate_title(claim_label, frame["cycle"], framework_name))
+        ax.draw_artist(truth_label)
+        ax.draw_artist(title)
+        pixels = np.asarray(canvas.buffer_rgba())[..., :3]
+        if spec["path"].endswith(".gif") and palette is None:
+            # Frames share every color, so one adaptive palette built from the first serves them all
+            palette = Image.fromarray(pixels).quantize(colors=255, dither=0)
+            base = base.quantize(palette=palette, dither=0)
+        # Copy the unchanged background and paste in only the redrawn texts
+        image = base.copy()
+        height = pixels.shape[0]
+        for artist in (truth_label, title):
+            x0, y0, x1, y1 = artist.get_window_extent().padded(2).extents
+            left, top = max(0, int(x0)), max(0, height - int(np.ceil(y1)))
+            patch = Image.fromarray(pixels[top:height - int(y0), left:int(np.ceil(x1))])
+            image.paste(patch.quantize(palette=palette, dither=0) if palette is not None else patch, (left, top))
+        frames.append(image)
+    frames[0].save(spec["path"], save_all=True, append_images=frames[1:], duration=spec["frame_ms"], loop=0,
+                   optimize=False)
+
+    with open(spec["pathway_path"], "w") as f:
+        f.write(spec["pathway"])
+
+
+def draw_confidence(spec):
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(12, 6))
+    for role, history in spec["series"].items():
+        plt.plot(history, label=role, alpha=0.8)
+    plt.title(f"Agent Confidence: '{spec['claim'][:30]}'")
+    plt.xlabel("Debate Cycle")
+    plt.ylabel("Confidence")
+    plt.legend()
+    plt.grid(True)
+    plt.savefig(spec["path"])
+    plt.close()
+
+
+def draw_truth_evolution(spec):
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(12, 6))
+    plt.plot(spec["series"], color='purple')
+    plt.title(f"Truth Percentage Evolution: '{spec['claim'][:30]}'")
+    plt.xlabel("Debate Cycle")
+    plt.ylabel("Truth Percentage")
+    plt.ylim(0, 1)
+    plt.grid(True)
+    plt.savefig(spec["path"])
+    plt.close()
+
+
+RENDERERS = {
+    "debate": draw_debate,
+    "debate_animation": draw_debate_animation,
+    "confidence": draw_confidence,
+    "truth_evolution": draw_truth_evolution,
+}
+
+
+def render_spec(spec):
+    try:
+        RENDERERS[spec["kind"]](spec)
+        return True
+    except Exception as e:
+        print(f"Visualization error: {str(e)}")
+        return False
+
+
+def read_specs(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def render_file(path, workers=1):
+    """Render every spec in a spec file; returns (rendered, failed) counts"""
+    specs = read_specs(path)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(render_spec, specs, chunksize=4))
+    else:
+        results = [render_spec(spec) for spec in specs]
+    rendered = sum(results)
+    return rendered, len(results) - rendered
+
+
+class Renderer:
+    """Dispatches render specs according to mode.
+
+    inline     render immediately (the historical behaviour)
+    background render in a worker process pool, off the analysis path
+    deferred   append specs to a spec file (render_queue.jsonl) for `quantum-truth render`
+    none       drop specs; no images are produced
+    """
+    def __init__(self, mode="inline", workers=None):
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode '{mode}', expected one of {RENDER_MODES}")
+        self.mode = mode
+        self.workers = workers
+        self._pool = None
+        self._futures = []
+
+    @property
+    def enabled(self):
+        return self.mode != "none"
+
+    def submit(self, specs, spec_path=SPEC_FILE):
+        if self.mode == "none":
+            return
+        if self.mode == "inline":
+            for spec in specs:
+                render_spec(spec)
+        elif self.mode == "deferred":
+            with open(spec_path, "a") as f:
+                for spec in specs:
+                    f.write(json.dumps(spec) + "\n")
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.extend(self._pool.submit(render_spec, spec) for spec in specs)
+
+    def flush(self):
+        """Block until background renders have finished"""
+        for future in self._futures:
+            future.result()
+        self._futures = []
+
+    def close(self):
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
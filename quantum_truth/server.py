@@ -0,0 +1,253 @@
+"""
+Analysis server for Quantum Truth Analysis System
+Keeps warm TruthAnalyzer workers alive so each claim costs only the
+analysis itself, not interpreter startup and engine construction:
+
+    python -m quantum_truth.server --port 8766 --workers 4
+    quantum-truth "The Earth is flat" --server http://127.0.0.1:8766
+
+    GET  /health   -> {"status": "ok", "workers": ..., "running": ..., "queued": ...}
+    GET  /stats    -> request counters
+    POST /analyze  {"claim": ..., "framework": ..., "seed": ...} -> result dict
+"""
+import argparse
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from . import analyzer
+from .httpio import ConnectionPool, HTTPError, json_handler
+from .store import ResultStore
+
+DEFAULT_PORT = 8766
+
+
+class AnalysisServer:
+    """Serves analyses from a pool of warm worker processes.
+
+    Every worker builds one TruthAnalyzer at startup and reuses it for all
+    requests. At most `workers` analyses run at once and `queue_size` more
+    may wait; beyond that requests are refused with HTTP 503 until the
+    backlog drains. Listens on unix_socket when given, otherwise host:port.
+    Fresh results are written by this process to store (True for
+    output_dir/results.db, a path, or False), as TruthAnalyzer does.
+    Remaining keyword options are passed to each worker's TruthAnalyzer.
+    """
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, unix_socket=None, workers=None, queue_size=64,
+                 framework="Scientific_Empirical", seed=None, cache=False, output_dir="analysis_results",
+                 quiet=True, store=True, **options):
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.framework = framework
+        self.seed = seed
+        cache_config = (1024, os.path.join(output_dir, "cache"), None) if cache else None
+        options.setdefault("render", "none")
+        # Workers hand results back; this process writes them to the store
+        options["store"] = False
+        if store is True:
+            store = os.path.join(output_dir, "results.db")
+        self.store_path = store or None
+        self.store = None
+        self.worker_args = (quiet, options, cache_config, output_dir)
+        self.stats = {"served": 0, "rejected": 0, "failed": 0}
+        self.pending = 0
+        self._pool = None
+        self._server = None
+
+    @property
+    def url(self):
+        if self.unix_socket:
+            return f"unix://{self.unix_socket}"
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=self.worker_args)
+        # Build every worker's analyzer before accepting requests
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _ping) for _ in range(self.workers)))
+        handler = json_handler(self.route)
+        if self.unix_socket:
+            self._server = await asyncio.start_unix_server(handler, path=self.unix_socket)
+        else:
+            self._server = await asyncio.start_server(handler, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self.unix_socket and os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def route(self, method, path, payload):
+        if path == "/health":
+            return 200, {"status": "ok", "workers": self.workers, "running": min(self.pending, self.workers),
+                         "queued": max(0, self.pending - self.workers)}
+        if path == "/stats":
+            return 200, dict(self.stats, pending=self.pending, workers=self.workers, queue_size=self.queue_size)
+        if path != "/analyze":
+            return 404, {"error": "Not Found"}
+        if method != "POST":
+            return 405, {"error": "Method Not Allowed"}
+        claim = payload.get("claim") if isinstance(payload, dict) else None
+        if not isinstance(claim, str) or not claim.strip():
+            return 400, {"error": "Request must be a JSON object with a non-empty 'claim'"}
+        if self.pending >= self.workers + self.queue_size:
+            self.stats["rejected"] += 1
+            return 503, {"error": "Server busy", "pending": self.pending}
+
+        framework = payload.get("framework") or self.framework
+        seed = payload.get("seed", self.seed)
+        self.pending += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._pool, analyzer._analyze_in_worker, claim, framework, seed)
+        except Exception as e:
+            self.stats["failed"] += 1
+            return 500, {"error": str(e)}
+        finally:
+            self.pending -= 1
+        self.stats["served"] += 1
+        series = result.pop(analyzer.SERIES_KEY, None)
+        stats = result.pop(analyzer.STATS_KEY, None)
+        # Cached results carry no series and are already stored
+        if series is not None and self.store_path is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._save, result, series, stats)
+        return 200, result
+
+    def _save(self, result, series, stats):
+        if self.store is None:
+            os.makedirs(os.path.dirname(self.store_path) or ".", exist_ok=True)
+            self.store = ResultStore(self.store_path)
+        self.store.append(result, series)
+        if stats is not None:
+            self.store.save_stats(result["claim"], stats, result["timestamp"])
+        self.store.flush()
+
+
+class AnalysisClient:
+    """Client for AnalysisServer over one keep-alive connection pool"""
+    def __init__(self, url, max_connections=4):
+        self.url = url
+        self._pool = ConnectionPool(url, max_connections)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def analyze(self, claim, framework=None, seed=None):
+        payload = {"claim": claim}
+        if framework is not None:
+            payload["framework"] = framework
+        if seed is not None:
+            payload["seed"] = seed
+        return await self._call("POST", "/analyze", payload)
+
+    async def health(self):
+        return await self._call("GET", "/health")
+
+    async def close(self):
+        await self._pool.close()
+
+    async def _call(self, method, path, payload=None):
+        status, response = await self._pool.request(method, path, payload)
+        if status != 200:
+            raise HTTPError(status, response)
+        return response
+
+
+def analyze_remote(url, claim, framework=None, seed=None):
+    """Blocking one-shot analysis on a running server"""
+    async def run():
+        async with AnalysisClient(url, max_connections=1) as client:
+            return await client.analyze(claim, framework, seed)
+    return asyncio.run(run())
+
+
+def _init_worker(quiet, *args):
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+    analyzer._init_worker(*args)
+
+
+def _ping():
+    return os.getpid()
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument("--unix-socket", default=None, help="Listen on this Unix socket instead of TCP")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Warm analyzer processes (default: all cores)")
+    parser.add_argument("--queue-size", type=int, default=64,
+                        help="Requests allowed to wait for a worker before returning 503")
+    parser.add_argument("-s", "--seed", type=int, default=None,
+                        help="Base RNG seed for requests that do not carry one")
+
+
+def serve(args):
+    """Run until interrupted; args come from add_server_arguments plus the analysis options"""
+    async def run():
+        server = AnalysisServer(args.host, args.port, args.unix_socket, args.workers, args.queue_size,
+                                pages=args.pages, cycles=args.cycles, framework=args.framework,
+                                seed=args.seed, render=args.render, cache=args.cache,
+                                knowledge_base=args.knowledge, chunk_size=args.chunk_size,
+                                output_dir=args.output, graph=args.graph, tolerance=args.tolerance,
+                                min_cycles=args.min_cycles, dedup=args.dedup, weights=args.weights,
+                                corpus=args.corpus, debate_format=args.debate_format)
+        await server.start()
+        print(f"Analysis server listening on {server.url} with {server.workers} workers", flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantum Truth analysis server")
+    add_server_arguments(parser)
+    parser.add_argument("-p", "--pages", type=int, default=100)
+    parser.add_argument("-c", "--cycles", type=int, default=100)
+    parser.add_argument("-f", "--framework", default="Scientific_Empirical")
+    parser.add_argument("-o", "--output", default="analysis_results")
+    parser.add_argument("--render", default="none")
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument("-k", "--knowledge", default=None)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--graph", default=None)
+    parser.add_argument("--tolerance", type=float, default=None)
+    parser.add_argument("--min-cycles", type=int, default=10)
+    parser.add_argument("--dedup", type=float, nargs="?", const=0.8, default=None)
+    parser.add_argument("--weights", default=None)
+    parser.add_argument("--corpus", default=None)
+    parser.add_argument("--debate-format", default="gif")
+    serve(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
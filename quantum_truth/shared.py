@@ -0,0 +1,120 @@
+"""
+Shared evidence for Quantum Truth Analysis System
+Reduces one claim's evidence across processes. The evidence lives once in
+memory-mapped column files: an ingested corpus, or a SharedEvidence copy
+of an in-memory batch written to shared memory (/dev/shm where available).
+Workers are sent only a path and a row range, map the columns without
+copying, and reduce the range to EvidenceStats; the parent merges them in
+row order. Worker memory therefore stays flat however much evidence there
+is. Debate cycles and agents only read the merged statistics.
+"""
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .dedup import deduplicate
+from .evidence import EvidenceStats
+from .ingest import EvidenceCorpus, write_corpus
+
+SHARED_MEMORY_DIR = "/dev/shm"
+CHUNK_ROWS = 65536
+
+
+class SharedEvidence:
+    """An evidence batch copied once into memory-mapped files that workers attach to.
+
+    Use as a context manager; the files are removed on close.
+    """
+    def __init__(self, evidence, claim="evidence", directory=None):
+        if directory is None and os.path.isdir(SHARED_MEMORY_DIR):
+            directory = SHARED_MEMORY_DIR
+        self.path = tempfile.mkdtemp(prefix="quantum-truth-", dir=directory)
+        self.claim = claim
+        try:
+            self.rows = write_corpus(self.path, {claim: evidence})["rows"]
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+# Corpus a worker has mapped, reused while tasks keep naming the same path
+_worker_corpus = None
+
+
+def reduce_range(path, claim, start, stop, dedup=None):
+    """EvidenceStats of rows start..stop of claim's evidence in the corpus at path"""
+    global _worker_corpus
+    if _worker_corpus is None or _worker_corpus.path != path:
+        _worker_corpus = EvidenceCorpus(path)
+    batch = _worker_corpus.evidence(claim, start, stop)
+    if dedup:
+        batch = deduplicate(batch, dedup)
+    return EvidenceStats.of(batch)
+
+
+class StatsPool:
+    """Worker processes reducing evidence ranges, reusable across claims.
+
+    Ranges are chunk_rows long and merged in order, so the result equals
+    streaming the same evidence through EvidenceStats.update chunk by chunk.
+    """
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def reduce(self, path, claim, rows, chunk_rows=CHUNK_ROWS, dedup=None):
+        """EvidenceStats of the first rows of claim's evidence in the corpus at path"""
+        stats = EvidenceStats()
+        for stats in self.iter_reduce(path, claim, rows, chunk_rows, dedup):
+            pass
+        return stats
+
+    def iter_reduce(self, path, claim, rows, chunk_rows=CHUNK_ROWS, dedup=None):
+        """Yield the running EvidenceStats after each chunk is merged, in row order.
+
+        The same object is yielded every time; the last one is the result.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        stats = EvidenceStats()
+        pending = deque()
+        try:
+            for start in range(0, rows, chunk_rows):
+                pending.append(self._pool.submit(reduce_range, path, claim, start,
+                                                 min(start + chunk_rows, rows), dedup))
+                # Partial stats are small, but keep a bounded window so huge claims queue lazily
+                if len(pending) >= self.workers * 2:
+                    yield stats.merge(pending.popleft().result())
+            while pending:
+                yield stats.merge(pending.popleft().result())
+        finally:
+            # Abandoned early: drop the ranges nobody will merge
+            for future in pending:
+                future.cancel()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def parallel_stats(evidence, workers=None, chunk_rows=CHUNK_ROWS, dedup=None):
+    """EvidenceStats of an in-memory batch, reduced across worker processes via SharedEvidence"""
+    with SharedEvidence(evidence) as shared, StatsPool(workers) as pool:
+        return pool.reduce(shared.path, shared.claim, shared.rows, chunk_rows, dedup)
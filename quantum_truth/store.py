@@ -0,0 +1,186 @@
+"""
+Result store for Quantum Truth Analysis System
+Analysis results are appended to one SQLite table, one row per analysis,
+with the evidence counts as columns and the per-cycle truth series as a
+float32 BLOB. Rows are buffered and written in batched transactions, so
+large batches are not bound by a file open and fsync per claim. A second
+table keeps each claim's latest evidence statistics (EvidenceStats.to_dict)
+for incremental re-analysis.
+"""
+import csv
+import json
+import sqlite3
+import threading
+import numpy as np
+from .cache import claim_digest
+
+EVIDENCE_COLUMNS = ("total", "scientific", "reliable", "unreliable", "historical", "conspiracy", "support", "oppose")
+COLUMNS = ("claim", "claim_digest", "framework", "verdict", "truth_percentage_avg", "truth_percentage_std",
+           "pages", "cycles", "cycles_used", "execution_time", "timestamp") + \
+          tuple(f"evidence_{name}" for name in EVIDENCE_COLUMNS)
+EXPORT_FORMATS = (".jsonl", ".csv")
+
+
+class ResultStore:
+    """Append-only analysis results in SQLite.
+
+    append() buffers rows and commits every batch_size of them; call
+    flush() or close() to commit the rest.
+    """
+    def __init__(self, path, batch_size=1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        self._pending_stats = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY,
+                claim TEXT NOT NULL,
+                claim_digest TEXT NOT NULL,
+                framework TEXT,
+                verdict TEXT,
+                truth_percentage_avg REAL,
+                truth_percentage_std REAL,
+                pages INTEGER,
+                cycles INTEGER,
+                cycles_used INTEGER,
+                execution_time REAL,
+                timestamp TEXT,
+                {", ".join(f"evidence_{name} INTEGER" for name in EVIDENCE_COLUMNS)},
+                series BLOB
+            );
+            CREATE INDEX IF NOT EXISTS results_claim ON results (claim_digest);
+            CREATE INDEX IF NOT EXISTS results_verdict ON results (verdict);
+            CREATE TABLE IF NOT EXISTS evidence_stats (
+                claim_digest TEXT PRIMARY KEY,
+                claim TEXT NOT NULL,
+                stats TEXT NOT NULL,
+                updated TEXT
+            );
+        """)
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def append(self, result, series=None):
+        evidence = result.get("evidence_analysis", {})
+        row = (
+            result["claim"], claim_digest(result["claim"]), result.get("framework"), result.get("verdict"),
+            float(result["truth_percentage_avg"]), float(result.get("truth_percentage_std", 0.0)),
+            result.get("pages"), result.get("cycles"), result.get("cycles_used", result.get("cycles")),
+            result.get("execution_time"), result.get("timestamp")
+        ) + tuple(evidence.get(name) for name in EVIDENCE_COLUMNS) + (
+            np.asarray(series, dtype=np.float32).tobytes() if series is not None else None,
+        )
+        with self._lock:
+            self._pending.append(row)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def save_stats(self, claim, stats, timestamp=None):
+        """Replace claim's evidence statistics (an EvidenceStats.to_dict() dict); written with the next flush"""
+        with self._lock:
+            self._pending_stats[claim_digest(claim)] = (claim, json.dumps(stats), timestamp)
+
+    def load_stats(self, claim):
+        """claim's latest saved evidence statistics dict, or None"""
+        self.flush()
+        with self._lock:
+            row = self._conn.execute("SELECT stats FROM evidence_stats WHERE claim_digest = ?",
+                                     (claim_digest(claim),)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def flush(self):
+        with self._lock:
+            rows, self._pending = self._pending, []
+            stats, self._pending_stats = self._pending_stats, {}
+            if rows or stats:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT INTO results ({', '.join(COLUMNS)}, series) "
+                        f"VALUES ({', '.join('?' * (len(COLUMNS) + 1))})", rows)
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO evidence_stats (claim_digest, claim, stats, updated) "
+                        "VALUES (?, ?, ?, ?)", [(digest,) + row for digest, row in stats.items()])
+
+    def query(self, claim=None, verdict=None, framework=None, since=None, limit=None):
+        """Result dicts (newest first) matching every given filter; since is an ISO timestamp"""
+        self.flush()
+        where, params = [], []
+        if claim is not None:
+            where.append("claim_digest = ?")
+            params.append(claim_digest(claim))
+        if verdict is not None:
+            where.append("verdict = ?")
+            params.append(verdict)
+        if framework is not None:
+            where.append("framework = ?")
+            params.append(framework)
+        if since is not None:
+            where.append("timestamp >= ?")
+            params.append(since)
+        sql = f"SELECT id, {', '.join(COLUMNS)} FROM results"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_to_result(row) for row in rows]
+
+    def latest(self, claim):
+        results = self.query(claim=claim, limit=1)
+        return results[0] if results else None
+
+    def series(self, result_id):
+        """Per-cycle truth percentages of a stored result, or None"""
+        self.flush()
+        with self._lock:
+            row = self._conn.execute("SELECT series FROM results WHERE id = ?", (result_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def export(self, path, **filters):
+        """Write matching results as JSON lines or CSV, chosen by extension; returns the row count"""
+        results = self.query(**filters)
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=("id",) + COLUMNS)
+                writer.writeheader()
+                for result in results:
+                    writer.writerow(_flatten(result))
+        elif path.endswith(".jsonl"):
+            with open(path, "w") as f:
+                for result in results:
+                    f.write(json.dumps(result) + "\n")
+        else:
+            raise ValueError(f"Unsupported export format for '{path}' (use {' or '.join(EXPORT_FORMATS)})")
+        return len(results)
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+
+def _to_result(row):
+    values = dict(zip(("id",) + COLUMNS, row))
+    result = {name: values[name] for name in ("id",) + COLUMNS if not name.startswith("evidence_")}
+    result["evidence_analysis"] = {name: values[f"evidence_{name}"] for name in EVIDENCE_COLUMNS}
+    return result
+
+
+def _flatten(result):
+    row = {name: value for name, value in result.items() if name != "evidence_analysis"}
+    row.update({f"evidence_{name}": value for name, value in result["evidence_analysis"].items()})
+    return row
@@ -14,7 +14,6 @@ setup(
         "numpy>=1.20.0",
         "matplotlib>=3.5.0",
         "networkx>=2.8.0",
-        "tqdm>=4.64.0",
         "Pillow>=9.0.0"
     ],
     classifiers=[
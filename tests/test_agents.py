@@ -1,5 +1,10 @@
+import io
+import json
 import unittest
-from quantum_truth.agents import DebateAgent
+from unittest.mock import patch
+from quantum_truth.agents import AGENT_REGISTRY, DEFAULT_AGENTS, FEATURES, DebateAgent, register_agent, register_feature
+from quantum_truth.engines import ChatbotEngine
+from quantum_truth.events import EventLog, JsonLinesSink
 from quantum_truth.frameworks import AxiomaticFramework
 
 class TestDebateAgent(unittest.TestCase):
@@ -34,5 +39,61 @@ class TestDebateAgent(unittest.TestCase):
         args = agent.formulate_argument("FlatEarth", self.evidence, self.framework)
         self.assertIn("Conflicts", args[1])
 
+    def test_axiom_regulator_conflicts_are_capped(self):
+        framework = AxiomaticFramework("Science", [f"Axiom_{i}" for i in range(5000)])
+        args = DebateAgent("AxiomRegulator").formulate_argument("FlatEarth", self.evidence, framework)
+        self.assertTrue(args[1].endswith("Axiom_9 and 4990 more"))
+
+    def test_unknown_role(self):
+        with self.assertRaises(ValueError):
+            DebateAgent("Astrologer")
+
+    def test_slots(self):
+        agent = DebateAgent("Logician")
+        with self.assertRaises(AttributeError):
+            agent.mood = "grumpy"
+
+    def test_history_persists_across_cycles(self):
+        engine = ChatbotEngine()
+        for cycle in range(3):
+            engine.conduct_debate("Test claim", self.evidence, cycle, verbose=False)
+        self.assertTrue(all(len(agent.confidence_history) == 3 for agent in engine.agents))
+        engine.conduct_debate("Other claim", self.evidence, 0, verbose=False)
+        self.assertEqual(len(engine.agents[0].confidence_history), 1)
+
+    def test_custom_agent_and_lazy_features(self):
+        calls = []
+        register_feature("expensive", lambda stats: calls.append(stats) or stats.total * 2)
+        register_agent("Skeptic", "Doubt", weight=0.05, requires=("expensive",))(
+            lambda claim, features, framework: ([f"Doubled: {features['expensive']}"], 0.5))
+        self.addCleanup(AGENT_REGISTRY.pop, "Skeptic")
+        self.addCleanup(FEATURES.pop, "expensive")
+
+        ChatbotEngine().debate_series("Test claim", self.evidence, 3, verbose=False)
+        self.assertEqual(calls, [])
+
+        engine = ChatbotEngine(agents=DEFAULT_AGENTS + ("Skeptic",))
+        _, rounds, agents, _ = engine.debate_series("Test claim", self.evidence, 3, verbose=False)
+        self.assertEqual(rounds[-1]["arguments"], ["Doubled: 2"])
+        self.assertEqual(len(calls), 1)
+        with self.assertRaises(ValueError):
+            register_agent("Broken", "x", requires=("no_such_feature",))
+
+    def test_agent_errors_are_events(self):
+        def broken(claim, features, framework):
+            raise RuntimeError("no data")
+        register_agent("Broken", "Nothing")(broken)
+        self.addCleanup(AGENT_REGISTRY.pop, "Broken")
+        stream = io.StringIO()
+        engine = ChatbotEngine(agents=("Broken",))
+        engine.events = EventLog(JsonLinesSink(stream))
+        with patch("builtins.print") as mock_print:
+            engine.conduct_debate("Test claim", self.evidence, 0, verbose=False)
+        engine.events.flush()
+        mock_print.assert_not_called()
+        record = json.loads(stream.getvalue())
+        self.assertEqual((record["event"], record["agent"], record["error"]), ("agent.error", "Broken", "no data"))
+        self.assertEqual(engine.agents[0].arguments, ["Analysis error"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,9 @@
+import os
+import tempfile
 import unittest
 from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.events import NULL_EVENTS
+from quantum_truth.evidence import EvidenceStats
 from unittest.mock import patch, MagicMock
 
 class TestTruthAnalyzer(unittest.TestCase):
@@ -8,6 +12,9 @@ class TestTruthAnalyzer(unittest.TestCase):
     @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
     def test_analyze(self, mock_save, mock_plot_truth, mock_plot_conf):
         analyzer = TruthAnalyzer(pages=5, cycles=3)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        analyzer.output_dir = tmp.name
         analyzer.search_engine.search_claim = MagicMock(return_value=[
             {"source": "Test", "summary": "Test evidence", "type": "scientific", 
              "reliability": 0.9, "supports_claim": True}
@@ -22,6 +29,60 @@ class TestTruthAnalyzer(unittest.TestCase):
         self.assertGreaterEqual(result, 0.0)
         self.assertLessEqual(result, 1.0)
         
+    def test_analyze_many_reproducible(self):
+        analyzer = TruthAnalyzer(pages=5, cycles=2, seed=3, render="none", store=False, events=NULL_EVENTS)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        analyzer.output_dir = tmp.name
+        claims = ["flat earth", "Test claim", "moon landing"]
+        serial = list(analyzer.analyze_many(claims, workers=1))
+        parallel = list(analyzer.analyze_many(claims, workers=2))
+        self.assertEqual([r['claim'] for r in parallel], claims)
+        self.assertEqual([r['truth_percentage_avg'] for r in serial],
+                         [r['truth_percentage_avg'] for r in parallel])
+        unordered = list(analyzer.analyze_many(claims, workers=2, ordered=False))
+        self.assertEqual(sorted(r['claim'] for r in unordered), sorted(claims))
+
+    @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
+    def test_streaming_partial_verdicts(self, mock_save):
+        analyzer = TruthAnalyzer(pages=1000, cycles=5, render="none", chunk_size=256)
+        partials = []
+        analyzer.on_partial = partials.append
+        result = analyzer.analyze("flat earth", verbose=False)
+        self.assertEqual([p['pages_processed'] for p in partials], [256, 512, 768, 1000])
+        self.assertLessEqual(abs(partials[-1]['truth_percentage'] - result), 0.05)
+
+    @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
+    def test_adaptive_cycles_used(self, mock_save):
+        fixed = TruthAnalyzer(pages=50, cycles=500, seed=5, render="none")
+        adaptive = TruthAnalyzer(pages=50, cycles=500, seed=5, render="none", tolerance=0.01)
+        fixed_result = fixed._analyze_claim("flat earth", "Scientific_Empirical", False, 5)
+        adaptive_result = adaptive._analyze_claim("flat earth", "Scientific_Empirical", False, 5)
+        self.assertEqual(fixed_result["cycles_used"], 500)
+        self.assertLess(adaptive_result["cycles_used"], 500)
+        self.assertEqual(adaptive_result["verdict"], fixed_result["verdict"])
+
+    def test_incremental_update(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            analyzer = TruthAnalyzer(pages=200, cycles=5, seed=4, render="none", events=NULL_EVENTS,
+                                     store=os.path.join(tmp, "results.db"))
+            analyzer.output_dir = tmp
+            with self.assertRaises(LookupError):
+                analyzer.update("flat earth", [])
+            analyzer.analyze("flat earth", verbose=False)
+            analyzer._seed_claim(4, "flat earth")
+            old = analyzer.search_engine.search_claim("flat earth")
+            new = [{"source": "NASA", "summary": "Orbital photos", "type": "scientific",
+                    "reliability": 0.95, "supports_claim": False}] * 30
+
+            result = analyzer.update("flat earth", new, verbose=False)
+            expected = EvidenceStats.of(old).merge(EvidenceStats.of(new))
+            self.assertEqual(result["evidence_analysis"], expected.analysis())
+            self.assertEqual(result["pages"], 230)
+            self.assertEqual(analyzer.store.load_stats("flat earth"), expected.to_dict())
+            self.assertEqual(len(analyzer.store.query(claim="flat earth")), 2)
+            analyzer.close()
+
     def test_determine_verdict(self):
         analyzer = TruthAnalyzer()
         
@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.cache import ResultCache, make_key, normalize_claim
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_normalized_key(self):
+        self.assertEqual(normalize_claim("  The Earth, is FLAT? "), "the earth is flat")
+        self.assertEqual(make_key("The Earth is flat", "F", 10, 5, 1), make_key("the earth is flat!", "F", 10, 5, 1))
+        self.assertNotEqual(make_key("The Earth is flat", "F", 10, 5, 1), make_key("The Earth is flat", "F", 10, 6, 1))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_disk_tier_and_invalidation(self):
+        key = make_key("flat earth", "F", 10, 5, 1)
+        ResultCache(directory=self.tmp.name).put(key, {"verdict": "UNLIKELY"})
+        cache = ResultCache(directory=self.tmp.name)
+        self.assertEqual(cache.get(key), {"verdict": "UNLIKELY"})
+        self.assertEqual(cache.disk_hits, 1)
+
+        invalidated = []
+        cache.add_invalidation_hook(invalidated.append)
+        cache.invalidate("Flat Earth")
+        self.assertIsNone(cache.get(key))
+        self.assertIsNone(ResultCache(directory=self.tmp.name).get(key))
+        self.assertEqual(invalidated, ["Flat Earth"])
+
+    def test_ttl(self):
+        cache = ResultCache(ttl=0)
+        cache.put("a", 1)
+        with patch('quantum_truth.cache.time.time', return_value=cache._entries["a"][0] + 1):
+            self.assertIsNone(cache.get("a"))
+
+    @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
+    def test_analyzer_returns_cached_verdict(self, mock_save):
+        analyzer = TruthAnalyzer(pages=5, cycles=3, seed=1, render="none", cache=True)
+        analyzer.output_dir = self.tmp.name
+        first = analyzer.analyze("flat earth", verbose=False)
+        with patch.object(analyzer, '_run_analysis') as mock_run:
+            second = analyzer.analyze("Flat Earth?", verbose=False)
+            mock_run.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(analyzer.cache_stats()["hits"], 1)
+        self.assertEqual(analyzer.cache_stats()["misses"], 1)
+
+    def test_knowledge_base_is_part_of_key(self):
+        path = os.path.join(self.tmp.name, "knowledge.jsonl")
+        with open(path, "w") as f:
+            f.write(json.dumps({"key": "flat_earth", "claim": "The Earth is flat", "evidence": [
+                {"source": "Forum", "summary": "Flat", "type": "social", "reliability": 0.9,
+                 "supports_claim": True}]}) + "\n")
+        self.assertNotEqual(make_key("c", "f", 1, 1, 0, knowledge=path), make_key("c", "f", 1, 1, 0))
+        results = []
+        for knowledge_base in (None, path):
+            analyzer = TruthAnalyzer(pages=5, cycles=3, seed=1, render="none", cache=True, store=False,
+                                     knowledge_base=knowledge_base)
+            analyzer.output_dir = self.tmp.name
+            results.append(analyzer.analyze("The Earth is flat", verbose=False))
+            self.assertEqual(analyzer.cache_stats()["misses"], 1)
+            analyzer.close()
+        self.assertNotEqual(results[0], results[1])
+
+    def test_agent_roster_is_part_of_key(self):
+        for agents in (None, ["FactChecker", "Scientist"]):
+            analyzer = TruthAnalyzer(pages=5, cycles=3, seed=1, render="none", cache=True, store=False,
+                                     agents=agents)
+            analyzer.output_dir = self.tmp.name
+            analyzer.analyze("The Earth is flat", verbose=False)
+            self.assertEqual(analyzer.cache_stats()["misses"], 1)
+            analyzer.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.cache import make_key
+from quantum_truth.calibration import Calibration, _auc, read_weights, write_weights
+from quantum_truth.engines import ChatbotEngine, SCORING_WEIGHTS
+from quantum_truth.events import NULL_EVENTS
+
+LABELLED = [("The Earth is flat", None, False), ("Vaccines cause autism", None, False),
+            ("Earth orbits sun", None, True), ("Gravity", None, True), ("Moon landing was faked", None, False),
+            ("Climate change is real", None, True)]
+
+class TestCalibration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = TruthAnalyzer(pages=200, render="none", store=False, events=NULL_EVENTS)
+        cls.calibration = Calibration.from_claims(cls.analyzer, LABELLED, seed=5)
+
+    def test_base_truth_matches_engine(self):
+        calibration = self.calibration
+        self.assertEqual(calibration.columns[:6],
+                         ("quality", "consensus", "consistency", "certainty", "framework", "agents"))
+        truth = calibration.truth(calibration.base)[:, 0]
+        for i, (claim, _, _) in enumerate(LABELLED):
+            self.analyzer._seed_claim(5, claim)
+            evidence = self.analyzer.search_engine.search_claim(claim)
+            expected = self.analyzer.chatbot_engine.expected_truth(claim, evidence)
+            self.assertAlmostEqual(truth[i], expected, places=6)
+
+    def test_search_and_sweep(self):
+        best, scores, candidates = self.calibration.search(3000, "brier", rng=1)
+        self.assertEqual(candidates.shape, (3000, len(self.calibration.columns)))
+        np.testing.assert_allclose(candidates[1:, :3].sum(axis=1), 1.0)
+        self.assertLessEqual(scores["brier"][best], scores["brier"][0])
+        np.testing.assert_allclose(self.calibration.evaluate(candidates[best])["brier"], scores["brier"][best])
+
+        values = np.linspace(0, 1, 5)
+        surface = self.calibration.sweep(certainty=values, framework=values[:3])
+        self.assertEqual(surface["auc"].shape, (5, 3))
+        point = self.calibration.base.copy()
+        point[3:5] = values[2], values[1]
+        self.assertAlmostEqual(surface["brier"][2, 1], self.calibration.evaluate(point)["brier"][0])
+        with self.assertRaises(ValueError):
+            self.calibration.sweep(unknown=values)
+
+    def test_auc_counts_ties_half(self):
+        truth = np.array([[0.9, 0.5], [0.4, 0.5], [0.6, 0.5], [0.2, 0.1]])
+        labels = np.array([True, False, True, False])
+        np.testing.assert_allclose(_auc(truth, labels), [1.0, 0.75])
+
+    def test_weights_round_trip(self):
+        config = self.calibration.weight_config(self.calibration.base)
+        config["Scoring"]["agents"] = 0.2
+        config["Agents"]["Scientist"] = 0.5
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "weights.ini")
+            write_weights(path, config, "test")
+            self.assertEqual(read_weights(path), config)
+            engine = ChatbotEngine(weights=path)
+            analyzer = TruthAnalyzer(render="none", store=False, events=NULL_EVENTS, weights=path)
+        self.assertEqual(engine.weights["agents"], 0.2)
+        self.assertEqual(engine.agents[1].weight, 0.5)
+        self.assertEqual(ChatbotEngine().weights, SCORING_WEIGHTS)
+        self.assertNotEqual(make_key("c", "f", 1, 1, 0, weights=analyzer.weights), make_key("c", "f", 1, 1, 0))
+
+if __name__ == "__main__":
+    unittest.main()
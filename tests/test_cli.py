@@ -32,5 +32,17 @@ class TestCLI(unittest.TestCase):
             main()
             self.assertEqual(instance.output_dir, "custom_output")
 
+    @patch('quantum_truth.analyzer.TruthAnalyzer.analyze_many')
+    def test_batch_command(self, mock_many):
+        mock_many.return_value = iter([{"claim": "A", "truth_percentage_avg": 0.5}])
+        from cli import main
+        with patch('sys.stdin', new=StringIO("A\n\n# comment\n")), \
+                patch('sys.stdout', new=StringIO()) as fake_out:
+            main(['batch', '-', '--workers', '2', '--seed', '9'])
+            self.assertIn('"claim": "A"', fake_out.getvalue())
+            claims = list(mock_many.call_args[0][0])
+        self.assertEqual(claims, ["A"])
+        self.assertEqual(mock_many.call_args[1]['workers'], 2)
+
 if __name__ == '__main__':
     unittest.main()
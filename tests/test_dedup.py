@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.dedup import deduplicate, minhash_signatures, near_duplicate_clusters
+from quantum_truth.engines import ChatbotEngine, SearchEngine
+from quantum_truth.evidence import EvidenceBatch, EvidenceStats
+
+class TestDedup(unittest.TestCase):
+    def setUp(self):
+        self.search = SearchEngine(pages=5000)
+        self.search.rng = np.random.default_rng(3)
+        self.evidence = self.search.search_claim("The Earth is flat")
+
+    def test_near_duplicate_clusters(self):
+        texts = ["NASA images show a spherical Earth from orbit",
+                 "NASA images show a spherical Earth from orbit!",
+                 "Ancient pyramids were built by skilled Egyptian workers",
+                 "nasa  images show a spherical earth from orbit"]
+        self.assertEqual(near_duplicate_clusters(texts).tolist(), [0, 0, 2, 0])
+        signatures = minhash_signatures(texts)
+        self.assertEqual(signatures.shape, (4, 64))
+        self.assertTrue((signatures[0] == signatures[3]).all())
+
+    def test_weighted_stats_match(self):
+        collapsed = deduplicate(self.evidence)
+        self.assertLess(len(collapsed), len(self.evidence) // 50)
+        self.assertEqual(collapsed.pages, len(self.evidence))
+        full, weighted = EvidenceStats.of(self.evidence), EvidenceStats.of(collapsed)
+        self.assertEqual(weighted.analysis(), full.analysis())
+        self.assertEqual(weighted.source_counts, full.source_counts)
+        self.assertEqual(weighted.first_verified, full.first_verified)
+        self.assertEqual(weighted.verified, full.verified)
+        self.assertAlmostEqual(weighted.reliability_sum, full.reliability_sum, places=2)
+        engine = ChatbotEngine()
+        self.assertAlmostEqual(engine.expected_truth("The Earth is flat", weighted),
+                               engine.expected_truth("The Earth is flat", full), places=6)
+
+    def test_exact_only_and_reweighting(self):
+        records = [{"source": "NASA", "summary": "Round", "type": "scientific", "reliability": 0.9,
+                    "supports_claim": False}] * 3
+        records.append(dict(records[0], reliability=0.75))
+        exact = deduplicate(records, threshold=None)
+        self.assertEqual(exact.weight.tolist(), [3, 1])
+        again = deduplicate(exact)
+        self.assertEqual((len(again), again.pages), (2, 4))
+        self.assertEqual(again[:1].weight.tolist(), [3])
+        self.assertEqual(len(deduplicate(EvidenceBatch.empty())), 0)
+
+    def test_analyzer_dedup(self):
+        results = []
+        for dedup in (None, True):
+            analyzer = TruthAnalyzer(pages=2000, cycles=5, seed=4, render="none", store=False, dedup=dedup)
+            with patch("builtins.print"):
+                results.append(next(analyzer.analyze_many(["The Earth is flat"], workers=1)))
+        self.assertEqual(results[0]["evidence_analysis"], results[1]["evidence_analysis"])
+        self.assertEqual(results[0]["verdict"], results[1]["verdict"])
+        self.assertAlmostEqual(results[0]["truth_percentage_avg"], results[1]["truth_percentage_avg"], places=6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+from quantum_truth.engines import ChatbotEngine, SearchEngine
+
+class TestDebateSeries(unittest.TestCase):
+    def setUp(self):
+        self.engine = ChatbotEngine()
+        self.evidence = SearchEngine(pages=40).search_claim("flat earth")
+
+    def test_series_shape_and_bounds(self):
+        series, rounds, agents, framework = self.engine.debate_series(
+            "flat earth", self.evidence, 1000, verbose=False)
+        self.assertEqual(series.shape, (1000,))
+        self.assertTrue(np.all((series >= 0.01) & (series <= 0.99)))
+        self.assertEqual(len(rounds), 5)
+        self.assertEqual(framework.name, "Scientific_Empirical")
+
+    def test_series_matches_conduct_debate(self):
+        self.engine.rng = np.random.default_rng(7)
+        series, _, _, _ = self.engine.debate_series("flat earth", self.evidence, 3, verbose=False)
+        jitters = np.random.default_rng(7).uniform(0.95, 0.99, 3)
+        base = self.engine._certainty_base(self.evidence)
+        framework_truth, _ = self.engine.frameworks["Scientific_Empirical"].evaluate_statement("flat earth")
+        expected = [max(0.01, min(0.99, max(0.01, min(0.99, base * j)) * 0.7 + framework_truth / 100 * 0.3))
+                    for j in jitters]
+        np.testing.assert_allclose(series, expected)
+
+        tp, rounds, agents, framework = self.engine.conduct_debate(
+            "flat earth", self.evidence, 0, verbose=False)
+        self.assertIsInstance(tp, float)
+
+    def test_empty_evidence(self):
+        series, _, _, _ = self.engine.debate_series("unknown", [], 10, verbose=False)
+        self.assertEqual(len(series), 10)
+
+    def test_adaptive_stops_early_on_prefix(self):
+        self.engine.rng = np.random.default_rng(3)
+        full, _, _, _ = self.engine.debate_series("flat earth", self.evidence, 1000, verbose=False)
+        self.engine.rng = np.random.default_rng(3)
+        adaptive, _, _, _ = self.engine.debate_series("flat earth", self.evidence, 1000, verbose=False,
+                                                      tolerance=0.01, min_cycles=10)
+        self.assertLess(len(adaptive), 1000)
+        self.assertGreaterEqual(len(adaptive), 10)
+        np.testing.assert_allclose(adaptive, full[:len(adaptive)])
+        width = 2 * 1.96 * adaptive.std(ddof=1) / np.sqrt(len(adaptive))
+        self.assertLessEqual(width, 0.01)
+
+    def test_adaptive_respects_max_cycles(self):
+        series, _, _, _ = self.engine.debate_series("unknown", [], 50, verbose=False,
+                                                    tolerance=1e-6, min_cycles=10)
+        self.assertEqual(len(series), 50)
+
+class TestSearchEngine(unittest.TestCase):
+    def test_seeded_evidence_is_reproducible(self):
+        for claim in ("flat earth", "unknown claim"):
+            first = SearchEngine(pages=500, rng=11).search_claim(claim)
+            second = SearchEngine(pages=500, rng=11).search_claim(claim)
+            self.assertEqual(first.to_records(), second.to_records())
+            np.testing.assert_array_equal(first.reliability, second.reliability)
+
+    def test_generated_evidence(self):
+        evidence = SearchEngine(pages=5000, rng=1).search_claim("flat earth")
+        self.assertTrue(np.all((evidence.reliability >= 0.01) & (evidence.reliability <= 0.99)))
+        summaries = {record["summary"] for record in evidence}
+        self.assertIn("Space missions demonstrate Earth's spherical shape", summaries)
+        self.assertIn("Space missions show Earth's spherical shape", summaries)
+        rewritten = np.mean([record["source"] == "NASA" and "show" not in record["summary"]
+                             for record in evidence]) / np.mean([r["source"] == "NASA" for r in evidence])
+        self.assertAlmostEqual(rewritten, 0.4, delta=0.05)
+
+if __name__ == '__main__':
+    unittest.main()
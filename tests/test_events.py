@@ -0,0 +1,55 @@
+import io
+import json
+import unittest
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.events import EventLog, JsonLinesSink, NULL_EVENTS, TextSink, event_log
+
+class TestEvents(unittest.TestCase):
+    def test_text_sink_buffers_until_flush(self):
+        stream = io.StringIO()
+        events = EventLog(TextSink(stream))
+        events.emit("debate.conclusion", claim="flat earth", truth_percentage=0.25)
+        events.emit("custom", value=1)
+        self.assertEqual(stream.getvalue(), "")
+        events.flush()
+        self.assertIn("TRUTH PERCENTAGE: 25.0000%", stream.getvalue())
+        self.assertTrue(stream.getvalue().endswith("custom: value=1\n"))
+
+    def test_json_lines_sink(self):
+        stream = io.StringIO()
+        events = event_log("jsonl", stream)
+        events.emit("analysis.cached", claim="flat earth", verdict="UNLIKELY", truth_percentage_avg=0.1)
+        events.flush()
+        record = json.loads(stream.getvalue())
+        self.assertEqual((record["event"], record["verdict"]), ("analysis.cached", "UNLIKELY"))
+        self.assertIs(event_log("none"), NULL_EVENTS)
+
+    def test_progress_is_rate_limited(self):
+        stream = io.StringIO()
+        events = EventLog(JsonLinesSink(stream), progress=True, progress_interval=60)
+        for done in range(1, 11):
+            events.progress("evidence.progress", done, 10, truth_percentage=0.5)
+        self.assertEqual([json.loads(line)["done"] for line in stream.getvalue().splitlines()], [1, 10])
+        # Off by default when the stream is not a terminal
+        self.assertFalse(EventLog(TextSink(io.StringIO())).progress_enabled)
+
+    def test_quiet_analysis_writes_nothing(self):
+        analyzer = TruthAnalyzer(pages=10, cycles=3, seed=1, render="none", store=False, events=NULL_EVENTS)
+        with patch("sys.stdout", new=io.StringIO()) as out, patch("time.sleep") as sleep:
+            analyzer.analyze("The Earth is flat", verbose=True)
+        self.assertEqual(out.getvalue(), "")
+        sleep.assert_not_called()
+
+    def test_verbose_analysis_events(self):
+        stream = io.StringIO()
+        analyzer = TruthAnalyzer(pages=10, cycles=3, seed=1, render="none", store=False,
+                                 events=EventLog(JsonLinesSink(stream)))
+        analyzer.analyze("The Earth is flat", verbose=True)
+        names = [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+        self.assertEqual(names[0], "analysis.start")
+        self.assertEqual(names.count("debate.argument"), len(analyzer.chatbot_engine.agents))
+        self.assertEqual(names[-1], "analysis.verdict")
+
+if __name__ == "__main__":
+    unittest.main()
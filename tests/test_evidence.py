@@ -0,0 +1,108 @@
+import json
+import unittest
+import numpy as np
+from quantum_truth.evidence import EvidenceBatch, EvidenceStats
+from quantum_truth.agents import DebateAgent
+from quantum_truth.frameworks import AxiomaticFramework
+from quantum_truth.engines import SearchEngine, ChatbotEngine
+
+class TestEvidenceBatch(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"source": "NASA", "summary": "Round", "type": "scientific", "reliability": 0.9, "supports_claim": False},
+            {"source": "Forum", "summary": "Flat", "type": "conspiracy", "reliability": 0.1, "supports_claim": True},
+            {"source": "NASA", "summary": "Round", "type": "historical", "reliability": 0.75, "supports_claim": False}
+        ]
+        self.batch = EvidenceBatch.from_records(self.records)
+
+    def test_columns(self):
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch.reliability.dtype, np.float32)
+        self.assertEqual(self.batch.supports_claim.dtype, bool)
+        self.assertEqual(len(self.batch.sources), 2)
+        self.assertEqual(len(self.batch.summaries), 2)
+
+    def test_dict_adapter(self):
+        records = self.batch.to_records()
+        self.assertEqual([r['source'] for r in records], ["NASA", "Forum", "NASA"])
+        self.assertEqual(self.batch[1]['type'], "conspiracy")
+        self.assertTrue(self.batch[1]['supports_claim'])
+        self.assertAlmostEqual(self.batch[0]['reliability'], 0.9, places=6)
+
+    def test_take(self):
+        subset = self.batch[self.batch.type_mask('scientific')]
+        self.assertEqual(len(subset), 1)
+        self.assertEqual(subset[0]['summary'], "Round")
+        self.assertFalse(self.batch.type_mask('unknown').any())
+
+    def test_too_many_types(self):
+        records = [dict(self.records[0], type=f"type {i}") for i in range(257)]
+        with self.assertRaises(ValueError):
+            EvidenceBatch.from_records(records)
+
+    def test_engines_accept_lists_and_batches(self):
+        search = SearchEngine(pages=3)
+        self.assertEqual(search.analyze_evidence(self.records), search.analyze_evidence(self.batch))
+        analysis = search.analyze_evidence(self.batch)
+        self.assertEqual(analysis['reliable'], 1)
+        self.assertEqual(analysis['support'], 1)
+        self.assertEqual(analysis['oppose'], 2)
+        certainty = ChatbotEngine().calculate_certainty(self.batch)
+        self.assertGreater(certainty, 0.0)
+        self.assertLess(certainty, 1.0)
+
+    def test_generate_evidence(self):
+        search = SearchEngine(pages=50)
+        evidence = search.search_claim("flat earth")
+        self.assertIsInstance(evidence, EvidenceBatch)
+        self.assertEqual(len(evidence), 50)
+        self.assertLessEqual(len(evidence.sources), 3)
+
+class TestEvidenceStats(unittest.TestCase):
+    def test_chunked_stats_match_whole(self):
+        search = SearchEngine(pages=1000)
+        evidence = search.search_claim("flat earth")
+        whole = EvidenceStats.of(evidence)
+        chunked = EvidenceStats()
+        for start in range(0, 1000, 128):
+            chunked.update(evidence[start:start + 128])
+        self.assertEqual(whole.analysis(), chunked.analysis())
+        self.assertAlmostEqual(whole.reliability_sum, chunked.reliability_sum, places=6)
+        self.assertEqual(whole.first_verified, chunked.first_verified)
+
+        merged = EvidenceStats.of(evidence[:300]).merge(EvidenceStats.of(evidence[300:]))
+        self.assertEqual(merged.analysis(), whole.analysis())
+        self.assertEqual(merged.contradictions, whole.contradictions)
+
+    def test_dict_round_trip(self):
+        evidence = SearchEngine(pages=600).search_claim("flat earth")
+        stats = EvidenceStats.of(evidence[:400])
+        restored = EvidenceStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+        self.assertEqual(restored.to_dict(), stats.to_dict())
+        restored.merge(EvidenceStats.of(evidence[400:]))
+        whole = EvidenceStats.of(evidence[:400]).merge(EvidenceStats.of(evidence[400:]))
+        self.assertEqual(restored.to_dict(), whole.to_dict())
+        self.assertEqual(stats.total, 400)
+
+    def test_agents_accept_stats(self):
+        records = [
+            {"source": "A", "summary": "a", "type": "historical", "reliability": 0.9, "supports_claim": True},
+            {"source": "B", "summary": "b", "type": "historical", "reliability": 0.5, "supports_claim": False}
+        ]
+        framework = AxiomaticFramework("Science", ["Gravity"])
+        for role in ["FactChecker", "Scientist", "Logician", "Historian"]:
+            from_list = DebateAgent(role, "x")
+            from_stats = DebateAgent(role, "x")
+            self.assertEqual(from_list.formulate_argument("c", records, framework),
+                             from_stats.formulate_argument("c", EvidenceStats.of(records), framework))
+            self.assertEqual(from_list.confidence, from_stats.confidence)
+
+    def test_streaming_analysis(self):
+        search = SearchEngine(pages=1000)
+        chunks = list(search.iter_evidence("flat earth", chunk_size=300))
+        self.assertEqual([len(c) for c in chunks], [300, 300, 300, 100])
+        synthetic = list(search.iter_evidence("unknown claim", chunk_size=600))
+        self.assertEqual(synthetic[1][0]['source'], "Source 601")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from quantum_truth.frameworks import AxiomaticFramework
+import threading
+from quantum_truth.frameworks import AxiomaticFramework, evaluate_all, default_frameworks
 
 class TestAxiomaticFramework(unittest.TestCase):
     def setUp(self):
@@ -28,5 +29,39 @@ class TestAxiomaticFramework(unittest.TestCase):
         self.assertIn("Constructual Diplomacy", pathway)
         self.assertIn("Axiomogenesis", pathway)
 
+    def test_normalized_match(self):
+        framework = AxiomaticFramework("Science", ["Earth_Orbits_Sun"])
+        self.assertEqual(framework.evaluate_statement("earth orbits sun!"), (100.0, ()))
+        self.assertEqual(framework.evaluate_statement("Sun orbits Earth")[1], ("Earth_Orbits_Sun",))
+
+    def test_memoized_and_stateless(self):
+        framework = AxiomaticFramework("Science", [f"Axiom_{i}" for i in range(5000)])
+        self.assertEqual(framework.evaluate_statement("axiom 4999"), (100.0, ()))
+        truth, conflicts = framework.evaluate_statement("FlatEarth")
+        self.assertEqual((truth, len(conflicts)), (1.05, 5000))
+        framework.evaluate_statement("flatearth!")
+        self.assertEqual(framework.cache_info().hits, 1)
+        self.assertIn("and 4990 more", framework.transformation_pathway("FlatEarth"))
+
+        results = []
+        threads = [threading.Thread(target=lambda s=s: results.append(framework.evaluate_statement(s)[0]))
+                   for s in ["Axiom_1", "Moon"] * 8]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(set(results)), [1.05, 100.0])
+
+    def test_add_axioms(self):
+        self.framework.add_axioms(["Plate_Tectonics"])
+        self.assertEqual(self.framework.evaluate_statement("plate tectonics")[0], 100.0)
+
+    def test_evaluate_all(self):
+        frameworks = default_frameworks()
+        results = evaluate_all(frameworks, "Moon landing occurred")
+        self.assertEqual(set(results), set(frameworks))
+        self.assertEqual(results["Historical_Consensus"], (100.0, ()))
+        self.assertEqual(results["Scientific_Empirical"], frameworks["Scientific_Empirical"].evaluate_statement("x"))
+
 if __name__ == '__main__':
     unittest.main()
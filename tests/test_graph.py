@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.engines import SearchEngine
+from quantum_truth.evidence import EvidenceStats
+from quantum_truth.graph import NULL_GRAPH, TruthGraph
+
+def evidence(*rows):
+    return EvidenceStats.of([{"source": source, "summary": "", "type": "news", "reliability": 0.9,
+                              "supports_claim": supports} for source, supports in rows])
+
+class TestTruthGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = TruthGraph()
+        self.addCleanup(self.graph.close)
+        self.graph.add_analysis("Claim A", "Scientific_Empirical",
+                                evidence(("NASA", False), ("Blog", True), ("Wire", True)), 0.2)
+        self.graph.add_analysis("Claim B", "Scientific_Empirical", evidence(("NASA", True), ("Blog", True)), 0.8)
+        self.graph.add_analysis("Claim C", "Scientific_Empirical", evidence(("Wire", True)), 0.6)
+
+    def test_queries(self):
+        self.assertEqual(self.graph.sources("claim a!"), {"NASA": "opposes", "Blog": "supports", "Wire": "supports"})
+        self.assertEqual(self.graph.related_claims("Claim A"), [("Claim B", 2), ("Claim C", 1)])
+        self.assertEqual(self.graph.shared_sources("Claim A", "Claim B"), ["Blog", "NASA"])
+        self.assertEqual(self.graph.contradictions("Claim A"), [("Claim B", "NASA")])
+        self.assertEqual(self.graph.related_claims("Unknown"), [])
+
+    def test_append_only_history(self):
+        self.graph.add_analysis("Claim A", "Historical_Consensus", evidence(("NASA", True)), 0.5)
+        history = self.graph.history("Claim A")
+        self.assertEqual([h["framework"] for h in history], ["Scientific_Empirical", "Historical_Consensus"])
+        self.assertEqual(self.graph.sources("Claim A")["NASA"], "supports")
+        self.assertEqual(self.graph.stats()["analyses"], 4)
+
+    def test_source_tallies_are_capped(self):
+        stats = evidence(*[(f"Source {i}", True) for i in range(EvidenceStats.MAX_SOURCES + 10)])
+        self.assertEqual(len(stats.source_counts), EvidenceStats.MAX_SOURCES)
+        stats.merge(evidence(("Late", True), ("Source 0", False)))
+        self.assertNotIn("Late", stats.source_counts)
+        self.assertEqual((stats.source_counts["Source 0"], stats.source_support["Source 0"]), (2, 1))
+
+    def test_synthetic_sources_are_skipped(self):
+        search = SearchEngine(pages=50, rng=1)
+        for claim in ("Unknown claim one", "Unknown claim two"):
+            stats = EvidenceStats.of(search.synthetic_evidence(claim))
+            self.assertTrue(stats.synthetic)
+            self.graph.add_analysis(claim, "Scientific_Empirical", stats, 0.5)
+        self.assertEqual(self.graph.sources("Unknown claim one"), {})
+        self.assertEqual(self.graph.related_claims("Unknown claim one"), [])
+        self.assertEqual(len(self.graph.history("Unknown claim one")), 1)
+        self.assertFalse(EvidenceStats.from_dict({"total": 0}).synthetic)
+
+    def test_graph_is_opt_in(self):
+        analyzer = TruthAnalyzer(pages=20, cycles=2, seed=1, render="none", store=False)
+        self.assertIs(analyzer.chatbot_engine.truth_graph, NULL_GRAPH)
+        self.assertIsNone(analyzer._worker_options()["graph"])
+        analyzer.close()
+
+    def test_analyzer_persists_graph(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.db")
+            for claim in ("The Earth is flat", "The Earth is flat"):
+                analyzer = TruthAnalyzer(pages=20, cycles=2, seed=1, render="none", graph=path)
+                analyzer.output_dir = tmp
+                with patch("builtins.print"):
+                    analyzer.analyze(claim, verbose=False)
+                analyzer.close()
+            self.assertEqual(len(analyzer.chatbot_engine.debate_history["The Earth is flat"]), 1)
+            graph = TruthGraph(path)
+            self.assertEqual(len(graph.history("The Earth is flat")), 2)
+            self.assertEqual(graph.sources("The Earth is flat")["NASA"], "opposes")
+            graph.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("matplotlib", "networkx", "tqdm", "PIL")
+# Cumulative microseconds for `import quantum_truth.analyzer` (~220ms, of which numpy is ~100ms)
+CORE_IMPORT_BUDGET_US = 400000
+
+def import_times(statement):
+    """Run statement under -X importtime and return {module: cumulative microseconds}"""
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+class TestImports(unittest.TestCase):
+    def test_core_skips_plotting_stack(self):
+        times = import_times("import quantum_truth.analyzer")
+        loaded = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+        self.assertEqual(loaded, [])
+        self.assertLess(times["quantum_truth.analyzer"], CORE_IMPORT_BUDGET_US)
+
+    def test_package_import_is_lazy(self):
+        times = import_times("import quantum_truth")
+        self.assertNotIn("numpy", times)
+        self.assertNotIn("quantum_truth.analyzer", times)
+
+    def test_cli_startup_skips_numpy(self):
+        times = import_times("import cli")
+        self.assertNotIn("numpy", times)
+
+    def test_lazy_attribute(self):
+        import quantum_truth
+        from quantum_truth.analyzer import TruthAnalyzer
+        self.assertIs(quantum_truth.TruthAnalyzer, TruthAnalyzer)
+        with self.assertRaises(AttributeError):
+            quantum_truth.NotAThing
+
+if __name__ == "__main__":
+    unittest.main()
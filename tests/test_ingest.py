@@ -0,0 +1,109 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.engines import SearchEngine
+from quantum_truth.events import NULL_EVENTS
+from quantum_truth.evidence import EvidenceStats
+from quantum_truth.ingest import EvidenceCorpus, coerce_row, ingest
+
+CLAIMS = ["The Earth is flat", "Vaccines cause autism", "The moon landing was faked"]
+
+
+def make_rows(count):
+    return [{"claim": CLAIMS[i % 3], "source": f"Source {i % 7}", "summary": f"Finding {i} about it",
+             "type": ["scientific", "news", "social"][i % 3], "reliability": round(0.1 + (i % 9) / 10, 2),
+             "supports_claim": i % 4 == 0} for i in range(count)]
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.rows = make_rows(300)
+        self.jsonl = os.path.join(self.directory, "evidence.jsonl")
+        with open(self.jsonl, "w") as f:
+            for row in self.rows[:200]:
+                f.write(json.dumps(row) + "\n")
+            f.write("{not json\n")
+            f.write(json.dumps(dict(self.rows[0], reliability=1.5)) + "\n")
+        self.csv = os.path.join(self.directory, "evidence.csv")
+        with open(self.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.rows[0]))
+            writer.writeheader()
+            writer.writerows(self.rows[200:])
+            writer.writerow(dict(self.rows[0], type="rumour"))
+        self.output = os.path.join(self.directory, "corpus")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def expected(self, claim):
+        return [{name: row[name] for name in ("source", "summary", "type", "reliability", "supports_claim")}
+                for row in self.rows if row["claim"] == claim]
+
+    def assertRecords(self, batch, records):
+        self.assertEqual(len(batch), len(records))
+        for got, want in zip(batch, records):
+            self.assertAlmostEqual(got.pop("reliability"), want["reliability"], places=5)
+            self.assertEqual(got, {name: value for name, value in want.items() if name != "reliability"})
+
+    def test_coerce_row(self):
+        row = {"claim": " Claim ", "source": "S", "summary": "x", "type": "Scientific",
+               "reliability": "0.5", "supports_claim": "yes"}
+        self.assertEqual(coerce_row(row), ("Claim", "S", "x", "scientific", 0.5, True))
+        for field, value in [("type", "rumour"), ("reliability", "high"), ("reliability", -0.1),
+                             ("supports_claim", "maybe"), ("source", "")]:
+            with self.assertRaises(ValueError):
+                coerce_row(dict(row, **{field: value}))
+
+    def test_parallel_chunks_match_serial(self):
+        # Small chunks force lines and CSV records to straddle chunk boundaries
+        serial = ingest([self.jsonl, self.csv], self.output, workers=1, chunk_bytes=1 << 20)
+        parallel_output = os.path.join(self.directory, "parallel")
+        parallel = ingest([self.jsonl, self.csv], parallel_output, workers=2, chunk_bytes=997)
+        self.assertEqual(serial["rows"], 300)
+        self.assertEqual(serial["errors"], 3)
+        self.assertEqual(len(serial["error_samples"]), 3)
+        self.assertEqual(serial["claims"], parallel["claims"])
+        for name in ("reliability", "supports_claim", "type_codes", "source_codes", "summary_codes"):
+            np.testing.assert_array_equal(np.load(os.path.join(self.output, f"{name}.npy")),
+                                          np.load(os.path.join(parallel_output, f"{name}.npy")))
+
+    def test_corpus_slices(self):
+        ingest([self.jsonl, self.csv], self.output, workers=1, chunk_bytes=1500)
+        corpus = EvidenceCorpus(self.output)
+        self.assertEqual(sorted(corpus.claims()), sorted(CLAIMS))
+        self.assertIn("the earth is  FLAT", corpus)
+        self.assertIsNone(corpus.evidence("Unknown claim"))
+        for claim in CLAIMS:
+            self.assertRecords(corpus.evidence(claim), self.expected(claim))
+        batch = corpus.evidence(CLAIMS[0], 10, 20)
+        self.assertRecords(batch, self.expected(CLAIMS[0])[10:20])
+        # Zero-copy: the columns are views of the mapped files
+        self.assertFalse(batch.reliability.flags.owndata)
+        self.assertEqual(EvidenceStats.of(batch).analysis(),
+                         EvidenceStats.of(self.expected(CLAIMS[0])[10:20]).analysis())
+
+    def test_search_engine_and_analyzer(self):
+        ingest([self.jsonl, self.csv], self.output, workers=1)
+        corpus = EvidenceCorpus(self.output)
+        search = SearchEngine(pages=30, corpus=corpus)
+        self.assertRecords(search.search_claim(CLAIMS[1]), self.expected(CLAIMS[1])[:30])
+        chunks = list(search.iter_evidence(CLAIMS[1], chunk_size=8))
+        self.assertEqual([len(chunk) for chunk in chunks], [8, 8, 8, 6])
+        self.assertEqual(len(search.search_claim("Unknown claim")), 30)
+
+        analyzer = TruthAnalyzer(pages=30, cycles=3, seed=1, render="none", store=False, corpus=self.output,
+                                 events=NULL_EVENTS)
+        analyzer.output_dir = self.directory
+        self.assertEqual(analyzer._worker_options()["corpus"], self.output)
+        result, = analyzer.analyze_many([CLAIMS[1]], workers=1)
+        self.assertEqual(result["evidence_analysis"], EvidenceStats.of(self.expected(CLAIMS[1])[:30]).analysis())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+import unittest
+from quantum_truth.knowledge import KnowledgeBase, default_knowledge_base, normalize_terms
+from quantum_truth.engines import SearchEngine
+
+class TestKnowledgeBase(unittest.TestCase):
+    def setUp(self):
+        self.kb = default_knowledge_base()
+
+    def test_normalize_terms(self):
+        self.assertEqual(normalize_terms("Is the Earth flat?"), ["earth", "flat"])
+        self.assertEqual(normalize_terms("vaccine_microchips"), ["vaccine", "microchip"])
+
+    def test_lookup_variants(self):
+        flat = self.kb.get("flat_earth")
+        self.assertEqual(self.kb.lookup("flat earth"), flat)
+        self.assertEqual(self.kb.lookup("Is the earth flat?"), flat)
+        self.assertEqual(self.kb.lookup("The EARTH is flat"), flat)
+        self.assertIsNotNone(self.kb.lookup("Do vacines contain microchip?"))
+        self.assertIsNone(self.kb.lookup("The moon landing was faked"))
+        self.assertIsNone(self.kb.lookup("Climate change is real"))
+
+    def test_negated_claims(self):
+        self.assertEqual(normalize_terms("Vaccines don't contain microchips"),
+                         ["vaccine", "not", "contain", "microchip"])
+        self.assertIsNone(self.kb.lookup("The Earth is not flat"))
+        self.assertIsNone(self.kb.lookup("Vaccines do not contain microchips"))
+        self.assertIsNone(self.kb.lookup("Aliens never built the pyramids"))
+        self.assertEqual(SearchEngine(pages=5, rng=1).search_claim("The Earth is not flat")[0]["source"], "Source 1")
+
+    def test_ranked_search(self):
+        matches = self.kb.search("aliens built pyramids", k=3)
+        self.assertEqual(matches[0][0], "pyramids_aliens")
+        self.assertEqual(matches[0][1], 1.0)
+
+    def test_external_corpus(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = os.path.join(tmp, "corpus.jsonl")
+            with open(corpus, "w") as f:
+                for i in range(200):
+                    f.write(json.dumps({"key": f"topic_{i}", "claim": f"Topic number {i} is settled",
+                                        "evidence": [{"source": f"S{i}", "summary": "x", "type": "news",
+                                                      "reliability": 0.5, "supports_claim": True}]}) + "\n")
+            db = os.path.join(tmp, "kb.sqlite")
+            kb = KnowledgeBase.from_jsonl(corpus, db_path=db)
+            self.assertEqual(len(kb), 200)
+            kb.close()
+            reopened = KnowledgeBase(db)
+            self.assertEqual(reopened.lookup("topic 42 settled")[0]["source"], "S42")
+            engine = SearchEngine(pages=10, knowledge_base=reopened)
+            self.assertEqual(set(r["source"] for r in engine.search_claim("Is topic 7 settled?")), {"S7"})
+            reopened.close()
+
+if __name__ == '__main__':
+    unittest.main()
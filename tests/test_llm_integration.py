@@ -0,0 +1,62 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+from quantum_truth.llm_integration import AsyncLLMProvider, LLMProvider
+from quantum_truth.llm_stub import StubLLMServer, stub_completion
+
+def run(coro):
+    return asyncio.run(coro)
+
+class TestAsyncLLMProvider(unittest.TestCase):
+    def test_batching_and_pooling(self):
+        async def scenario():
+            async with StubLLMServer() as server:
+                async with AsyncLLMProvider(server.url, batch_size=8, max_connections=2) as llm:
+                    prompts = [f"prompt {i}" for i in range(32)]
+                    answers = await llm.query_many(prompts)
+                return answers, prompts, server.requests, llm.stats
+        answers, prompts, requests, stats = run(scenario())
+        self.assertEqual(answers, [stub_completion(p) for p in prompts])
+        self.assertEqual(requests, 4)
+        self.assertEqual(stats["requests"], 4)
+
+    def test_coalescing_and_cache(self):
+        async def scenario():
+            async with StubLLMServer() as server:
+                async with AsyncLLMProvider(server.url) as llm:
+                    first = await asyncio.gather(*(llm.query("same prompt") for _ in range(10)))
+                    again = await llm.query("same prompt")
+                return first, again, server.prompts, llm.stats
+        first, again, prompts, stats = run(scenario())
+        self.assertEqual(set(first), {stub_completion("same prompt")})
+        self.assertEqual(again, first[0])
+        self.assertEqual(prompts, 1)
+        self.assertEqual(stats["coalesced"], 9)
+        self.assertEqual(stats["cache_hits"], 1)
+
+    def test_retry_with_backoff(self):
+        async def scenario():
+            async with StubLLMServer(fail_first=2) as server:
+                async with AsyncLLMProvider(server.url, backoff=0.001) as llm:
+                    answer = await llm.query("retry me")
+                return answer, llm.stats
+        answer, stats = run(scenario())
+        self.assertEqual(answer, stub_completion("retry me"))
+        self.assertEqual(stats["retries"], 2)
+
+    def test_timeout(self):
+        async def scenario():
+            async with StubLLMServer(latency=0.5) as server:
+                async with AsyncLLMProvider(server.url, timeout=0.05, retries=1, backoff=0.001) as llm:
+                    await llm.query("slow")
+        with self.assertRaises(asyncio.TimeoutError):
+            run(scenario())
+
+    def test_sync_provider_requires_configuration(self):
+        # An empty base_url falls back to LLM_BASE_URL, so clear the environment
+        with patch.dict(os.environ, {}, clear=True), self.assertRaises(NotImplementedError):
+            LLMProvider(provider="openai", api_key="x", base_url="").query("hello")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.metrics import Metrics, NULL_METRICS
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_null_metrics(self):
+        with NULL_METRICS.span("stage", pages=10):
+            NULL_METRICS.incr("analyses")
+        self.assertFalse(NULL_METRICS.enabled)
+
+    def test_span_and_exports(self):
+        metrics = Metrics()
+        with metrics.span("debate", cycles=3):
+            metrics.incr("analyses")
+        self.assertEqual(metrics.histograms["debate"].count, 1)
+        self.assertEqual(metrics.events[0]["args"], {"cycles": 3})
+
+        trace_path = os.path.join(self.tmp.name, "trace.json")
+        metrics.export(trace_path)
+        with open(trace_path) as f:
+            self.assertEqual(json.load(f)["traceEvents"][0]["name"], "debate")
+
+        prom_path = os.path.join(self.tmp.name, "metrics.prom")
+        metrics.export(prom_path)
+        with open(prom_path) as f:
+            text = f.read()
+        self.assertIn("quantum_truth_analyses_total 1", text)
+        self.assertIn('quantum_truth_stage_seconds_count{stage="debate"} 1', text)
+
+    def test_event_cap(self):
+        metrics = Metrics(max_events=1)
+        for _ in range(3):
+            with metrics.span("stage"):
+                pass
+        self.assertEqual(len(metrics.events), 1)
+        self.assertEqual(metrics.dropped_events, 2)
+        self.assertEqual(metrics.histograms["stage"].count, 3)
+
+    def test_analyzer_stages(self):
+        metrics = Metrics(profile=True)
+        analyzer = TruthAnalyzer(pages=10, cycles=3, seed=1, render="none", metrics=metrics)
+        analyzer.output_dir = self.tmp.name
+        with patch("builtins.print"):
+            analyzer.analyze("The Earth is flat", verbose=False)
+        stages = metrics.summary()["stages"]
+        for stage in ("evidence.search", "evidence.stats", "debate", "agent.FactChecker", "results.save"):
+            self.assertIn(stage, stages)
+        self.assertEqual(metrics.counters["debate.cycles"], 3)
+
+        profile_path = os.path.join(self.tmp.name, "run.prof")
+        metrics.export(profile_path)
+        self.assertTrue(os.path.getsize(profile_path) > 0)
+
+if __name__ == "__main__":
+    unittest.main()
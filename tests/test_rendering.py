@@ -0,0 +1,80 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from PIL import Image
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.frameworks import default_frameworks
+from quantum_truth.rendering import (Renderer, SPEC_FILE, debate_animation_spec, render_file, render_spec,
+                                     truth_evolution_spec)
+
+class TestRendering(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
+    def test_deferred_records_specs(self, mock_save):
+        analyzer = TruthAnalyzer(pages=5, cycles=3, render="deferred")
+        analyzer.output_dir = self.tmp.name
+        analyzer.analyze("flat earth", verbose=False)
+        spec_path = os.path.join(self.tmp.name, SPEC_FILE)
+        with open(spec_path) as f:
+            specs = [json.loads(line) for line in f]
+        kinds = [spec["kind"] for spec in specs]
+        self.assertEqual(kinds.count("debate_animation"), 1)
+        self.assertEqual(len(specs[kinds.index("debate_animation")]["frames"]), 3)
+        self.assertIn("confidence", kinds)
+        self.assertIn("truth_evolution", kinds)
+        self.assertFalse([name for name in os.listdir(self.tmp.name) if name.endswith(".png")])
+
+    @patch('quantum_truth.rendering.render_spec')
+    @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
+    def test_no_render(self, mock_save, mock_render):
+        analyzer = TruthAnalyzer(pages=5, cycles=3, render="none")
+        analyzer.output_dir = self.tmp.name
+        analyzer.analyze("flat earth", verbose=False)
+        mock_render.assert_not_called()
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, SPEC_FILE)))
+
+    def test_render_file(self):
+        spec_path = os.path.join(self.tmp.name, SPEC_FILE)
+        image_path = os.path.join(self.tmp.name, "evolution.png")
+        spec = truth_evolution_spec("claim", [0.2, 0.3, 0.25])
+        spec["path"] = image_path
+        Renderer("deferred").submit([spec], spec_path)
+        self.assertEqual(render_file(spec_path), (1, 0))
+        self.assertTrue(os.path.exists(image_path))
+
+    @patch('quantum_truth.analyzer.TruthAnalyzer._save_results')
+    def test_png_debate_format(self, mock_save):
+        analyzer = TruthAnalyzer(pages=5, cycles=3, render="deferred", debate_format="png")
+        analyzer.output_dir = self.tmp.name
+        analyzer.analyze("flat earth", verbose=False)
+        with open(os.path.join(self.tmp.name, SPEC_FILE)) as f:
+            kinds = [json.loads(line)["kind"] for line in f]
+        self.assertEqual(kinds.count("debate"), 3)
+        with self.assertRaises(ValueError):
+            TruthAnalyzer(debate_format="bmp")
+
+    def test_debate_animation(self):
+        framework = default_frameworks()["Scientific_Empirical"]
+        rounds = [{"agent": "Scientist", "arguments": ["Evidence"], "confidence": 0.8},
+                  {"agent": "Skeptic", "arguments": ["Doubt"], "confidence": 0.3}]
+        spec = debate_animation_spec("flat earth", rounds, [(0, 0.2), (4, 0.25), (9, 0.3)], framework,
+                                     self.tmp.name)
+        self.assertTrue(render_spec(spec))
+        self.assertTrue(spec["path"].endswith(".gif"))
+        with Image.open(spec["path"]) as image:
+            self.assertEqual(image.n_frames, 3)
+            image.seek(2)
+            self.assertEqual(image.info["duration"], 500)
+        self.assertTrue(os.path.exists(spec["pathway_path"]))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Renderer("sometimes")
+
+if __name__ == '__main__':
+    unittest.main()
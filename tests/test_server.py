@@ -0,0 +1,81 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.httpio import HTTPError
+from quantum_truth.server import AnalysisClient, AnalysisServer
+from quantum_truth.store import ResultStore
+
+def run(coro):
+    return asyncio.run(coro)
+
+class TestAnalysisServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def server(self, **options):
+        return AnalysisServer(port=0, workers=1, pages=10, cycles=3, output_dir=self.tmp.name, **options)
+
+    def test_analyze_matches_local(self):
+        async def scenario():
+            async with self.server(seed=7) as server:
+                async with AnalysisClient(server.url) as client:
+                    health = await client.health()
+                    result = await client.analyze("The Earth is flat")
+            return health, result
+        health, result = run(scenario())
+        self.assertEqual(health["status"], "ok")
+
+        analyzer = TruthAnalyzer(pages=10, cycles=3, seed=7, render="none")
+        analyzer.output_dir = self.tmp.name
+        with patch("builtins.print"):
+            expected = analyzer.analyze("The Earth is flat", verbose=False)
+        self.assertAlmostEqual(result["truth_percentage_avg"], expected)
+        self.assertEqual(result["verdict"], analyzer._determine_verdict(expected))
+
+    def test_results_are_stored(self):
+        async def scenario():
+            async with self.server(seed=3) as server:
+                async with AnalysisClient(server.url) as client:
+                    return await client.analyze("The Earth is flat")
+        result = run(scenario())
+        self.assertNotIn("evidence_stats", result)
+        store = ResultStore(os.path.join(self.tmp.name, "results.db"))
+        self.addCleanup(store.close)
+        self.assertAlmostEqual(store.latest("The Earth is flat")["truth_percentage_avg"],
+                               result["truth_percentage_avg"])
+        self.assertEqual(store.load_stats("The Earth is flat")["total"], 10)
+
+    def test_backpressure(self):
+        async def attempt(url, claim):
+            async with AnalysisClient(url) as client:
+                try:
+                    await client.analyze(claim)
+                    return 200
+                except HTTPError as e:
+                    return e.status
+
+        async def scenario():
+            async with self.server(queue_size=0) as server:
+                statuses = await asyncio.gather(*(attempt(server.url, f"claim {i}") for i in range(3)))
+                return sorted(statuses), server.stats
+        statuses, stats = run(scenario())
+        self.assertEqual(statuses, [200, 503, 503])
+        self.assertEqual(stats["rejected"], 2)
+
+    def test_bad_request_over_unix_socket(self):
+        path = os.path.join(self.tmp.name, "qt.sock")
+        async def scenario():
+            async with self.server(unix_socket=path) as server:
+                async with AnalysisClient(server.url) as client:
+                    with self.assertRaises(HTTPError) as ctx:
+                        await client.analyze("   ")
+            return ctx.exception.status
+        self.assertEqual(run(scenario()), 400)
+        self.assertFalse(os.path.exists(path))
+
+if __name__ == "__main__":
+    unittest.main()
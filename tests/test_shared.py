@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.dedup import deduplicate
+from quantum_truth.engines import SearchEngine
+from quantum_truth.events import NULL_EVENTS
+from quantum_truth.evidence import EvidenceStats
+from quantum_truth.ingest import EvidenceCorpus, write_corpus
+from quantum_truth.shared import SharedEvidence, StatsPool, parallel_stats
+
+CLAIM = "The Earth is flat"
+
+
+def streamed(batch, chunk_rows, dedup=None):
+    stats = EvidenceStats()
+    for start in range(0, len(batch), chunk_rows):
+        chunk = batch[start:start + chunk_rows]
+        stats.update(deduplicate(chunk, dedup) if dedup else chunk)
+    return stats
+
+
+def assertStatsEqual(test, got, want):
+    test.assertEqual(got.analysis(), want.analysis())
+    test.assertEqual(got.source_counts, want.source_counts)
+    test.assertEqual(got.source_support, want.source_support)
+    test.assertEqual(got.type_counts, want.type_counts)
+    test.assertEqual((got.first_support, got.first_verified), (want.first_support, want.first_verified))
+    test.assertAlmostEqual(got.reliability_sum, want.reliability_sum, places=6)
+
+
+class TestShared(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        search = SearchEngine(pages=5000, rng=5)
+        self.evidence = search.synthetic_evidence("Unknown claim", 0, 2000)
+        self.templates = search.search_claim(CLAIM)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write_corpus_round_trip(self):
+        collapsed = deduplicate(self.templates)
+        write_corpus(self.directory, {CLAIM: collapsed, "Other": self.evidence})
+        corpus = EvidenceCorpus(self.directory)
+        self.assertEqual(corpus.evidence(CLAIM).to_records(), collapsed.to_records())
+        self.assertEqual(corpus.evidence(CLAIM).pages, collapsed.pages)
+        self.assertEqual(corpus.evidence("Other").to_records(), self.evidence.to_records())
+
+    def test_shared_evidence_is_removed(self):
+        with SharedEvidence(self.evidence) as shared:
+            self.assertEqual(shared.rows, len(self.evidence))
+            self.assertTrue(os.path.isdir(shared.path))
+        self.assertFalse(os.path.exists(shared.path))
+
+    def test_parallel_stats_match_streaming(self):
+        assertStatsEqual(self, parallel_stats(self.evidence, workers=2, chunk_rows=300),
+                         streamed(self.evidence, 300))
+        assertStatsEqual(self, parallel_stats(self.templates, workers=2, chunk_rows=700, dedup=0.8),
+                         streamed(self.templates, 700, 0.8))
+
+    def test_analyzer_stats_workers(self):
+        write_corpus(self.directory, {CLAIM: self.templates})
+        results = []
+        for stats_workers in (None, 2):
+            analyzer = TruthAnalyzer(pages=4000, cycles=3, seed=2, render="none", store=False, chunk_size=512,
+                                     events=NULL_EVENTS, corpus=self.directory, stats_workers=stats_workers)
+            analyzer.output_dir = self.directory
+            results.extend(analyzer.analyze_many([CLAIM], workers=1))
+            analyzer.close()
+        self.assertEqual(results[0]["evidence_analysis"]["total"], 4000)
+        self.assertEqual(results[0]["evidence_analysis"], results[1]["evidence_analysis"])
+        np.testing.assert_allclose(results[0]["truth_percentage_avg"], results[1]["truth_percentage_avg"])
+
+    def test_analyzer_stats_workers_report_partials(self):
+        write_corpus(self.directory, {CLAIM: self.templates})
+        analyzer = TruthAnalyzer(pages=4000, cycles=3, seed=2, render="none", store=False, chunk_size=1000,
+                                 events=NULL_EVENTS, corpus=self.directory, stats_workers=2)
+        analyzer.output_dir = self.directory
+        partials = []
+        analyzer.on_partial = partials.append
+        list(analyzer.analyze_many([CLAIM], workers=1))
+        analyzer.close()
+        self.assertEqual([partial["pages_processed"] for partial in partials], [1000, 2000, 3000, 4000])
+        self.assertTrue(all(partial["claim"] == CLAIM and partial["verdict"] for partial in partials))
+
+    def test_pool_reused_across_claims(self):
+        write_corpus(self.directory, {CLAIM: self.templates, "Other": self.evidence})
+        with StatsPool(2) as pool:
+            first = pool.reduce(self.directory, CLAIM, 5000, 1000)
+            second = pool.reduce(self.directory, "Other", 2000, 1000)
+        assertStatsEqual(self, first, streamed(self.templates, 1000))
+        assertStatsEqual(self, second, streamed(self.evidence, 1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
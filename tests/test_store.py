@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from unittest.mock import patch
+from quantum_truth.analyzer import TruthAnalyzer
+from quantum_truth.store import ResultStore
+
+def result(claim, verdict="UNLIKELY", truth=0.2):
+    return {"claim": claim, "framework": "Scientific_Empirical", "verdict": verdict,
+            "truth_percentage_avg": truth, "truth_percentage_std": 0.01, "pages": 10, "cycles": 3,
+            "cycles_used": 3, "execution_time": 0.1, "timestamp": "2024-01-01T00:00:00",
+            "evidence_analysis": {"total": 10, "scientific": 4, "reliable": 5, "unreliable": 2,
+                                  "historical": 3, "conspiracy": 1, "support": 3, "oppose": 7}}
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "results.db")
+
+    def test_batched_append_and_query(self):
+        store = ResultStore(self.path, batch_size=2)
+        store.append(result("The Earth is flat, part one"), [0.1, 0.2, 0.3])
+        store.append(result("The Earth is flat, part two", "LIKELY TRUE", 0.7))
+        store.append(result("Third claim"))
+        # Two rows committed by the full batch, the third still buffered
+        reader = ResultStore(self.path)
+        self.assertEqual(len(reader.query()), 2)
+        reader.close()
+        store.close()
+
+        store = ResultStore(self.path)
+        self.assertEqual(len(store), 3)
+        first = store.latest("the earth is flat part one")
+        self.assertEqual(first["evidence_analysis"]["oppose"], 7)
+        np.testing.assert_allclose(store.series(first["id"]), [0.1, 0.2, 0.3], rtol=1e-6)
+        self.assertIsNone(store.series(store.latest("Third claim")["id"]))
+        self.assertEqual([r["claim"] for r in store.query(verdict="LIKELY TRUE")], ["The Earth is flat, part two"])
+        self.assertEqual(len(store.query(limit=1)), 1)
+        store.close()
+
+    def test_export(self):
+        store = ResultStore(self.path)
+        store.append(result("A"))
+        store.append(result("B"))
+        jsonl = os.path.join(self.tmp.name, "out.jsonl")
+        self.assertEqual(store.export(jsonl), 2)
+        with open(jsonl) as f:
+            self.assertEqual([json.loads(line)["claim"] for line in f], ["B", "A"])
+        csv_path = os.path.join(self.tmp.name, "out.csv")
+        store.export(csv_path, claim="A")
+        with open(csv_path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual((rows[0]["claim"], rows[0]["evidence_total"]), ("A", "10"))
+        with self.assertRaises(ValueError):
+            store.export(os.path.join(self.tmp.name, "out.xml"))
+        store.close()
+
+    def test_evidence_stats(self):
+        store = ResultStore(self.path)
+        self.assertIsNone(store.load_stats("A"))
+        store.save_stats("A", {"total": 3})
+        store.save_stats("A claim", {"total": 4})
+        store.save_stats("A", {"total": 5}, "2024-01-01T00:00:00")
+        self.assertEqual(store.load_stats("a"), {"total": 5})
+        self.assertEqual(store.load_stats("A claim"), {"total": 4})
+        store.close()
+
+    def test_analyzer_writes_store(self):
+        analyzer = TruthAnalyzer(pages=10, cycles=4, seed=2, render="none")
+        analyzer.output_dir = self.tmp.name
+        with patch("builtins.print"):
+            analyzer.analyze("The Earth is flat", verbose=False)
+            results = list(analyzer.analyze_many(["A claim", "A claim!"], workers=1))
+        analyzer.close()
+        self.assertNotIn("truth_series", results[0])
+        store = ResultStore(os.path.join(self.tmp.name, "results.db"))
+        self.assertEqual(len(store), 3)
+        self.assertEqual(len(store.series(store.latest("The Earth is flat")["id"])), 4)
+        store.close()
+
+if __name__ == "__main__":
+    unittest.main()